@@ -40,6 +40,14 @@ def create_app() -> Flask:
     # Import all models to ensure they're loaded
     import app.models
 
+    # Attach the in-memory indexes, kept in sync with the database
+    from app.indexes import register_indexes
+    register_indexes(flask_app)
+
+    # Register the custom `flask` CLI commands
+    from app.commands import register_commands
+    register_commands(flask_app)
+
     # Register all the routes/endpoints of the application (blueprints)
     from app.routes import register_routes
     register_routes(flask_app)
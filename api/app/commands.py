@@ -0,0 +1,118 @@
+"""
+Custom `flask` CLI commands.
+"""
+
+import click
+from flask import Flask, current_app
+from flask.cli import with_appcontext
+from sqlalchemy.exc import IntegrityError
+
+
+def register_commands(flask_app: Flask) -> None:
+    """
+    Register all the CLI commands with the app.
+
+    Args:
+        flask_app: The Flask application instance
+    """
+    flask_app.cli.add_command(check_blogpost_index)
+    flask_app.cli.add_command(check_user_index)
+    flask_app.cli.add_command(migrate_db)
+    flask_app.cli.add_command(backfill_numeric_bodies)
+
+
+def _check_index(extension: str, name: str, setting: str, rebuild: bool) -> None:
+    """
+    Compare the in-memory index `extension` with the database,
+    and rebuild it if asked to.
+    """
+    index = current_app.extensions.get(extension)
+    if index is None:
+        click.echo(f"The {name} index is disabled ({setting}=false).")
+        return
+
+    report = index.check_consistency()
+    if report["consistent"]:
+        click.echo(f"The {name} index is consistent with the database.")
+        return
+
+    for key in ("missing", "unexpected", "outdated"):
+        click.echo(f"{key}: {report[key]}")
+    if rebuild:
+        index.rebuild()
+        click.echo(f"The {name} index has been rebuilt.")
+
+
+@click.command("check-blogpost-index")
+@click.option(
+    "--rebuild", is_flag=True, help="Rebuild the index if it is not consistent."
+)
+@with_appcontext
+def check_blogpost_index(rebuild: bool) -> None:
+    """
+    Compare the in-memory blogposts index with the database.
+    """
+    _check_index("blogpost_index", "blogposts", "BLOGPOST_INDEX", rebuild)
+
+
+@click.command("check-user-index")
+@click.option(
+    "--rebuild", is_flag=True, help="Rebuild the index if it is not consistent."
+)
+@with_appcontext
+def check_user_index(rebuild: bool) -> None:
+    """
+    Compare the in-memory users index with the database.
+    """
+    _check_index("user_index", "users", "USER_INDEX", rebuild)
+
+
+@click.command("migrate-db")
+@click.option("--dry-run", is_flag=True, help="Only list the pending migrations.")
+@with_appcontext
+def migrate_db(dry_run: bool) -> None:
+    """
+    Apply the pending schema migrations to the database, in place.
+    """
+    # Import inside the function to avoid circular imports
+    from app import db
+    from app.migrations import migrate, pending_migrations
+
+    pending = pending_migrations(db.engine)
+    if not pending:
+        click.echo("The database is up to date.")
+        return
+    if dry_run:
+        for version, name, _ in pending:
+            click.echo(f"pending: {version} {name}")
+        return
+
+    try:
+        applied = migrate(db.engine)
+    except IntegrityError as e:
+        raise click.ClickException(
+            f"Migration failed, fix the duplicate rows first: {e.orig}"
+        )
+    for version, name in applied:
+        click.echo(f"applied: {version} {name}")
+
+
+@click.command("backfill-numeric-bodies")
+@click.option("--all", "recompute", is_flag=True, help="Recompute every blogpost.")
+@click.option("--workers", type=click.IntRange(min=1), help="Number of processes.")
+@click.option("--batch-size", type=click.IntRange(min=1), help="Rows per commit.")
+@with_appcontext
+def backfill_numeric_bodies(
+    recompute: bool, workers: int | None, batch_size: int | None
+) -> None:
+    """
+    Store the numeric value of the blogposts bodies missing it,
+    e.g. the blogposts written before the `numeric_body` column existed.
+    """
+    # Import inside the function to avoid circular imports
+    from app import numerics
+
+    updated = numerics.backfill_numeric_bodies(
+        recompute=recompute, workers=workers, batch_size=batch_size
+    )
+    click.echo(f"{updated} blogposts updated.")
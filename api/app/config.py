@@ -27,3 +27,48 @@ class Config:
         SQLALCHEMY_DATABASE_URI = DB_PATH
         
     SQLALCHEMY_TRACK_MODIFICATIONS: bool = False
+
+    # Keep a per-worker in-memory index of the blogposts,
+    # set BLOGPOST_INDEX=false to query the database on each request instead
+    BLOGPOST_INDEX: bool = os.getenv("BLOGPOST_INDEX", "true").lower() == "true"
+
+    # Keep a per-worker Inverted Index of the blogposts for the full-text search,
+    # set BLOGPOST_SEARCH_INDEX=false to query the database on each search instead
+    BLOGPOST_SEARCH_INDEX: bool = (
+        os.getenv("BLOGPOST_SEARCH_INDEX", "true").lower() == "true"
+    )
+
+    # Keep a per-worker in-memory index of the users,
+    # set USER_INDEX=false to query the database on each request instead
+    USER_INDEX: bool = os.getenv("USER_INDEX", "true").lower() == "true"
+
+    # Keep a per-worker Trie of the usernames and emails for the prefix search,
+    # set USER_SEARCH_INDEX=false to query the database on each search instead
+    USER_SEARCH_INDEX: bool = os.getenv("USER_SEARCH_INDEX", "true").lower() == "true"
+
+    # Data structure of the users index, "linked_hash_map" for O(1) lookups
+    # by ID or "skip_list" for O(log n) positional access in paginated reads
+    USER_INDEX_BACKEND: str = os.getenv("USER_INDEX_BACKEND", "linked_hash_map")
+
+    # Seconds during which a worker uses its indexes without reading the
+    # versions of the tables changed by the other workers, 0 to read them
+    # on each request
+    INDEX_VERSION_TTL: float = float(os.getenv("INDEX_VERSION_TTL", "1"))
+
+    # Default number of items of a paginated response
+    PAGE_SIZE: int = int(os.getenv("PAGE_SIZE", "100"))
+
+    # Number of rows fetched at a time by the streamed responses
+    YIELD_PER: int = int(os.getenv("YIELD_PER", "1000"))
+
+    # Keep a per-worker Bloom filter of the usernames and emails, so that
+    # most signups skip the duplicate query, set USER_BLOOM_FILTER=false
+    # to query the database on each signup instead
+    USER_BLOOM_FILTER: bool = os.getenv("USER_BLOOM_FILTER", "true").lower() == "true"
+    USER_BLOOM_FILTER_ERROR_RATE: float = float(
+        os.getenv("USER_BLOOM_FILTER_ERROR_RATE", "0.01")
+    )
+
+    # Number of processes computing the numeric bodies in
+    # `flask backfill-numeric-bodies`, 1 to compute them in the command itself
+    NUMERICS_WORKERS: int = int(os.getenv("NUMERICS_WORKERS", "1"))
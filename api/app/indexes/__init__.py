@@ -0,0 +1,49 @@
+"""
+In-memory indexes kept by each worker process, built on first use
+(the Bloom filter of the users is loaded at startup)
+and maintained incrementally from the SQLAlchemy session events.
+"""
+
+from flask import Flask
+
+
+def register_indexes(flask_app: Flask) -> None:
+    """
+    Attach the enabled indexes to the app, in `flask_app.extensions`.
+
+    Args:
+        flask_app: The Flask application instance
+    """
+    # Import indexes inside the function to avoid circular imports
+    from app.indexes.blogpost import BlogPostIndex
+    from app.indexes.blogpost_search import BlogPostSearchIndex
+    from app.indexes.events import TrackedIndex, track_versions
+    from app.indexes.user import SkipListUserIndex, UserIndex
+    from app.indexes.user_filter import UserBloomFilter
+    from app.indexes.user_search import UserSearchIndex
+
+    if flask_app.config["BLOGPOST_INDEX"]:
+        flask_app.extensions["blogpost_index"] = BlogPostIndex()
+    if flask_app.config["BLOGPOST_SEARCH_INDEX"]:
+        flask_app.extensions["blogpost_search_index"] = BlogPostSearchIndex()
+    if flask_app.config["USER_INDEX"]:
+        backend = flask_app.config["USER_INDEX_BACKEND"]
+        if backend == "linked_hash_map":
+            flask_app.extensions["user_index"] = UserIndex()
+        elif backend == "skip_list":
+            flask_app.extensions["user_index"] = SkipListUserIndex()
+        else:
+            raise ValueError(f"Unknown USER_INDEX_BACKEND: {backend}")
+    if flask_app.config["USER_SEARCH_INDEX"]:
+        flask_app.extensions["user_search_index"] = UserSearchIndex()
+
+    # the versions of the tables are only needed by the indexes reading them
+    if any(isinstance(index, TrackedIndex) for index in flask_app.extensions.values()):
+        track_versions(flask_app)
+
+    if flask_app.config["USER_BLOOM_FILTER"]:
+        user_filter = UserBloomFilter(flask_app.config["USER_BLOOM_FILTER_ERROR_RATE"])
+        flask_app.extensions["user_bloom_filter"] = user_filter
+        # bulk-loaded now, so that the first signups are already filtered
+        with flask_app.app_context():
+            user_filter.load()
@@ -0,0 +1,254 @@
+"""
+Per-worker index of the blogposts, ordered by ID, with a secondary
+index ordered by date.
+
+The indexes are AVL Trees built once from the database on first use, then
+updated from the ORM events: the changes flushed in a session are recorded,
+applied when the session commits and dropped when it rolls back.
+
+The writes of the other worker processes are seen through the version of
+the table (see `app.indexes.events`), read at most once every
+`INDEX_VERSION_TTL` seconds, which triggers a rebuild. Bulk
+`query.delete()`/`update()` are not seen, `check_consistency()` and
+`rebuild()` cover that case.
+"""
+
+from datetime import datetime
+from itertools import islice
+
+from flask import has_app_context
+
+from app import db
+from app.indexes.events import TrackedIndex, track_changes
+from app.models.blogpost import BlogPost
+from dsa.binary_search_tree import AVLTree
+
+
+def blogpost_to_dict(post: BlogPost) -> dict:
+    """
+    Representation of a blogpost stored in the index.
+    """
+    return {
+        "id": post.id,
+        "title": post.title,
+        "body": post.body,
+        "user_id": post.user_id,
+    }
+
+
+def dated_blogpost(post: dict, date: datetime) -> dict:
+    """
+    Entry of the date index, a blogpost with its date.
+    """
+    return {**post, "date": date}
+
+
+def post_date(post: dict) -> datetime:
+    """
+    Key of an entry of the date index, its date. The tree orders
+    the blogposts published at the same date by ID.
+    """
+    return post["date"]
+
+
+def build_blogpost_tree() -> AVLTree:
+    """
+    Build a balanced tree of all the blogposts in O(n),
+    from a query sorted by ID.
+    """
+    blogposts = BlogPost.query.order_by(BlogPost.id).all()
+    return AVLTree.from_sorted(blogpost_to_dict(post) for post in blogposts)
+
+
+def build_blogpost_date_tree() -> AVLTree:
+    """
+    Build a balanced tree of the dated blogposts in O(n),
+    from a query sorted by date then ID. Blogposts without date
+    cannot be ordered and are left out.
+    """
+    blogposts = (
+        BlogPost.query.filter(BlogPost.date.isnot(None))
+        .order_by(BlogPost.date, BlogPost.id)
+        .all()
+    )
+    return AVLTree.from_sorted(
+        (dated_blogpost(blogpost_to_dict(post), post.date) for post in blogposts),
+        key=post_date,
+    )
+
+
+def date_range(
+    date_tree: AVLTree,
+    since: datetime = None,
+    until: datetime = None,
+    latest: int = None,
+) -> list[dict]:
+    """
+    Get the dated blogposts published between `since` and `until`
+    (both included) in chronological order, or only the `latest` ones,
+    newest first.
+    Runtime: O(log n + k)
+    """
+    if latest is None:
+        return list(date_tree.in_order(since, until))
+    return list(islice(date_tree.in_order(since, until, reverse=True), latest))
+
+
+class BlogPostIndex(TrackedIndex):
+    """
+    Modelisation of the in-memory blogposts index.
+    """
+
+    table = BlogPost.__tablename__
+
+    def __init__(self) -> None:
+        """
+        Initialization.
+        The trees are built on first use, within an app context.
+        `dates` maps each indexed ID to its date, to find the entry
+        of the date index to remove on update or delete.
+        """
+        super().__init__()
+        self.tree = None
+        self.date_tree = None
+        self.dates: dict[int, datetime] = {}
+
+    def _get_tree(self) -> AVLTree:
+        """
+        Private method returning the tree, building the trees if needed,
+        or if another process changed the blogposts.
+        """
+        if self.tree is None or self.is_stale():
+            self.rebuild()
+        return self.tree
+
+    def rebuild(self) -> None:
+        """
+        Drop the trees and build them again from the database.
+        Runtime: O(n log n), the date index is sorted in Python
+        """
+        with self.lock:
+            self.read_version()
+            blogposts = BlogPost.query.order_by(BlogPost.id).all()
+            posts = [blogpost_to_dict(post) for post in blogposts]
+            self.dates = {
+                post.id: post.date for post in blogposts if post.date is not None
+            }
+            entries = sorted(
+                (
+                    dated_blogpost(post, blogpost.date)
+                    for blogpost, post in zip(blogposts, posts)
+                    if blogpost.date is not None
+                ),
+                key=lambda entry: (entry["date"], entry["id"]),
+            )
+            self.tree = AVLTree.from_sorted(posts)
+            self.date_tree = AVLTree.from_sorted(entries, key=post_date)
+
+    def search(self, blogpost_id: str) -> dict | bool:
+        """
+        Search for blogpost by its ID in the index. A blogpost missing
+        from the index is looked up by primary key, and added to the index
+        if the database has it.
+        Runtime: O(log n)
+        """
+        with self.lock:
+            post = self._get_tree().search(blogpost_id)
+            if post or not has_app_context():
+                return post
+
+            blogpost = db.session.get(BlogPost, int(blogpost_id))
+            if blogpost is None:
+                return False
+            self.apply([("upsert", (blogpost_to_dict(blogpost), blogpost.date))])
+            return self.tree.search(blogpost_id)
+
+    def in_order(self, lo: int = None, hi: int = None) -> list[dict]:
+        """
+        Get the blogposts whose ID is between `lo` and `hi` (both included).
+        Runtime: O(log n + k)
+        """
+        with self.lock:
+            return list(self._get_tree().in_order(lo, hi))
+
+    def by_date(
+        self, since: datetime = None, until: datetime = None, latest: int = None
+    ) -> list[dict]:
+        """
+        Get the dated blogposts published between `since` and
+        `until`, or the `latest` ones, see `date_range()`.
+        Runtime: O(log n + k)
+        """
+        with self.lock:
+            self._get_tree()
+            return date_range(self.date_tree, since, until, latest)
+
+    def apply(self, changes: list[tuple[str, tuple[dict, datetime]]]) -> None:
+        """
+        Apply committed ("upsert" | "delete", (blogpost, date)) changes.
+        Nothing to do while the trees are not built, they will be built
+        from the up-to-date database.
+        Runtime: O(k log n)
+        """
+        with self.lock:
+            if self.tree is None:
+                return
+            for operation, (post, date) in changes:
+                self.tree.delete(post["id"])
+                previous_date = self.dates.pop(post["id"], None)
+                if previous_date is not None:
+                    self.date_tree.delete(previous_date, post["id"])
+
+                if operation == "upsert":
+                    self.tree.insert(post)
+                    if date is not None:
+                        self.dates[post["id"]] = date
+                        self.date_tree.insert(dated_blogpost(post, date))
+
+    def check_consistency(self) -> dict:
+        """
+        Compare the index with the database.
+        Return the IDs missing from the index, the IDs the database does
+        not have anymore, and the IDs whose content or date differs.
+        Runtime: O(n)
+        """
+        expected = {
+            post.id: (blogpost_to_dict(post), post.date)
+            for post in BlogPost.query.order_by(BlogPost.id)
+        }
+        with self.lock:
+            self._get_tree()
+            indexed = {
+                post["id"]: (post, self.dates.get(post["id"]))
+                for post in self.tree.in_order()
+            }
+            # entries of the date index that do not match `dates`
+            drifted = {
+                blogpost_id
+                for _, blogpost_id in {
+                    (entry["date"], entry["id"]) for entry in self.date_tree
+                }
+                ^ {(date, blogpost_id) for blogpost_id, date in self.dates.items()}
+            }
+
+        missing = sorted(expected.keys() - indexed.keys())
+        unexpected = sorted(indexed.keys() - expected.keys())
+        outdated = sorted(
+            blogpost_id
+            for blogpost_id in expected.keys() & indexed.keys()
+            if expected[blogpost_id] != indexed[blogpost_id] or blogpost_id in drifted
+        )
+        return {
+            "consistent": not (missing or unexpected or outdated),
+            "missing": missing,
+            "unexpected": unexpected,
+            "outdated": outdated,
+        }
+
+
+# keep the index of each app in sync with the committed blogposts
+track_changes(
+    BlogPost,
+    "blogpost_index",
+    lambda post: (blogpost_to_dict(post), post.date),
+)
@@ -0,0 +1,95 @@
+"""
+Per-worker full-text index of the blogposts titles and bodies.
+
+The index is an Inverted Index built once from the database on first use,
+then updated from the ORM events (see `app.indexes.events`), so a search
+intersects the posting lists of its terms instead of scanning every body.
+It is rebuilt when another process changed the blogposts, which is checked
+at most once every `INDEX_VERSION_TTL` seconds.
+"""
+
+from flask import current_app
+
+from app import db
+from app.indexes.blogpost import blogpost_to_dict
+from app.indexes.events import TrackedIndex, track_changes
+from app.models.blogpost import BlogPost
+from dsa.inverted_index import InvertedIndex
+
+
+def searchable_text(post: dict) -> str:
+    """
+    Text of a blogpost indexed for the search, its title and its body.
+    """
+    return f"{post['title'] or ''} {post['body'] or ''}"
+
+
+def build_blogpost_search_index() -> InvertedIndex:
+    """
+    Build the Inverted Index of all the blogposts, reading only the
+    indexed columns in batches, by ascending ID.
+    """
+    index = InvertedIndex()
+    rows = db.session.execute(
+        db.select(BlogPost.id, BlogPost.title, BlogPost.body)
+        .order_by(BlogPost.id)
+        .execution_options(yield_per=current_app.config["YIELD_PER"])
+    )
+    for post_id, title, body in rows:
+        index.add(post_id, searchable_text({"title": title, "body": body}))
+    return index
+
+
+class BlogPostSearchIndex(TrackedIndex):
+    """
+    Modelisation of the in-memory full-text index of the blogposts.
+    """
+
+    table = BlogPost.__tablename__
+
+    def __init__(self) -> None:
+        """
+        Initialization.
+        The Inverted Index is built on first use, within an app context.
+        """
+        super().__init__()
+        self.index = None
+
+    def rebuild(self) -> None:
+        """
+        Drop the Inverted Index and build it again from the database.
+        Runtime: O(n * t)
+        """
+        with self.lock:
+            self.read_version()
+            self.index = build_blogpost_search_index()
+
+    def search(self, query: str) -> list[int]:
+        """
+        Get the IDs of the blogposts containing every term of the query,
+        in ascending order.
+        Runtime: O(m log(n / m)) per term
+        """
+        with self.lock:
+            if self.index is None or self.is_stale():
+                self.rebuild()
+            return self.index.search(query)
+
+    def apply(self, changes: list[tuple[str, dict]]) -> None:
+        """
+        Apply committed ("upsert" | "delete", blogpost) changes.
+        Nothing to do while the Inverted Index is not built.
+        Runtime: O(k * t)
+        """
+        with self.lock:
+            if self.index is None:
+                return
+            for operation, post in changes:
+                if operation == "delete":
+                    self.index.remove(post["id"])
+                else:
+                    self.index.add(post["id"], searchable_text(post))
+
+
+# keep the index of each app in sync with the committed blogposts
+track_changes(BlogPost, "blogpost_search_index", blogpost_to_dict)
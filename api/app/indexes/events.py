@@ -0,0 +1,205 @@
+"""
+Keep the in-memory indexes in sync with the ORM session events.
+
+The commits of this worker are applied to its indexes directly. The
+commits of the other worker processes cannot be, each commit changing
+an indexed table increments the version of the table in the
+`index_versions` table instead, and an index whose version is behind
+the database is rebuilt on its next use. The version is read at most
+once every `INDEX_VERSION_TTL` seconds, the other reads of the index
+need no database round-trip.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+
+from flask import Flask, current_app, g, has_app_context
+from sqlalchemy import event, insert, update
+from sqlalchemy.orm import Session, object_session
+
+from app import db
+from app.models.index_version import IndexVersion
+
+# keys of `session.info`: the tables changed by the current flush,
+# and the (before, after) versions of the tables changed by the transaction
+CHANGED_TABLES = "index_changed_tables"
+TABLE_VERSIONS = "index_table_versions"
+
+
+def table_version(table: str) -> int:
+    """
+    Get the version of a table, read from the database once per app
+    context (once per request), 0 if the table was never changed.
+    """
+    versions = g.setdefault("table_versions", {})
+    if table not in versions:
+        query = db.select(IndexVersion.version).where(IndexVersion.table_name == table)
+        versions[table] = db.session.execute(query).scalar() or 0
+    return versions[table]
+
+
+class TrackedIndex:
+    """
+    Modelisation of an in-memory index of the rows of `table`.
+    Subclasses rebuild the index when `is_stale()` is True, and record the
+    version of the table they are built from in `version`.
+    """
+
+    # name of the indexed table
+    table: str = ""
+
+    def __init__(self) -> None:
+        """
+        Initialization.
+        `version` is None while the index is not built.
+        """
+        self.version = None
+        # `time.monotonic()` of the last read of the version
+        self.checked_at = None
+        self.lock = threading.RLock()
+
+    def read_version(self) -> None:
+        """
+        Record the version of the table, read before the rows of a rebuild,
+        so that a commit in between only causes another rebuild.
+        """
+        self.version = table_version(self.table)
+        self.checked_at = time.monotonic()
+
+    def is_stale(self) -> bool:
+        """
+        Check if another process committed changes to the table since
+        the index was built. The version is read from the database at most
+        once every `INDEX_VERSION_TTL` seconds, the index is used as is in
+        between, and without app context, as the database cannot be read.
+        """
+        if not has_app_context():
+            return False
+        now = time.monotonic()
+        ttl = current_app.config["INDEX_VERSION_TTL"]
+        if self.checked_at is not None and now - self.checked_at < ttl:
+            return False
+        self.checked_at = now
+        return self.version != table_version(self.table)
+
+    def advance(self, before: int, after: int) -> None:
+        """
+        Record that a commit of this worker, already applied, moved the
+        table from the version `before` to `after`. If the index was not
+        at `before`, another process committed in between, and the index
+        stays behind, to be rebuilt on its next use.
+        """
+        if self.version == before:
+            self.version = after
+
+
+def bump_versions(session: Session, flush_context) -> None:
+    """
+    Increment the version of the tables changed by a flush, within its
+    transaction, so that the versions are only committed with the rows.
+    """
+    tables = session.info.pop(CHANGED_TABLES, None)
+    if not tables:
+        return
+
+    connection = session.connection()
+    versions = session.info.setdefault(TABLE_VERSIONS, {})
+    for table in sorted(tables):
+        version = connection.execute(
+            update(IndexVersion)
+            .where(IndexVersion.table_name == table)
+            .values(version=IndexVersion.version + 1)
+            .returning(IndexVersion.version)
+        ).scalar()
+        if version is None:
+            version = 1
+            connection.execute(
+                insert(IndexVersion).values(table_name=table, version=version)
+            )
+        # a transaction may flush several times, keep the version it started from
+        before = versions[table][0] if table in versions else version - 1
+        versions[table] = (before, version)
+
+
+def forget_versions(session: Session, transaction) -> None:
+    """
+    Drop the versions recorded by a transaction once it ends.
+    """
+    if transaction.parent is None:
+        session.info.pop(TABLE_VERSIONS, None)
+        session.info.pop(CHANGED_TABLES, None)
+
+
+def track_versions(flask_app: Flask) -> None:
+    """
+    Version the indexed tables on each commit, for the `TrackedIndex`
+    enabled in `flask_app`. The `index_versions` table is created if the
+    database was not migrated yet (see `app.migrations`).
+
+    Args:
+        flask_app: The Flask application instance
+    """
+    with flask_app.app_context():
+        IndexVersion.__table__.create(db.engine, checkfirst=True)
+
+    # the listeners apply to every session, they are only registered once
+    if not event.contains(Session, "after_flush", bump_versions):
+        event.listen(Session, "after_flush", bump_versions)
+        event.listen(Session, "after_transaction_end", forget_versions)
+
+
+def track_changes(model, extension: str, serialize: Callable) -> None:
+    """
+    Record the flushed instances of `model` in their session, as
+    ("upsert" | "delete", serialize(instance)) changes. When the session
+    commits, the changes are applied to `current_app.extensions[extension]`
+    by its `apply()` method, and the index advances to the version of the
+    table committed. When the session rolls back, they are dropped.
+
+    Args:
+        model: The mapped class to track
+        extension: The name of the index in `flask_app.extensions`
+        serialize: The function converting an instance for the index
+    """
+    # key of the changes waiting for the commit, in `session.info`
+    pending_key = f"{extension}_pending"
+    table = model.__tablename__
+
+    def record(operation: str):
+        def listener(mapper, connection, target) -> None:
+            session = object_session(target)
+            if session is not None:
+                session.info.setdefault(pending_key, []).append(
+                    (operation, serialize(target))
+                )
+                session.info.setdefault(CHANGED_TABLES, set()).add(table)
+
+        return listener
+
+    def apply_pending_changes(session: Session) -> None:
+        changes = session.info.pop(pending_key, None)
+        if not changes or not has_app_context():
+            return
+
+        index = current_app.extensions.get(extension)
+        if index is None:
+            return
+        with index.lock:
+            index.apply(changes)
+            # e.g. the Bloom filter of the users has no version, a stale
+            # filter only lets a duplicate reach the unique indexes
+            if isinstance(index, TrackedIndex):
+                before, after = session.info[TABLE_VERSIONS][table]
+                # the version of the table as of this commit, for the request
+                g.setdefault("table_versions", {})[table] = after
+                index.advance(before, after)
+
+    def discard_pending_changes(session: Session, previous_transaction) -> None:
+        session.info.pop(pending_key, None)
+
+    event.listen(model, "after_insert", record("upsert"))
+    event.listen(model, "after_update", record("upsert"))
+    event.listen(model, "after_delete", record("delete"))
+    event.listen(Session, "after_commit", apply_pending_changes)
+    event.listen(Session, "after_soft_rollback", discard_pending_changes)
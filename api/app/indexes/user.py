@@ -0,0 +1,291 @@
+"""
+Per-worker index of the users, in ascending order of ID.
+
+The index is a Linked Hash Map built once from the database on first use,
+then updated from the ORM events (see `app.indexes.events`), so a user is
+found by ID in O(1) without any database round-trip but the version check.
+`SkipListUserIndex` keeps the users in a Skip List instead, trading the
+O(1) lookups for O(log n) positional access, which serves the ordered and
+paginated reads without walking the whole list.
+
+The writes of the other worker processes are seen through the version of
+the table (see `app.indexes.events`), read at most once every
+`INDEX_VERSION_TTL` seconds, which triggers a rebuild. Bulk
+`query.delete()`/`update()` are not seen, `check_consistency()` and
+`rebuild()` cover that case.
+"""
+
+from itertools import islice, takewhile
+
+from flask import has_app_context
+
+from app import db
+from app.indexes.events import TrackedIndex, track_changes
+from app.models.user import User
+from dsa.linked_list import LinkedHashMap
+from dsa.skip_list import SkipList
+
+
+def user_to_dict(user: User) -> dict:
+    """
+    Representation of a user stored in the index.
+    """
+    return {
+        "id": user.id,
+        "username": user.username,
+        "email": user.email,
+        "address": user.address,
+        "phone": user.phone,
+    }
+
+
+def build_user_list() -> LinkedHashMap:
+    """
+    Build a Linked Hash Map of all the users, in ascending order of ID.
+    """
+    users_ll = LinkedHashMap()
+    for user in User.query.order_by(User.id):
+        users_ll.add_to_tail(user_to_dict(user))
+    return users_ll
+
+
+def build_user_skip_list() -> SkipList:
+    """
+    Build a Skip List of all the users, ordered by ID.
+    """
+    users_sl = SkipList()
+    for user in User.query.order_by(User.id):
+        users_sl.insert(user_to_dict(user))
+    return users_sl
+
+
+class UserIndex(TrackedIndex):
+    """
+    Modelisation of the in-memory users index.
+    """
+
+    table = User.__tablename__
+
+    def __init__(self) -> None:
+        """
+        Initialization.
+        The list is built on first use, within an app context.
+        """
+        super().__init__()
+        self.users = None
+
+    def _get_users(self) -> LinkedHashMap:
+        """
+        Private method returning the list, building it if needed,
+        or if another process changed the users.
+        """
+        if self.users is None or self.is_stale():
+            self.rebuild()
+        return self.users
+
+    def _build(self) -> LinkedHashMap:
+        """
+        Private method used to build the list from the database.
+        """
+        return build_user_list()
+
+    def rebuild(self) -> None:
+        """
+        Drop the list and build it again from the database.
+        Runtime: O(n)
+        """
+        with self.lock:
+            self.read_version()
+            self.users = self._build()
+
+    def get_user_by_id(self, user_id: str) -> dict | None:
+        """
+        Get a user by its ID.
+        A user missing from the index is looked up by primary key,
+        and added to the index if the database has it.
+        Runtime: O(1)
+        """
+        with self.lock:
+            user = self._get_user_by_id(user_id)
+            if user is not None or not has_app_context():
+                return user
+
+            user = db.session.get(User, int(user_id))
+            if user is None:
+                return None
+            self.apply([("upsert", user_to_dict(user))])
+            return self._get_user_by_id(user_id)
+
+    def _get_user_by_id(self, user_id: str) -> dict | None:
+        """
+        Private method used to get a user by its ID from the index only.
+        """
+        return self._get_users().get_user_by_id(user_id)
+
+    def page(
+        self,
+        offset: int = 0,
+        limit: int | None = None,
+        reverse: bool = False,
+        after_id: int | None = None,
+        before_id: int | None = None,
+    ) -> list[dict]:
+        """
+        Get at most `limit` users ordered by ID, skipping the first `offset`
+        ones, in descending order of ID if `reverse` is True.
+        `after_id` and `before_id` (both excluded) bound the IDs, so that a
+        page resumes from the last ID of the previous one (keyset pagination).
+        Runtime: O(offset + limit)
+        """
+        with self.lock:
+            cursor = before_id if reverse else after_id
+            users = self._iter_users(cursor, offset, reverse)
+
+            bound = after_id if reverse else before_id
+            if bound is not None:
+                if reverse:
+                    users = takewhile(lambda user: user["id"] > bound, users)
+                else:
+                    users = takewhile(lambda user: user["id"] < bound, users)
+            return list(islice(users, limit))
+
+    def _iter_users(self, cursor: int | None, offset: int, reverse: bool):
+        """
+        Private method used by `page` to generate the users following the
+        `cursor` ID (all of them without cursor), skipping `offset` ones.
+        Runtime: O(1) to reach a cursor still in the list, O(n) otherwise
+        """
+        users = self._get_users()
+        if cursor is None:
+            node = users.tail if reverse else users.head
+        elif cursor in users:
+            node = users.nodes[cursor]
+            node = node.prev if reverse else node.next
+        else:
+            # the user of the cursor has been deleted, walk past its ID
+            node = users.tail if reverse else users.head
+            while node is not None and (
+                node.data["id"] >= cursor if reverse else node.data["id"] <= cursor
+            ):
+                node = node.prev if reverse else node.next
+
+        for _ in range(offset):
+            if node is None:
+                break
+            node = node.prev if reverse else node.next
+
+        while node is not None:
+            yield node.data
+            node = node.prev if reverse else node.next
+
+    def apply(self, changes: list[tuple[str, dict]]) -> None:
+        """
+        Apply committed ("upsert" | "delete", user) changes.
+        Nothing to do while the list is not built, it will be built
+        from the up-to-date database.
+        Runtime: O(k)
+        """
+        with self.lock:
+            if self.users is None:
+                return
+            for operation, user in changes:
+                if operation == "delete":
+                    self.users.remove(user["id"])
+                elif user["id"] in self.users:
+                    self.users.add_to_tail(user)
+                else:
+                    self._insert_in_order(user)
+
+    def _insert_in_order(self, user: dict) -> None:
+        """
+        Private method used to add a new user, keeping the ID order.
+        New users get the greatest ID, so they are added to the tail in O(1).
+        """
+        if self.users.tail is None or self.users.tail.data["id"] < user["id"]:
+            self.users.add_to_tail(user)
+            return
+
+        # a user inserted with an explicit smaller ID, rare enough for O(n)
+        users = self.users.ll_to_list() + [user]
+        self.users = LinkedHashMap()
+        for data in sorted(users, key=lambda data: data["id"]):
+            self.users.add_to_tail(data)
+
+    def check_consistency(self) -> dict:
+        """
+        Compare the index with the database.
+        Return the IDs missing from the index, the IDs the database does
+        not have anymore, and the IDs whose content differs.
+        Runtime: O(n)
+        """
+        expected = {user.id: user_to_dict(user) for user in User.query}
+        with self.lock:
+            indexed = {user["id"]: user for user in self.page()}
+
+        missing = sorted(expected.keys() - indexed.keys())
+        unexpected = sorted(indexed.keys() - expected.keys())
+        outdated = sorted(
+            user_id
+            for user_id in expected.keys() & indexed.keys()
+            if expected[user_id] != indexed[user_id]
+        )
+        return {
+            "consistent": not (missing or unexpected or outdated),
+            "missing": missing,
+            "unexpected": unexpected,
+            "outdated": outdated,
+        }
+
+
+class SkipListUserIndex(UserIndex):
+    """
+    Modelisation of the in-memory users index backed by a Skip List.
+    """
+
+    def _build(self) -> SkipList:
+        """
+        Private method used to build the Skip List from the database.
+        """
+        return build_user_skip_list()
+
+    def _get_user_by_id(self, user_id: str) -> dict | None:
+        """
+        Private method used to get a user by its ID from the index only.
+        Runtime: O(log n) expected
+        """
+        return self._get_users().search(int(user_id))
+
+    def _iter_users(self, cursor: int | None, offset: int, reverse: bool):
+        """
+        Private method used by `page` to generate the users following the
+        `cursor` ID (all of them without cursor), skipping `offset` ones.
+        Runtime: O(log n) expected to reach the cursor and the offset
+        """
+        users = self._get_users()
+        if cursor is None:
+            return users.iter_from_position(offset, reverse)
+        # position of the first user past the cursor, from the end in reverse
+        if reverse:
+            position = len(users) - users.rank(cursor)
+        else:
+            position = users.rank(cursor + 1)
+        return users.iter_from_position(position + offset, reverse)
+
+    def apply(self, changes: list[tuple[str, dict]]) -> None:
+        """
+        Apply committed ("upsert" | "delete", user) changes.
+        Nothing to do while the Skip List is not built.
+        Runtime: O(k log n) expected
+        """
+        with self.lock:
+            if self.users is None:
+                return
+            for operation, user in changes:
+                if operation == "delete":
+                    self.users.delete(user["id"])
+                else:
+                    self.users.insert(user)
+
+
+# keep the index of each app in sync with the committed users
+track_changes(User, "user_index", user_to_dict)
@@ -0,0 +1,119 @@
+"""
+Per-worker Bloom filter of the usernames and emails in use.
+
+`create_user` asks the filter first: a username and an email that are
+definitely not taken skip the duplicate query entirely, only the possible
+duplicates are checked against the unique indexes of the users table.
+
+The filter is bulk-loaded from the users table when the app starts, then
+the usernames and emails committed through the ORM of this worker are
+added from the ORM events (see `app.indexes.events`). A user created by
+another worker may be missing, the unique indexes still reject it on insert.
+A Bloom filter cannot forget a key, so deleted or renamed users stay in it
+as (harmless) false positives until the next rebuild.
+"""
+
+import threading
+
+from sqlalchemy import inspect
+
+from app import db
+from app.indexes.events import track_changes
+from app.models.user import User
+from dsa.bloom_filter import BloomFilter
+
+# the filter is sized for twice the users it is loaded with,
+# and at least for this number of users
+MIN_CAPACITY = 1024
+
+
+def filter_keys(user: dict) -> tuple[str, str]:
+    """
+    Keys of a user in the filter, one namespace for each column.
+    """
+    return f"username:{user['username']}", f"email:{user['email']}"
+
+
+def user_to_filter(user: User) -> dict:
+    """
+    Representation of a user passed to the filter.
+    """
+    return {"username": user.username, "email": user.email}
+
+
+def build_user_filter(error_rate: float) -> BloomFilter:
+    """
+    Build a Bloom filter of the usernames and emails of all the users,
+    reading only these two columns.
+    """
+    rows = db.session.execute(db.select(User.username, User.email)).all()
+    user_filter = BloomFilter(max(4 * len(rows), 2 * MIN_CAPACITY), error_rate)
+    for username, email in rows:
+        user_filter.update(filter_keys({"username": username, "email": email}))
+    return user_filter
+
+
+class UserBloomFilter:
+    """
+    Modelisation of the in-memory filter of the usernames and emails.
+    """
+
+    def __init__(self, error_rate: float = 0.01) -> None:
+        """
+        Initialization.
+        The filter is built by `load()`, or on first use.
+        """
+        self.error_rate = error_rate
+        self.filter = None
+        self.lock = threading.RLock()
+
+    def load(self) -> None:
+        """
+        Bulk-load the filter, if the users table already exists.
+        Runtime: O(n)
+        """
+        if inspect(db.engine).has_table(User.__tablename__):
+            self.rebuild()
+
+    def rebuild(self) -> None:
+        """
+        Drop the filter and build it again from the database.
+        Runtime: O(n)
+        """
+        with self.lock:
+            self.filter = build_user_filter(self.error_rate)
+
+    def might_exist(self, username: str, email: str) -> bool:
+        """
+        Check if the username or the email is possibly taken.
+        False means that both are definitely free.
+        Runtime: O(k)
+        """
+        with self.lock:
+            if self.filter is None:
+                self.filter = build_user_filter(self.error_rate)
+            username_key, email_key = filter_keys(
+                {"username": username, "email": email}
+            )
+            return username_key in self.filter or email_key in self.filter
+
+    def apply(self, changes: list[tuple[str, dict]]) -> None:
+        """
+        Add the usernames and emails of committed ("upsert" | "delete", user)
+        changes. Deletions are ignored, a Bloom filter cannot remove a key.
+        Once the filter holds more keys than it was sized for, it is dropped
+        and built again on next use, to keep its false positive rate.
+        Runtime: O(k)
+        """
+        with self.lock:
+            if self.filter is None:
+                return
+            for operation, user in changes:
+                if operation == "upsert":
+                    self.filter.update(filter_keys(user))
+            if len(self.filter) > self.filter.capacity:
+                self.filter = None
+
+
+# keep the filter of each app in sync with the committed users
+track_changes(User, "user_bloom_filter", user_to_filter)
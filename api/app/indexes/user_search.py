@@ -0,0 +1,128 @@
+"""
+Per-worker index of the usernames and emails, for the prefix search.
+
+The index is a Trie of the lowercased usernames and emails, built once
+from the database on first use, then updated from the ORM events
+(see `app.indexes.events`), so the first k users matching a prefix are
+found in O(len(prefix) + k * L) without any database round-trip,
+L being the length of the longest word.
+It is rebuilt when another process changed the users, which is checked
+at most once every `INDEX_VERSION_TTL` seconds.
+"""
+
+from app.indexes.events import TrackedIndex, track_changes
+from app.indexes.user import user_to_dict
+from app.models.user import User
+from dsa.trie import Trie
+
+
+def search_keys(user: dict) -> set[str]:
+    """
+    Words of a user in the Trie, its lowercased username and email.
+    """
+    return {value.lower() for value in (user["username"], user["email"]) if value}
+
+
+class UserSearchIndex(TrackedIndex):
+    """
+    Modelisation of the in-memory prefix search index of the users.
+    Each word of the Trie maps to the users sharing it, by ID.
+    """
+
+    table = User.__tablename__
+
+    def __init__(self) -> None:
+        """
+        Initialization.
+        The Trie is built on first use, within an app context.
+        """
+        super().__init__()
+        self.trie = None
+        # words of each indexed user, to remove them on update or delete
+        self.words: dict[int, set[str]] = {}
+
+    def _get_trie(self) -> Trie:
+        """
+        Private method returning the Trie, building it if needed,
+        or if another process changed the users.
+        """
+        if self.trie is None or self.is_stale():
+            self.rebuild()
+        return self.trie
+
+    def rebuild(self) -> None:
+        """
+        Drop the Trie and build it again from the database.
+        Runtime: O(n * L)
+        """
+        with self.lock:
+            self.read_version()
+            self.trie = Trie()
+            self.words = {}
+            for user in User.query:
+                self._add(user_to_dict(user))
+
+    def _add(self, user: dict) -> None:
+        """
+        Private method used to index the words of a user.
+        """
+        words = search_keys(user)
+        self.words[user["id"]] = words
+        for word in words:
+            users = self.trie.search(word)
+            if users is None:
+                users = {}
+                self.trie.insert(word, users)
+            users[user["id"]] = user
+
+    def _remove(self, user_id: int) -> None:
+        """
+        Private method used to drop the words of a user from the index.
+        """
+        for word in self.words.pop(user_id, ()):
+            users = self.trie.search(word)
+            if users is None:
+                continue
+            users.pop(user_id, None)
+            if not users:
+                self.trie.remove(word)
+
+    def search(self, prefix: str, limit: int | None = None) -> list[dict]:
+        """
+        Get at most `limit` users whose username or email starts with
+        `prefix` (case insensitive), in lexicographic order of their first
+        word matched, then by ID. The Trie is walked lazily, up to the
+        `limit`-th user.
+        Runtime: O(len(prefix) + k * L)
+        """
+        with self.lock:
+            found = []
+            seen = set()
+            for _, users in self._get_trie().starts_with(prefix.lower()):
+                for user_id, user in sorted(users.items()):
+                    # a user may match by both its username and its email
+                    if user_id in seen:
+                        continue
+                    seen.add(user_id)
+                    found.append(user)
+                    if len(found) == limit:
+                        return found
+            return found
+
+    def apply(self, changes: list[tuple[str, dict]]) -> None:
+        """
+        Apply committed ("upsert" | "delete", user) changes.
+        Nothing to do while the Trie is not built.
+        Runtime: O(k * L)
+        """
+        with self.lock:
+            if self.trie is None:
+                return
+            for operation, user in changes:
+                self._remove(user["id"])
+                if operation == "upsert":
+                    self._add(user)
+
+
+# keep the index of each app in sync with the committed users
+track_changes(User, "user_search_index", user_to_dict)
@@ -0,0 +1,133 @@
+"""
+Versioned migrations of the database schema.
+
+`db.create_all()` creates the tables of a new database, with every index
+of the models, but leaves the tables of an existing database untouched.
+The migrations bring an existing database file up to date in place,
+without touching the rows: each one is recorded in the `schema_migrations`
+table once all of its statements succeeded, so that it is only applied once.
+The statements are idempotent, so that a migration that failed midway can
+run again, and so that they also run on a database created by
+`db.create_all()`. A statement SQLite cannot make idempotent, such as
+adding a column, is a function of the connection checking the schema first.
+"""
+
+from collections.abc import Callable
+from datetime import datetime
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection, Engine
+
+# a SQL statement, or a function running its own statements
+Statement = str | Callable[[Connection], None]
+
+
+def add_column(table: str, column: str, definition: str) -> Callable:
+    """
+    Statement adding a column to a table, unless the table already has it.
+    """
+
+    def statement(connection: Connection) -> None:
+        columns = {column["name"] for column in inspect(connection).get_columns(table)}
+        if column not in columns:
+            connection.execute(
+                text(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+            )
+
+    return statement
+
+
+# (version, name, statements), in ascending order of version
+MIGRATIONS: list[tuple[int, str, list[Statement]]] = [
+    (
+        1,
+        "index the blogposts by user and by date",
+        [
+            "CREATE INDEX IF NOT EXISTS ix_blogposts_user_id ON blogposts (user_id)",
+            "CREATE INDEX IF NOT EXISTS ix_blogposts_date ON blogposts (date)",
+        ],
+    ),
+    (
+        2,
+        "unique usernames and emails",
+        [
+            "CREATE UNIQUE INDEX IF NOT EXISTS ix_users_username ON users (username)",
+            "CREATE UNIQUE INDEX IF NOT EXISTS ix_users_email ON users (email)",
+        ],
+    ),
+    (
+        3,
+        "precomputed numeric value of the blogposts bodies",
+        # filled by `flask backfill-numeric-bodies`
+        [add_column("blogposts", "numeric_body", "INTEGER")],
+    ),
+    (
+        4,
+        "versions of the indexed tables",
+        [
+            "CREATE TABLE IF NOT EXISTS index_versions ("
+            "table_name VARCHAR(50) NOT NULL PRIMARY KEY, "
+            "version INTEGER NOT NULL)",
+        ],
+    ),
+]
+
+
+def _ensure_version_table(connection: Connection) -> None:
+    """
+    Create the table recording the applied migrations, if needed.
+    """
+    connection.execute(
+        text(
+            "CREATE TABLE IF NOT EXISTS schema_migrations ("
+            "version INTEGER PRIMARY KEY, "
+            "name VARCHAR(200) NOT NULL, "
+            "applied_at DATETIME NOT NULL)"
+        )
+    )
+
+
+def current_version(engine: Engine) -> int:
+    """
+    Get the version of the last migration applied, 0 if there is none.
+    """
+    with engine.begin() as connection:
+        _ensure_version_table(connection)
+        version = connection.execute(
+            text("SELECT MAX(version) FROM schema_migrations")
+        ).scalar()
+    return version or 0
+
+
+def pending_migrations(engine: Engine) -> list[tuple[int, str, list[Statement]]]:
+    """
+    Get the migrations not applied yet, in the order to apply them.
+    """
+    version = current_version(engine)
+    return [migration for migration in MIGRATIONS if migration[0] > version]
+
+
+def migrate(engine: Engine) -> list[tuple[int, str]]:
+    """
+    Apply the pending migrations and return their (version, name).
+    A migration that fails is not recorded, the previous ones stay applied,
+    and the exception is raised again, e.g. an IntegrityError when
+    a unique index meets duplicate values.
+    """
+    applied = []
+    for version, name, statements in pending_migrations(engine):
+        with engine.begin() as connection:
+            for statement in statements:
+                if callable(statement):
+                    statement(connection)
+                else:
+                    connection.execute(text(statement))
+            connection.execute(
+                text(
+                    "INSERT INTO schema_migrations (version, name, applied_at) "
+                    "VALUES (:version, :name, :applied_at)"
+                ),
+                {"version": version, "name": name, "applied_at": datetime.now()},
+            )
+        applied.append((version, name))
+    return applied
@@ -3,5 +3,6 @@ Import all models to ensure they're loaded when the app starts.
 """
 
 from app.models.blogpost import BlogPost
+from app.models.index_version import IndexVersion
 from app.models.user import User
 
@@ -4,9 +4,10 @@ Modelisation of a blogpost.
 
 from datetime import datetime
 
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, validates
 
 from app import db
+from app.numerics import numeric_body
 
 
 class BlogPost(db.Model):
@@ -19,12 +20,26 @@ class BlogPost(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(50))
     body = db.Column(db.String(500))
-    date = db.Column(db.DateTime, default=datetime.now)
-    user_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False)
+    # sum of the code points of the body, kept in sync by `_set_body`
+    numeric_body = db.Column(db.Integer)
+    date = db.Column(db.DateTime, default=datetime.now, index=True)
+    # indexed, so that the posts of a user are found without a full scan
+    user_id = db.Column(
+        db.Integer, db.ForeignKey("users.id"), nullable=False, index=True
+    )
 
     # Define relationship to User
     user = relationship("User", back_populates="posts")
 
+    @validates("body")
+    def _set_body(self, key: str, body: str | None) -> str | None:
+        """
+        Private method used to compute the numeric value of the body
+        each time the body is set, on creation or on update.
+        """
+        self.numeric_body = numeric_body(body)
+        return body
+
     def __repr__(self) -> str:
         """
         String representation of a blogpost.
@@ -0,0 +1,25 @@
+"""
+Modelisation of the version of a table, for the in-memory indexes.
+"""
+
+from app import db
+
+
+class IndexVersion(db.Model):
+    """
+    IndexVersion class mapping the table "index_versions" in the database.
+    Each commit changing the rows of an indexed table increments its
+    version, so that a worker process finds out that its in-memory
+    indexes miss the writes of the other processes.
+    """
+
+    __tablename__ = "index_versions"
+
+    table_name = db.Column(db.String(50), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        """
+        String representation of a table version.
+        """
+        return f"<IndexVersion {self.table_name} {self.version}>"
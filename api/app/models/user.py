@@ -15,8 +15,9 @@ class User(db.Model):
     __tablename__ = "users"
 
     id = db.Column(db.Integer, primary_key=True)
-    username = db.Column(db.String(50))
-    email = db.Column(db.String(50))
+    # unique indexes, the duplicate checks do not scan the table
+    username = db.Column(db.String(50), unique=True, index=True)
+    email = db.Column(db.String(50), unique=True, index=True)
     address = db.Column(db.String(200))
     phone = db.Column(db.String(50))
     posts = relationship("BlogPost", back_populates="user", cascade="all, delete")
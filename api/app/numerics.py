@@ -0,0 +1,142 @@
+"""
+Numeric value of the blogposts bodies.
+
+The numeric value of a body is the sum of the code points of its characters
+(their ASCII values for an ASCII text). It is computed once, when the body
+is written (see `BlogPost`), and stored in the `numeric_body` column, so
+that `/api/blogposts/numerics` reads it instead of computing it again.
+
+The bodies are summed from their encoded bytes rather than character by
+character: one byte per character for an ASCII body, the 4-byte code
+points of a UTF-32 buffer otherwise. To recompute many bodies at once,
+`compute_numeric_bodies` sums them by chunks, with one vectorized pass
+per chunk when NumPy is installed, and can spread the chunks over
+worker processes.
+"""
+
+import sys
+from collections.abc import Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import nullcontext
+
+from flask import current_app
+
+try:
+    import numpy as np
+except ImportError:  # optional, the chunks are then summed body by body
+    np = None
+
+# number of bodies sent to a worker process at a time
+CHUNK_SIZE = 10_000
+
+# encoding of the code points as native unsigned 32-bit integers
+UTF32 = "utf-32-le" if sys.byteorder == "little" else "utf-32-be"
+
+
+def numeric_body(body: str | None) -> int:
+    """
+    Sum of the code points of the characters of a body, 0 without body.
+    Runtime: O(len(body))
+    """
+    if not body:
+        return 0
+    if body.isascii():
+        return sum(body.encode("ascii"))
+    return sum(memoryview(body.encode(UTF32)).cast("I"))
+
+
+def numeric_bodies(bodies: Sequence[str | None]) -> list[int]:
+    """
+    Numeric values of a chunk of bodies, in order.
+    With NumPy, the chunk is encoded as a single buffer whose segments,
+    one per body, are summed in one vectorized pass.
+    Runtime: O(total length of the bodies)
+    """
+    if np is None or not bodies:
+        return [numeric_body(body) for body in bodies]
+
+    texts = [body or "" for body in bodies]
+    text = "".join(texts)
+    if text.isascii():
+        codes = np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+    else:
+        codes = np.frombuffer(text.encode(UTF32), dtype=np.uint32)
+
+    lengths = np.fromiter(map(len, texts), dtype=np.int64, count=len(texts))
+    starts = np.cumsum(lengths) - lengths
+    values = np.zeros(len(texts), dtype=np.int64)
+    # each segment ends where the next one starts, so only the bodies
+    # holding characters start a segment, the empty ones stay at 0
+    filled = lengths > 0
+    if filled.any():
+        values[filled] = np.add.reduceat(codes, starts[filled], dtype=np.int64)
+    return values.tolist()
+
+
+def compute_numeric_bodies(
+    bodies: Sequence[str | None],
+    executor: Executor | None = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> list[int]:
+    """
+    Numeric values of the bodies, in order.
+    The bodies are split in chunks of `chunk_size`, summed by the processes
+    of `executor` in parallel, or in this process without executor.
+    """
+    chunks = [bodies[i : i + chunk_size] for i in range(0, len(bodies), chunk_size)]
+    if executor is None or len(chunks) < 2:
+        results = map(numeric_bodies, chunks)
+    else:
+        results = executor.map(numeric_bodies, chunks)
+    return [value for values in results for value in values]
+
+
+def backfill_numeric_bodies(
+    recompute: bool = False, workers: int | None = None, batch_size: int | None = None
+) -> int:
+    """
+    Compute and store the numeric value of the blogposts missing it
+    (of every blogpost with `recompute`), and return their number.
+    The blogposts are read by ascending ID, `batch_size` (`YIELD_PER` by
+    default) at a time, each batch being split between `workers` processes
+    (`NUMERICS_WORKERS` by default), and committed on its own, so that an
+    interrupted backfill resumes where it stopped.
+    """
+    workers = workers or current_app.config["NUMERICS_WORKERS"]
+    batch_size = batch_size or current_app.config["YIELD_PER"]
+    # a pool only pays off with several workers, it lives for the whole backfill
+    pool = ProcessPoolExecutor(workers) if workers > 1 else nullcontext()
+    with pool as executor:
+        return _backfill(recompute, executor, batch_size, -(-batch_size // workers))
+
+
+def _backfill(
+    recompute: bool, executor: Executor | None, batch_size: int, chunk_size: int
+) -> int:
+    """
+    Private function used to run the batches of `backfill_numeric_bodies`.
+    """
+    # Import inside the function to avoid circular imports
+    from app import db
+    from app.models.blogpost import BlogPost
+
+    updated = 0
+    last_id = 0
+    while True:
+        query = db.select(BlogPost.id, BlogPost.body).where(BlogPost.id > last_id)
+        if not recompute:
+            query = query.where(BlogPost.numeric_body.is_(None))
+        rows = db.session.execute(query.order_by(BlogPost.id).limit(batch_size)).all()
+        if not rows:
+            return updated
+
+        bodies = [row.body for row in rows]
+        values = compute_numeric_bodies(bodies, executor, chunk_size)
+        # a bulk UPDATE by primary key, without loading the ORM objects
+        db.session.execute(
+            db.update(BlogPost),
+            [{"id": row.id, "numeric_body": value} for row, value in zip(rows, values)],
+        )
+        db.session.commit()
+        updated += len(rows)
+        last_id = rows[-1].id
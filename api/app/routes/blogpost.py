@@ -3,18 +3,28 @@ BlogPost routes/endpoints blueprint.
 """
 
 import os
-import random
 import sys
+from bisect import bisect_right
 from datetime import datetime
+from operator import attrgetter
 
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, current_app, jsonify, request
+from sqlalchemy import or_
 
 from app import db
+from app.indexes.blogpost import (
+    blogpost_to_dict,
+    build_blogpost_date_tree,
+    build_blogpost_tree,
+    date_range,
+)
 from app.models import blogpost
 from app.models.blogpost import BlogPost
 from app.models.user import User
-from dsa import binary_search_tree, queue, stack
+from app.streaming import stream_format, stream_response
+from dsa import heap, queue, stack
 from dsa.hashmap import HashMap
+from dsa.inverted_index import tokenize
 
 # Add the parent directory of the app directory to sys.path
 parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
@@ -25,7 +35,8 @@ sys.path.append(parent_dir)
 blogpost_bp = Blueprint("blogposts", __name__)
 
 
-@blogpost_bp.route("/<user_id>", methods=["POST"])
+# the ID is converted from the URL, the new blogpost is indexed with an int
+@blogpost_bp.route("/<int:user_id>", methods=["POST"])
 def create_blogpost(user_id: int):
     """
     Endpoint to CREATE a new blogpost.
@@ -43,11 +54,14 @@ def create_blogpost(user_id: int):
         return jsonify({"message": "Missing required fields"}), 400
 
     # try:
-    hashmap = HashMap(10)
-    hashmap.add_key_value("title", data["title"])
-    hashmap.add_key_value("body", data["body"])
-    hashmap.add_key_value("date", datetime.now())
-    hashmap.add_key_value("user_id", user_id)
+    hashmap = HashMap.from_items(
+        (
+            ("title", data["title"]),
+            ("body", data["body"]),
+            ("date", datetime.now()),
+            ("user_id", user_id),
+        )
+    )
 
     try:
         new_blogpost = BlogPost(
@@ -64,12 +78,228 @@ def create_blogpost(user_id: int):
         return jsonify({"error": f"Unexpected error: {str(e)}"}), 500
 
 
-# @blogpost_bp.route("/", methods=["GET"])
-# def read_all_blogposts():
-#     """
-#     Endpoint to READ all the blogposts.
-#     """
-#     pass
+@blogpost_bp.route("", methods=["GET"])
+def read_all_blogposts():
+    """
+    Endpoint to READ all the blogposts, in ascending order of ID.
+    Optional `from_id` and `to_id` query parameters (both included)
+    restrict the response to a slice of IDs, found by a range query
+    on the BST in O(log n + k) TC.
+    With `stream=json|ndjson` (see `app.streaming`), the blogposts are
+    read from the database in batches and streamed instead.
+    """
+    try:
+        fmt = stream_format()
+    except ValueError:
+        return jsonify({"message": "stream must be json or ndjson"}), 400
+
+    from_id = request.args.get("from_id")
+    to_id = request.args.get("to_id")
+    try:
+        from_id = int(from_id) if from_id is not None else None
+        to_id = int(to_id) if to_id is not None else None
+    except ValueError:
+        return jsonify({"message": "from_id and to_id must be integers"}), 400
+
+    if fmt is not None:
+        query = BlogPost.query
+        if from_id is not None:
+            query = query.filter(BlogPost.id >= from_id)
+        if to_id is not None:
+            query = query.filter(BlogPost.id <= to_id)
+        posts = query.order_by(BlogPost.id).yield_per(current_app.config["YIELD_PER"])
+        return stream_response(map(blogpost_to_dict, posts), fmt)
+
+    # the per-worker index avoids querying the database,
+    # otherwise the tree is built from the database for this request
+    bst = current_app.extensions.get("blogpost_index") or build_blogpost_tree()
+
+    return jsonify(list(bst.in_order(from_id, to_id))), 200
+
+
+def _parse_date(value: str | None) -> datetime | None:
+    """
+    Parse an ISO date of the query string, None when missing.
+    The dates are stored as naive local times (`datetime.now()`), so a date
+    with a UTC offset is converted to the local time of the server, then
+    compared as a naive date. Raise ValueError if the date is not valid.
+    """
+    if value is None:
+        return None
+    date = datetime.fromisoformat(value)
+    if date.tzinfo is not None:
+        date = date.astimezone().replace(tzinfo=None)
+    return date
+
+
+@blogpost_bp.route("/by_date", methods=["GET"])
+def read_blogposts_by_date():
+    """
+    Endpoint to READ the blogposts published between the `since` and
+    `until` ISO dates (both optional and included), in chronological order.
+    With `latest=N`, only the N newest blogposts of the range are returned,
+    newest first.
+    The secondary index on the date finds them in O(log n + k) TC.
+    """
+    try:
+        since = _parse_date(request.args.get("since"))
+        until = _parse_date(request.args.get("until"))
+    except ValueError:
+        return jsonify({"message": "since and until must be ISO dates"}), 400
+
+    latest = request.args.get("latest")
+    if latest is not None:
+        if not latest.isdigit() or int(latest) == 0:
+            return jsonify({"message": "latest must be a positive integer"}), 400
+        latest = int(latest)
+
+    index = current_app.extensions.get("blogpost_index")
+    if index is not None:
+        entries = index.by_date(since, until, latest)
+    else:
+        entries = date_range(build_blogpost_date_tree(), since, until, latest)
+
+    return (
+        jsonify([{**post, "date": post["date"].isoformat()} for post in entries]),
+        200,
+    )
+
+
+# rankings of `/top`, each computing the key of a blogpost row
+TOP_KEYS = {
+    "date": attrgetter("date"),
+    "length": lambda row: len(row.body or ""),
+}
+
+
+@blogpost_bp.route("/top", methods=["GET"])
+def read_top_blogposts():
+    """
+    Endpoint to READ the top `k` blogposts (10 by default), the latest
+    ones with `by=date` (default), the longest ones with `by=length`.
+    The rows are read from the database in batches and go through a heap
+    of the k best rows seen so far, so the memory used is bounded by k,
+    not by the number of blogposts.
+    """
+    max_k = current_app.config["PAGE_SIZE"]
+    k = request.args.get("k", "10")
+    if not k.isdigit() or not 0 < int(k) <= max_k:
+        return jsonify({"message": f"k must be an integer between 1 and {max_k}"}), 400
+    k = int(k)
+
+    by = request.args.get("by", "date")
+    if by not in TOP_KEYS:
+        return jsonify({"message": f"by must be one of {', '.join(TOP_KEYS)}"}), 400
+
+    query = db.select(
+        BlogPost.id, BlogPost.title, BlogPost.body, BlogPost.date, BlogPost.user_id
+    )
+    if by == "date":
+        # blogposts without date cannot be ranked
+        query = query.where(BlogPost.date.isnot(None))
+    rows = db.session.execute(
+        query.order_by(BlogPost.id).execution_options(
+            yield_per=current_app.config["YIELD_PER"]
+        )
+    )
+
+    top = heap.nlargest(k, rows, key=TOP_KEYS[by])
+    return (
+        jsonify(
+            [
+                {**row._asdict(), "date": row.date.isoformat() if row.date else None}
+                for row in top
+            ]
+        ),
+        200,
+    )
+
+
+@blogpost_bp.route("/search", methods=["GET"])
+def search_blogposts():
+    """
+    Endpoint to READ the blogposts whose title or body contains every
+    term of the `q` query parameter (case insensitive), by ascending ID.
+    The per-worker Inverted Index intersects the posting lists of the
+    terms, instead of scanning every body with `LIKE '%term%'`.
+    With `limit` or `after_id`, the response is a page
+    `{"blogposts": [...], "next_cursor": ID | null}` of at most `limit`
+    posts (PAGE_SIZE by default), the next one requested with
+    `after_id=<next_cursor>`.
+    """
+    query = request.args.get("q")
+    terms = tokenize(query)
+    if not terms:
+        return jsonify({"message": "q must contain at least one term"}), 400
+
+    limit = request.args.get("limit")
+    after_id = request.args.get("after_id")
+    if not all(value is None or value.isdigit() for value in (limit, after_id)):
+        return (
+            jsonify({"message": "limit and after_id must be positive integers"}),
+            400,
+        )
+    paginated = limit is not None or after_id is not None
+    limit = int(limit) if limit is not None else current_app.config["PAGE_SIZE"]
+    after_id = int(after_id) if after_id is not None else None
+    if limit == 0:
+        return jsonify({"message": "limit must be a positive integer"}), 400
+
+    index = current_app.extensions.get("blogpost_search_index")
+    if index is not None:
+        ids = index.search(query)
+    else:
+        ids = _search_blogposts_in_database(terms)
+
+    if after_id is not None:
+        ids = ids[bisect_right(ids, after_id) :]
+    if not paginated:
+        return jsonify(_blogposts_by_ids(ids)), 200
+
+    next_cursor = ids[limit - 1] if len(ids) > limit else None
+    blogposts = _blogposts_by_ids(ids[:limit])
+    return jsonify({"blogposts": blogposts, "next_cursor": next_cursor}), 200
+
+
+def _search_blogposts_in_database(terms: list[str]) -> list[int]:
+    """
+    Get the IDs of the blogposts containing every term, when the index is
+    disabled. `LIKE` only narrows the rows down, a term may match inside
+    a longer word, so the matches are checked again with the tokenizer.
+    """
+    query = db.select(BlogPost.id, BlogPost.title, BlogPost.body)
+    for term in set(terms):
+        query = query.where(
+            or_(
+                BlogPost.title.contains(term, autoescape=True),
+                BlogPost.body.contains(term, autoescape=True),
+            )
+        )
+
+    ids = []
+    for post_id, title, body in db.session.execute(query.order_by(BlogPost.id)):
+        if set(terms) <= set(tokenize(f"{title or ''} {body or ''}")):
+            ids.append(post_id)
+    return ids
+
+
+def _blogposts_by_ids(ids: list[int]) -> list[dict]:
+    """
+    Get the blogposts of the IDs, in the same order.
+    The per-worker index finds each of them in O(log n) TC, otherwise
+    they are selected by primary key, a batch of IDs at a time.
+    """
+    index = current_app.extensions.get("blogpost_index")
+    if index is not None:
+        posts = (index.search(post_id) for post_id in ids)
+        return [post for post in posts if post]
+
+    posts = {}
+    for start in range(0, len(ids), 500):
+        batch = ids[start : start + 500]
+        for post in BlogPost.query.filter(BlogPost.id.in_(batch)):
+            posts[post.id] = blogpost_to_dict(post)
+    return [posts[post_id] for post_id in ids if post_id in posts]
 
 
 @blogpost_bp.route("/<blogpost_id>", methods=["GET"])
@@ -77,25 +307,12 @@ def read_blogpost(blogpost_id: int):
     """
     Endpoint to READ a blogpost.
     """
-    blogposts = BlogPost.query.all()
-    # blogposts are in ascending order by default
-    # if we insert like that in the BST, we will end up with a linked list
-    # so search for a specific blogpost will be in O(n) TC
-    # we need to shuffle the blogposts so that the insert will end up
-    # with something similar to a balanced BST
-    random.shuffle(blogposts)
-
-    bst = binary_search_tree.BST()
-
-    for post in blogposts:
-        bst.insert(
-            {
-                "id": post.id,
-                "title": post.title,
-                "body": post.body,
-                "user_id": post.user_id,
-            }
-        )
+    # the per-worker index is built once, then kept up to date on writes,
+    # so search for a specific blogpost is in O(log n) TC without any
+    # database round-trip, but the version check once per INDEX_VERSION_TTL
+    # when the index is disabled, the tree is built from the blogposts
+    # sorted by ID, perfectly balanced in O(n)
+    bst = current_app.extensions.get("blogpost_index") or build_blogpost_tree()
 
     post = bst.search(blogpost_id)
 
@@ -108,33 +325,40 @@ def read_blogpost(blogpost_id: int):
 @blogpost_bp.route("/numerics", methods=["GET"])
 def get_numeric_post_bodies():
     """
-    Endpoint to get blogposts, and process each body field,
-    sum the ASCII values of each character in the body.
+    Endpoint to get blogposts, whose body is replaced by its numeric value,
+    the sum of the ASCII values of its characters.
+    The value is computed when the body is written and stored in the
+    `numeric_body` column (see `app.numerics`), so only the projected
+    columns are read here.
+    With `stream=json|ndjson` (see `app.streaming`), the blogposts are
+    read from the database in batches and streamed instead.
     """
-    blogposts = BlogPost.query.all()
-    q = queue.Queue()
-
-    for post in blogposts:
-        q.enqueue(post)
-
-    response_list = []
+    try:
+        fmt = stream_format()
+    except ValueError:
+        return jsonify({"message": "stream must be json or ndjson"}), 400
+
+    query = db.select(
+        BlogPost.id,
+        BlogPost.title,
+        BlogPost.numeric_body.label("body"),
+        BlogPost.user_id,
+    ).order_by(BlogPost.id)
+
+    if fmt is not None:
+        rows = db.session.execute(
+            query.execution_options(yield_per=current_app.config["YIELD_PER"])
+        )
+        return stream_response((row._asdict() for row in rows), fmt)
 
-    for _ in range(len(blogposts)):
-        post = q.dequeue()
-        numeric_body: int = 0
-        for char in post.data.body:
-            numeric_body += ord(char)
+    blogposts = db.session.execute(query).all()
+    q = queue.RingBufferQueue(capacity=max(len(blogposts), 1))
 
-        post.data.body = numeric_body
+    # the blogposts move through the queue in one batch each way,
+    # without allocating a node per blogpost
+    q.enqueue_many(blogposts)
 
-        response_list.append(
-            {
-                "id": post.data.id,
-                "title": post.data.title,
-                "body": post.data.body,
-                "user_id": post.data.user_id,
-            }
-        )
+    response_list = [row._asdict() for row in q.dequeue_many(len(blogposts))]
 
     return jsonify(response_list), 200
 
@@ -155,21 +379,30 @@ def get_numeric_post_bodies():
 #     pass
 
 
-@blogpost_bp.route("/delete_last_10", methods=["DELETE"])
-def delete_last_10_blogposts():
+@blogpost_bp.route("/delete_last/<int:n>", methods=["DELETE"])
+def delete_last_blogposts(n):
     """
-    Endpoint to DELETE the last 10 blogposts.
+    Endpoint to DELETE the last `n` blogposts.
+    Only the `n` posts with the highest ids are fetched, and they are
+    deleted in a single transaction. Fewer posts are deleted when the
+    table holds less than `n` of them.
     """
-    blogposts = BlogPost.query.all()
-
-    s = stack.Stack()
+    blogposts = BlogPost.query.order_by(BlogPost.id.desc()).limit(n).all()
 
-    for post in blogposts:
-        s.push(post)
+    s = stack.ArrayStack()
+    # the most recent post ends up at the top of the stack
+    s.push_many(reversed(blogposts))
 
-    for _ in range(10):
-        deleted_post = s.pop()
-        db.session.delete(deleted_post.data)
-        db.session.commit()
+    for post in s.pop_many(n):
+        db.session.delete(post)
+    db.session.commit()
 
     return jsonify({"message": "success"}), 204
+
+
+@blogpost_bp.route("/delete_last_10", methods=["DELETE"])
+def delete_last_10_blogposts():
+    """
+    Endpoint to DELETE the last 10 blogposts.
+    """
+    return delete_last_blogposts(10)
@@ -5,19 +5,27 @@ User routes/endpoints blueprint.
 import os
 import sys
 
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, current_app, jsonify, request
+from sqlalchemy import and_, case, func, or_
+from sqlalchemy.exc import IntegrityError
 
 # Add the parent directory of the app directory to sys.path
 parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
 sys.path.append(parent_dir)
 
 from app import db
+from app.indexes.user import user_to_dict
+from app.models.blogpost import BlogPost
 from app.models.user import User
+from app.streaming import stream_format, stream_response
 from dsa.linked_list import LinkedList
 
 # Define a blueprint for user routes/endpoints.
 user_bp = Blueprint("users", __name__)
 
+# columns of a blogpost that `fields` can select
+BLOGPOST_FIELDS: tuple[str, ...] = ("id", "title", "body", "date", "user_id")
+
 
 @user_bp.route("", methods=["POST"])
 def create_user():
@@ -31,10 +39,15 @@ def create_user():
     if not all(field in data and data.get(field) for field in required_fields):
         return jsonify({"message": "Missing required fields"}), 400
 
-    # Check for duplicate username or email
-    existing_user = User.query.filter(
-        (User.username == data.get("username") or User.email == data.get("email"))
-    ).first()
+    # Check for duplicate username or email, the Bloom filter rules out
+    # most new users without querying the database
+    username, email = data.get("username"), data.get("email")
+    user_filter = current_app.extensions.get("user_bloom_filter")
+    existing_user = None
+    if user_filter is None or user_filter.might_exist(username, email):
+        existing_user = User.query.filter(
+            or_(User.username == username, User.email == email)
+        ).first()
 
     if existing_user:
         return (
@@ -44,8 +57,8 @@ def create_user():
 
     try:
         new_user = User(
-            username=data.get("username"),
-            email=data.get("email"),
+            username=username,
+            email=email,
             address=data.get("address"),
             phone=data.get("phone"),
         )
@@ -54,77 +67,210 @@ def create_user():
         db.session.commit()
 
         return jsonify({"message": "User created"}), 201
+    except IntegrityError:
+        # the unique indexes caught a duplicate created meanwhile
+        db.session.rollback()
+        return (
+            jsonify({"message": "User with that username or email already exists"}),
+            409,
+        )
     except Exception as e:
         db.session.rollback()
         return jsonify({"error": f"Unexpected error: {str(e)}"}), 500
 
 
-@user_bp.route("/descending_id", methods=["GET"])
-def get_users_in_descending_order():
+def _int_args(*names: str) -> dict:
     """
-    Endpoint to READ all users by IDs in descending order
+    Parse the optional non-negative integer query parameters `names`,
+    None when missing. Raise ValueError if one of them is not valid.
     """
-    users: list[User] = User.query.all()
-    users_ll = LinkedList()
+    params = {}
+    for name in names:
+        value = request.args.get(name)
+        if value is not None and not value.isdigit():
+            raise ValueError(f"{name} must be a non-negative integer")
+        params[name] = int(value) if value is not None else None
+    return params
+
+
+def _users_query(
+    offset: int,
+    limit: int | None,
+    reverse: bool,
+    after_id: int | None,
+    before_id: int | None,
+):
+    """
+    Build the query of a page of users ordered by ID, with the bounds
+    and the limit pushed down to the database, which walks the primary
+    key index from the cursor only.
+    """
+    query = User.query
+    if after_id is not None:
+        query = query.filter(User.id > after_id)
+    if before_id is not None:
+        query = query.filter(User.id < before_id)
+    order = User.id.desc() if reverse else User.id
+    return query.order_by(order).offset(offset).limit(limit)
+
+
+def _users_page(
+    offset: int,
+    limit: int | None,
+    reverse: bool,
+    after_id: int | None,
+    before_id: int | None,
+) -> list[dict]:
+    """
+    Get a page of users ordered by ID, see `_read_users_in_order`.
+    The per-worker index serves it without querying the database.
+    """
+    index = current_app.extensions.get("user_index")
+    if index is not None:
+        return index.page(offset, limit, reverse, after_id, before_id)
+
+    users: list[User] = _users_query(offset, limit, reverse, after_id, before_id)
 
+    # each page keeps the order of the rows in a linked list
+    users_ll = LinkedList()
     for user in users:
-        users_ll.add_to_head(
-            {
-                "id": user.id,
-                "username": user.username,
-                "email": user.email,
-                "address": user.address,
-                "phone": user.phone,
-            }
-        )
+        users_ll.add_to_tail(user_to_dict(user))
+
+    return users_ll.ll_to_list()
+
+
+def _read_users_in_order(reverse: bool):
+    """
+    Read the users ordered by ID, in descending order if `reverse` is True.
+
+    Without query parameters, every user is returned in a list.
+    With any of `limit`, `after_id`, `before_id` or `offset`, the response
+    is a page `{"users": [...], "next_cursor": ID | null}` of at most
+    `limit` users (PAGE_SIZE by default). The next page is requested with
+    `after_id=<next_cursor>` in ascending order, `before_id=<next_cursor>`
+    in descending order, so each page costs O(log n + limit) whatever the
+    number of users (keyset pagination).
+
+    With `stream=json|ndjson` (see `app.streaming`), the users are read
+    from the database in batches and streamed, bounded by the same
+    parameters, as a plain list without `next_cursor`.
+    """
+    try:
+        fmt = stream_format()
+    except ValueError:
+        return jsonify({"message": "stream must be json or ndjson"}), 400
+
+    try:
+        params = _int_args("offset", "limit", "after_id", "before_id")
+    except ValueError as e:
+        return jsonify({"message": str(e)}), 400
+
+    offset = params["offset"] or 0
+    after_id = params["after_id"]
+    before_id = params["before_id"]
+    if fmt is not None:
+        users = _users_query(offset, params["limit"], reverse, after_id, before_id)
+        users = users.yield_per(current_app.config["YIELD_PER"])
+        return stream_response(map(user_to_dict, users), fmt)
+
+    if all(value is None for value in params.values()):
+        return jsonify(_users_page(0, None, reverse, None, None)), 200
+
+    limit = params["limit"]
+    if limit is None:
+        limit = current_app.config["PAGE_SIZE"]
+    if limit == 0:
+        return jsonify({"message": "limit must be a positive integer"}), 400
+
+    # one more user tells whether there is a next page
+    users = _users_page(offset, limit + 1, reverse, after_id, before_id)
+    next_cursor = None
+    if len(users) > limit:
+        users = users[:limit]
+        next_cursor = users[-1]["id"]
 
-    return jsonify(users_ll.ll_to_list()), 200
+    return jsonify({"users": users, "next_cursor": next_cursor}), 200
+
+
+@user_bp.route("/descending_id", methods=["GET"])
+def get_users_in_descending_order():
+    """
+    Endpoint to READ all users by IDs in descending order
+    """
+    return _read_users_in_order(reverse=True)
 
 
 @user_bp.route("/ascending_id", methods=["GET"])
 def get_users_in_ascending_order():
     """
     Endpoint to READ all users by IDs in ascending order
-    Inserting at the linked list here is redundant, since
-    by default, `User.query.all()` arrange the data in ascending order
     """
-    users: list[User] = User.query.all()
-    users_ll = LinkedList()
+    return _read_users_in_order(reverse=False)
 
-    for user in users:
-        users_ll.add_to_tail(
-            {
-                "id": user.id,
-                "username": user.username,
-                "email": user.email,
-                "address": user.address,
-                "phone": user.phone,
-            }
-        )
 
-    return jsonify(users_ll.ll_to_list()), 200
+@user_bp.route("/search", methods=["GET"])
+def search_users():
+    """
+    Endpoint to READ the users whose username or email starts with the
+    `prefix` query parameter (case insensitive), at most `limit` of them
+    (PAGE_SIZE by default), e.g. for an autocomplete, in lexicographic
+    order of the username or email matched, then by ID.
+    The per-worker Trie index finds them in O(len(prefix) + k * L) TC.
+    """
+    prefix = request.args.get("prefix")
+    if not prefix:
+        return jsonify({"message": "prefix is required"}), 400
+
+    try:
+        limit = _int_args("limit")["limit"]
+    except ValueError as e:
+        return jsonify({"message": str(e)}), 400
+    if limit is None:
+        limit = current_app.config["PAGE_SIZE"]
+    if limit == 0:
+        return jsonify({"message": "limit must be a positive integer"}), 400
+
+    index = current_app.extensions.get("user_search_index")
+    if index is not None:
+        return jsonify(index.search(prefix, limit)), 200
+
+    # the index is disabled, match the prefix in the database
+    prefix = prefix.lower()
+    username = func.lower(User.username)
+    email = func.lower(User.email)
+    username_matches = username.startswith(prefix, autoescape=True)
+    email_matches = email.startswith(prefix, autoescape=True)
+    # the smallest word matched, as the walk of the Trie finds them
+    word = case(
+        (and_(username_matches, email_matches, email < username), email),
+        (username_matches, username),
+        else_=email,
+    )
+    users = (
+        User.query.filter(or_(username_matches, email_matches))
+        .order_by(word, User.id)
+        .limit(limit)
+    )
+    return jsonify([user_to_dict(user) for user in users]), 200
 
 
 @user_bp.route("/<user_id>", methods=["GET"])
 def read_user(user_id: int):
     """
     Endpoint to READ a user.
+    The per-worker Linked Hash Map index finds the user in O(1) TC,
+    without scanning the users table on each call.
     """
-    users: list[User] = User.query.all()
-    users_ll = LinkedList()
-
-    for user in users:
-        users_ll.add_to_head(
-            {
-                "id": user.id,
-                "username": user.username,
-                "email": user.email,
-                "address": user.address,
-                "phone": user.phone,
-            }
-        )
+    if not str(user_id).isdigit():
+        return jsonify({"message": "User not found"}), 404
 
-    user: User = users_ll.get_user_by_id(user_id)
+    index = current_app.extensions.get("user_index")
+    if index is not None:
+        user = index.get_user_by_id(user_id)
+    else:
+        # the index is disabled, look the primary key up in the database
+        user = db.session.get(User, int(user_id))
+        user = user_to_dict(user) if user is not None else None
 
     if not user:
         return jsonify({"message": "User not found"}), 404
@@ -135,9 +281,78 @@ def read_user(user_id: int):
 @user_bp.route("/<user_id>/blogposts", methods=["GET"])
 def read_all_blogposts(user_id: int):
     """
-    Endpoint to READ all the blogposts of a user.
+    Endpoint to READ all the blogposts of a user, in ascending order of ID.
+
+    Only the requested columns are selected, without building BlogPost
+    objects, and the index on `blogposts.user_id` finds the k posts of
+    the user in O(k log n) TC instead of scanning every blogpost.
+    `fields` is a comma-separated subset of the columns (all by default).
+    With `limit` or `after_id`, the response is a page
+    `{"blogposts": [...], "next_cursor": ID | null}` of at most `limit`
+    posts (PAGE_SIZE by default), the next one requested with
+    `after_id=<next_cursor>`.
     """
-    pass
+    if not str(user_id).isdigit():
+        return jsonify({"message": "User not found"}), 404
+    user_id = int(user_id)
+
+    fields = request.args.get("fields")
+    fields = fields.split(",") if fields else list(BLOGPOST_FIELDS)
+    unknown = [field for field in fields if field not in BLOGPOST_FIELDS]
+    if unknown:
+        return jsonify({"message": f"Unknown fields: {', '.join(unknown)}"}), 400
+
+    try:
+        params = _int_args("limit", "after_id")
+    except ValueError as e:
+        return jsonify({"message": str(e)}), 400
+    paginated = any(value is not None for value in params.values())
+    limit = params["limit"]
+    if paginated and limit is None:
+        limit = current_app.config["PAGE_SIZE"]
+    if limit == 0:
+        return jsonify({"message": "limit must be a positive integer"}), 400
+
+    user_exists = db.session.execute(
+        db.select(User.id).where(User.id == user_id)
+    ).first()
+    if not user_exists:
+        return jsonify({"message": "User not found"}), 404
+
+    # the ID is always selected, as the cursor of the next page
+    columns = [BlogPost.id] + [getattr(BlogPost, field) for field in fields]
+    query = db.select(*columns).where(BlogPost.user_id == user_id)
+    if params["after_id"] is not None:
+        query = query.where(BlogPost.id > params["after_id"])
+    query = query.order_by(BlogPost.id)
+    if limit is not None:
+        # one more post tells whether there is a next page
+        query = query.limit(limit + 1)
+
+    blogposts = []
+    for row in db.session.execute(query):
+        post = dict(zip(fields, row[1:]))
+        if post.get("date") is not None:
+            post["date"] = post["date"].isoformat()
+        blogposts.append((row[0], post))
+
+    if not paginated:
+        return jsonify([post for _, post in blogposts]), 200
+
+    next_cursor = None
+    if len(blogposts) > limit:
+        blogposts = blogposts[:limit]
+        next_cursor = blogposts[-1][0]
+
+    return (
+        jsonify(
+            {
+                "blogposts": [post for _, post in blogposts],
+                "next_cursor": next_cursor,
+            }
+        ),
+        200,
+    )
 
 
 @user_bp.route("/<user_id>", methods=["PUT"])
@@ -160,7 +375,14 @@ def update_user(user_id: int):
         if field in data and data[field]:
             setattr(user, field, data[field])
 
-    db.session.commit()
+    try:
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback()
+        return (
+            jsonify({"message": "User with that username or email already exists"}),
+            409,
+        )
 
     user_dict = {
         "id": user.id,
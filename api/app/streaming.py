@@ -0,0 +1,83 @@
+"""
+Streamed JSON responses for the large collection endpoints.
+
+A streamed response is serialized a few items at a time while the rows
+are read from the database in batches (`yield_per`), so the memory used
+does not grow with the number of rows, and the first bytes are sent
+before the last row is read.
+"""
+
+from collections.abc import Iterable
+
+from flask import Response, current_app, request, stream_with_context
+
+NDJSON_MIMETYPE = "application/x-ndjson"
+
+# number of items serialized into each chunk of the response body
+ITEMS_PER_CHUNK = 100
+
+
+def stream_format() -> str | None:
+    """
+    Get the streaming format requested: "json" for a JSON array, "ndjson"
+    for one JSON document per line, None for a regular response.
+    It is set by the `stream` query parameter, or by an
+    `Accept: application/x-ndjson` header.
+    Raise ValueError for an unknown format.
+    """
+    fmt = request.args.get("stream")
+    if fmt is None:
+        if request.accept_mimetypes.best == NDJSON_MIMETYPE:
+            return "ndjson"
+        return None
+    if fmt not in ("json", "ndjson"):
+        raise ValueError(f"Unknown stream format: {fmt}")
+    return fmt
+
+
+def _batches(items: Iterable):
+    """
+    Private generator used to serialize the items, ITEMS_PER_CHUNK at a time.
+    """
+    dumps = current_app.json.dumps
+    batch = []
+    for item in items:
+        batch.append(dumps(item))
+        if len(batch) == ITEMS_PER_CHUNK:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _json_array(items: Iterable):
+    """
+    Private generator used to stream the items as a JSON array.
+    """
+    yield "["
+    separator = ""
+    for batch in _batches(items):
+        yield separator + ",".join(batch)
+        separator = ","
+    yield "]"
+
+
+def _ndjson(items: Iterable):
+    """
+    Private generator used to stream the items as newline-delimited JSON.
+    """
+    for batch in _batches(items):
+        yield "\n".join(batch) + "\n"
+
+
+def stream_response(items: Iterable, fmt: str) -> Response:
+    """
+    Build a response streaming the items in the `fmt` format,
+    see `stream_format`. `items` is consumed lazily, within the
+    request context, while the response is sent.
+    """
+    if fmt == "ndjson":
+        body, mimetype = _ndjson(items), NDJSON_MIMETYPE
+    else:
+        body, mimetype = _json_array(items), "application/json"
+    return Response(stream_with_context(body), mimetype=mimetype)
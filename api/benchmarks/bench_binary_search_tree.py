@@ -0,0 +1,91 @@
+"""
+Benchmark of the height and insert/search time of the BST and AVL Tree.
+
+Insert sorted, reverse-sorted and random keys up to 10^6 keys, then
+report the height of the tree and the time to insert and search every key.
+A plain BST fed with sorted keys degenerates into a linked list, so it
+is skipped for sorted inputs above MAX_DEGENERATE keys (O(n^2) inserts).
+`BST.from_sorted` builds a balanced tree from the sorted keys in O(n).
+
+Usage:
+    python benchmarks/bench_binary_search_tree.py [max_keys]
+"""
+
+import os
+import random
+import sys
+import time
+
+# Add the parent directory of dsa to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from dsa.binary_search_tree import BST, AVLTree
+
+SIZES = [1_000, 10_000, 100_000, 1_000_000]
+MAX_DEGENERATE = 10_000
+
+
+def orders(n: int) -> dict[str, list[int]]:
+    """
+    Return the keys from 1 to n in the three insertion orders.
+    """
+    keys = list(range(1, n + 1))
+    shuffled = keys[:]
+    random.Random(42).shuffle(shuffled)
+    return {"sorted": keys, "reverse": keys[::-1], "random": shuffled}
+
+
+def bench(build, keys: list[int]) -> str:
+    """
+    Return a formatted report line for the tree returned by `build(keys)`.
+    """
+    start = time.perf_counter()
+    tree = build(keys)
+    insert_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for key in keys:
+        tree.search(key)
+    search_s = time.perf_counter() - start
+
+    return f"{tree.height():>10} {insert_s:>12.3f} {search_s:>12.3f}"
+
+
+def insert_one_by_one(cls):
+    """
+    Return a builder inserting the keys one by one in a `cls` tree.
+    """
+
+    def build(keys: list[int]):
+        tree = cls()
+        for key in keys:
+            tree.insert(key)
+        return tree
+
+    return build
+
+
+def main() -> None:
+    max_keys = int(sys.argv[1]) if len(sys.argv) > 1 else SIZES[-1]
+
+    print(
+        f"{'keys':>10} {'order':>8} {'tree':>12} "
+        f"{'height':>10} {'insert (s)':>12} {'search (s)':>12}"
+    )
+    for n in SIZES:
+        if n > max_keys:
+            break
+        for order, keys in orders(n).items():
+            for cls in (BST, AVLTree):
+                if cls is BST and order != "random" and n > MAX_DEGENERATE:
+                    print(f"{n:>10} {order:>8} {cls.__name__:>12} {'skipped':>10}")
+                    continue
+                report = bench(insert_one_by_one(cls), keys)
+                print(f"{n:>10} {order:>8} {cls.__name__:>12} {report}")
+            if order == "sorted":
+                report = bench(BST.from_sorted, keys)
+                print(f"{n:>10} {order:>8} {'from_sorted':>12} {report}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Benchmark of the HashMap per operation latency.
+
+Measure the mean time of `add_key_value` and `get_value` for hashmaps
+holding from 10 to 1,000,000 keys. With load-factor-driven resizing,
+the per operation latency should stay flat whatever the number of keys.
+
+Usage:
+    python benchmarks/bench_hashmap.py [max_keys]
+"""
+
+import os
+import sys
+import time
+
+# Add the parent directory of dsa to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from dsa.hashmap import HashMap
+
+SIZES = [10, 100, 1_000, 10_000, 100_000, 1_000_000]
+
+
+def bench(n: int) -> tuple[float, float, dict]:
+    """
+    Return the mean add and get latency (in nanoseconds) for `n` keys,
+    and the final distribution stats of the hashmap.
+    """
+    keys = [f"key{i}" for i in range(n)]
+    hashmap = HashMap()
+
+    start = time.perf_counter()
+    for i, key in enumerate(keys):
+        hashmap.add_key_value(key, i)
+    add_ns = (time.perf_counter() - start) / n * 1e9
+
+    start = time.perf_counter()
+    for key in keys:
+        hashmap.get_value(key)
+    get_ns = (time.perf_counter() - start) / n * 1e9
+
+    return add_ns, get_ns, hashmap.stats()
+
+
+def main() -> None:
+    max_keys = int(sys.argv[1]) if len(sys.argv) > 1 else SIZES[-1]
+
+    print(
+        f"{'keys':>10} {'buckets':>10} {'max chain':>10} {'collisions':>10} "
+        f"{'add (ns/op)':>12} {'get (ns/op)':>12}"
+    )
+    for n in SIZES:
+        if n > max_keys:
+            break
+        add_ns, get_ns, stats = bench(n)
+        print(
+            f"{n:>10} {stats['buckets']:>10} {stats['max_chain_length']:>10} "
+            f"{stats['collisions']:>10} {add_ns:>12.0f} {get_ns:>12.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Benchmark of the HashMap bulk construction.
+
+Compare building a hashmap with `HashMap.from_items` (presized table,
+single tight loop) against repeated `add_key_value` calls on a default
+sized hashmap (several rehashes).
+
+Usage:
+    python benchmarks/bench_hashmap_bulk.py [max_keys]
+"""
+
+import os
+import sys
+import time
+
+# Add the parent directory of dsa to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from dsa.hashmap import HashMap
+
+SIZES = [10, 1_000, 100_000, 1_000_000]
+
+
+def build_one_by_one(pairs: list[tuple]) -> HashMap:
+    """
+    Build a hashmap with repeated add_key_value calls.
+    """
+    hashmap = HashMap()
+    for key, value in pairs:
+        hashmap.add_key_value(key, value)
+    return hashmap
+
+
+def build_from_items(pairs: list[tuple]) -> HashMap:
+    """
+    Build a hashmap with HashMap.from_items.
+    """
+    return HashMap.from_items(pairs)
+
+
+def main() -> None:
+    max_keys = int(sys.argv[1]) if len(sys.argv) > 1 else SIZES[-1]
+
+    print(
+        f"{'keys':>10} {'add_key_value (s)':>18} {'from_items (s)':>15} {'speedup':>8}"
+    )
+    for n in SIZES:
+        if n > max_keys:
+            break
+        pairs = [(f"key{i}", i) for i in range(n)]
+
+        start = time.perf_counter()
+        build_one_by_one(pairs)
+        one_by_one = time.perf_counter() - start
+
+        start = time.perf_counter()
+        build_from_items(pairs)
+        bulk = time.perf_counter() - start
+
+        print(f"{n:>10} {one_by_one:>18.4f} {bulk:>15.4f} {one_by_one / bulk:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
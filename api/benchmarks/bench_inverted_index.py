@@ -0,0 +1,114 @@
+"""
+Benchmark of the full-text search with the Inverted Index.
+
+Seed a corpus of blogposts whose words follow a Zipf distribution (a few
+very common words, many rare ones), index it, then compare the latency of
+AND queries answered by the Inverted Index (galloping intersection) with
+a scan of every text, as `LIKE '%term%'` does, and with an intersection
+of Python sets of the posting lists.
+
+Usage:
+    python benchmarks/bench_inverted_index.py [max_posts]
+"""
+
+import os
+import random
+import sys
+import time
+from itertools import accumulate
+
+# Add the parent directory of dsa to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from dsa.inverted_index import InvertedIndex, tokenize
+
+POSTS = 1_000_000
+VOCABULARY = 50_000
+WORDS_PER_POST = 30
+REPEAT = 5
+
+
+def seed_corpus(posts: int) -> tuple[list[str], list[str]]:
+    """
+    Generate the texts of the blogposts and the vocabulary, by rank.
+    """
+    rng = random.Random(42)
+    vocabulary = [f"w{rank}" for rank in range(VOCABULARY)]
+    # cumulated once, instead of on each call to choices()
+    cum_weights = list(accumulate(1 / (rank + 1) for rank in range(VOCABULARY)))
+    texts = []
+    for _ in range(posts):
+        words = rng.choices(vocabulary, cum_weights=cum_weights, k=WORDS_PER_POST)
+        texts.append(" ".join(words))
+    return texts, vocabulary
+
+
+def scan(texts: list[str], query: str) -> list[int]:
+    """
+    Find the posts containing every term by reading every text.
+    """
+    terms = set(tokenize(query))
+    return [
+        post_id
+        for post_id, text in enumerate(texts, 1)
+        if all(term in text for term in terms) and terms <= set(tokenize(text))
+    ]
+
+
+def set_intersection(index: InvertedIndex, query: str) -> list[int]:
+    """
+    Find the posts containing every term with Python sets.
+    """
+    postings = [set(index.postings.get(term, ())) for term in set(tokenize(query))]
+    return sorted(set.intersection(*postings))
+
+
+def timed(function, *args) -> tuple[float, list]:
+    """
+    Mean time of REPEAT calls, and the result of the last one.
+    """
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        result = function(*args)
+    return (time.perf_counter() - start) / REPEAT, result
+
+
+def main() -> None:
+    posts = min(int(sys.argv[1]), POSTS) if len(sys.argv) > 1 else POSTS
+
+    start = time.perf_counter()
+    texts, vocabulary = seed_corpus(posts)
+    print(f"seeded {posts} posts in {time.perf_counter() - start:.1f} s")
+
+    start = time.perf_counter()
+    index = InvertedIndex()
+    for post_id, text in enumerate(texts, 1):
+        index.add(post_id, text)
+    print(f"indexed {len(index.postings)} terms in {time.perf_counter() - start:.1f} s")
+
+    queries = [
+        vocabulary[0],
+        f"{vocabulary[0]} {vocabulary[1]}",
+        f"{vocabulary[0]} {vocabulary[5000]}",
+        f"{vocabulary[2]} {vocabulary[50]} {vocabulary[20000]}",
+    ]
+
+    print(
+        f"\n{'query':<20} {'matches':>8} {'index (ms)':>11} "
+        f"{'sets (ms)':>10} {'scan (ms)':>10}"
+    )
+    for query in queries:
+        index_time, expected = timed(index.search, query)
+        sets_time, result = timed(set_intersection, index, query)
+        assert result == expected
+        scan_start = time.perf_counter()
+        assert scan(texts, query) == expected
+        scan_time = time.perf_counter() - scan_start
+        print(
+            f"{query:<20} {len(expected):>8} {index_time * 1000:>11.3f} "
+            f"{sets_time * 1000:>10.3f} {scan_time * 1000:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Benchmark of the memory footprint of the data structures.
+
+Fill each structure of the dsa package with 10^4, 10^5 and 10^6 elements
+and report the memory it holds (measured with tracemalloc), in bytes per
+element. The elements are created before the measure, so only the
+structure itself (nodes, tables, ...) is counted.
+
+Usage:
+    python benchmarks/bench_memory.py [max_elements]
+"""
+
+import os
+import sys
+import tracemalloc
+
+# Add the parent directory of dsa to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from dsa.binary_search_tree import BST, AVLTree
+from dsa.hashmap import HashMap
+from dsa.linked_list import LinkedHashMap, LinkedList
+from dsa.open_hashmap import OpenHashMap
+from dsa.queue import Queue, RingBufferQueue
+from dsa.stack import Stack
+
+SIZES = [10_000, 100_000, 1_000_000]
+
+
+def fill_linked_list(elements: list[dict]):
+    ll = LinkedList()
+    for data in elements:
+        ll.add_to_tail(data)
+    return ll
+
+
+def fill_linked_hash_map(elements: list[dict]):
+    lhm = LinkedHashMap()
+    for data in elements:
+        lhm.add_to_tail(data)
+    return lhm
+
+
+def fill_queue(elements: list[dict]):
+    q = Queue()
+    for data in elements:
+        q.enqueue(data)
+    return q
+
+
+def fill_ring_buffer_queue(elements: list[dict]):
+    q = RingBufferQueue()
+    q.enqueue_many(elements)
+    return q
+
+
+def fill_stack(elements: list[dict]):
+    s = Stack()
+    for data in elements:
+        s.push(data)
+    return s
+
+
+def fill_hashmap(elements: list[dict]):
+    hashmap = HashMap()
+    for data in elements:
+        hashmap.add_key_value(data["id"], data)
+    return hashmap
+
+
+def fill_open_hashmap(elements: list[dict]):
+    hashmap = OpenHashMap()
+    for data in elements:
+        hashmap.add_key_value(data["id"], data)
+    return hashmap
+
+
+def fill_bst(elements: list[dict]):
+    return BST.from_sorted(elements)
+
+
+def fill_avl_tree(elements: list[dict]):
+    return AVLTree.from_sorted(elements)
+
+
+STRUCTURES = {
+    "LinkedList": fill_linked_list,
+    "LinkedHashMap": fill_linked_hash_map,
+    "Queue": fill_queue,
+    "RingBufferQueue": fill_ring_buffer_queue,
+    "Stack": fill_stack,
+    "HashMap": fill_hashmap,
+    "OpenHashMap": fill_open_hashmap,
+    "BST": fill_bst,
+    "AVLTree": fill_avl_tree,
+}
+
+
+def measure(fill, elements: list[dict]) -> float:
+    """
+    Return the memory held by the structure built by `fill(elements)`,
+    in bytes per element.
+    """
+    tracemalloc.start()
+    structure = fill(elements)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del structure
+    return memory / len(elements)
+
+
+def main() -> None:
+    max_elements = int(sys.argv[1]) if len(sys.argv) > 1 else SIZES[-1]
+    if max_elements < 1:
+        sys.exit("usage: python benchmarks/bench_memory.py [max_elements >= 1]")
+    # the requested maximum is always measured, even below the smallest size
+    max_elements = min(max_elements, SIZES[-1])
+    sizes = [n for n in SIZES if n < max_elements] + [max_elements]
+
+    print(f"{'structure':>16} " + " ".join(f"{n:>12}" for n in sizes))
+    # the elements are shared by every structure, and not measured
+    elements = [{"id": i} for i in range(sizes[-1])]
+    for name, fill in STRUCTURES.items():
+        report = [measure(fill, elements[:n]) for n in sizes]
+        print(f"{name:>16} " + " ".join(f"{memory:>10.1f} B" for memory in report))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Benchmark of the computation of the numeric value of the blogposts bodies.
+
+Generate blogpost bodies of random words, then compare the throughput of
+the original character by character `ord()` loop with the bytes-level
+sums of `app.numerics`, in pure Python and with NumPy when it is
+installed, and with the chunks spread over 1, 2, 4, ... worker processes,
+up to the number of CPUs.
+
+Usage:
+    python benchmarks/bench_numerics.py [max_bodies]
+"""
+
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# Add the parent directory of app to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app import numerics
+from app.numerics import compute_numeric_bodies
+
+BODIES = 1_000_000
+WORDS_PER_BODY = 80
+# one body in a hundred is not ASCII
+NON_ASCII_RATE = 0.01
+
+
+def seed_bodies(count: int) -> list[str]:
+    """
+    Generate the bodies, about 500 characters each, like the dummy data.
+    """
+    rng = random.Random(42)
+    words = ["lorem", "ipsum", "dolor", "sit", "amet", "data", "python", "flask"]
+    bodies = []
+    for _ in range(count):
+        body = " ".join(rng.choices(words, k=WORDS_PER_BODY))
+        if rng.random() < NON_ASCII_RATE:
+            body += " café"
+        bodies.append(body)
+    return bodies
+
+
+def ord_loop(bodies: list[str]) -> list[int]:
+    """
+    Sum the characters of each body one by one, as the endpoint used to.
+    """
+    values = []
+    for body in bodies:
+        value = 0
+        for char in body:
+            value += ord(char)
+        values.append(value)
+    return values
+
+
+def report(name: str, seconds: float, bodies: int, megabytes: float) -> None:
+    """
+    Print the throughput of a run.
+    """
+    print(
+        f"{name:<32} {seconds:>9.3f} {bodies / seconds:>14,.0f} "
+        f"{megabytes / seconds:>10.1f}"
+    )
+
+
+def main() -> None:
+    count = min(int(sys.argv[1]), BODIES) if len(sys.argv) > 1 else BODIES
+    bodies = seed_bodies(count)
+    megabytes = sum(map(len, bodies)) / 1e6
+    print(f"{count} bodies, {megabytes:.1f} M characters, {os.cpu_count()} CPUs")
+    print(f"\n{'engine':<32} {'time (s)':>9} {'bodies/s':>14} {'MB/s':>10}")
+
+    start = time.perf_counter()
+    expected = ord_loop(bodies)
+    report("ord() loop", time.perf_counter() - start, count, megabytes)
+
+    numpy = numerics.np
+    engines = [("bytes, pure Python", None)]
+    if numpy is not None:
+        engines.append(("bytes, NumPy", numpy))
+
+    for name, np in engines:
+        numerics.np = np
+        start = time.perf_counter()
+        assert compute_numeric_bodies(bodies) == expected
+        report(name, time.perf_counter() - start, count, megabytes)
+
+        workers = 1
+        while workers <= (os.cpu_count() or 1):
+            # the chunks are pickled to the workers, which import the module
+            # again, so the pool is started before the clock
+            with ProcessPoolExecutor(workers) as executor:
+                executor.submit(int).result()
+                start = time.perf_counter()
+                assert compute_numeric_bodies(bodies, executor) == expected
+                report(
+                    f"{name}, {workers} processes",
+                    time.perf_counter() - start,
+                    count,
+                    megabytes,
+                )
+            workers *= 2
+    numerics.np = numpy
+
+
+if __name__ == "__main__":
+    main()
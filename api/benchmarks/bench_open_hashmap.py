@@ -0,0 +1,76 @@
+"""
+Benchmark of the open addressing HashMap against the chained HashMap.
+
+Compare the memory held by each map (measured with tracemalloc) and the
+throughput of `add_key_value` and `get_value`.
+
+Usage:
+    python benchmarks/bench_open_hashmap.py [max_keys]
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+# Add the parent directory of dsa to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from dsa.hashmap import HashMap
+from dsa.open_hashmap import OpenHashMap
+
+SIZES = [1_000, 10_000, 100_000, 1_000_000]
+
+
+def bench(cls, keys: list[str]) -> tuple[float, float, float]:
+    """
+    Return the memory (in bytes per key) of a `cls` map holding `keys`,
+    and its add and get throughput (in operations per second).
+    """
+    n = len(keys)
+
+    # the keys are allocated before tracing, the int values above 256 are
+    # allocated while tracing, alike for both maps
+    tracemalloc.start()
+    hashmap = cls()
+    for i, key in enumerate(keys):
+        hashmap.add_key_value(key, i)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del hashmap
+
+    hashmap = cls()
+    start = time.perf_counter()
+    for i, key in enumerate(keys):
+        hashmap.add_key_value(key, i)
+    add_ops = n / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for key in keys:
+        hashmap.get_value(key)
+    get_ops = n / (time.perf_counter() - start)
+
+    return memory / n, add_ops, get_ops
+
+
+def main() -> None:
+    max_keys = int(sys.argv[1]) if len(sys.argv) > 1 else SIZES[-1]
+
+    print(
+        f"{'keys':>10} {'map':>12} {'bytes/key':>10} "
+        f"{'add (ops/s)':>12} {'get (ops/s)':>12}"
+    )
+    for n in SIZES:
+        if n > max_keys:
+            break
+        keys = [f"key{i}" for i in range(n)]
+        for cls in (HashMap, OpenHashMap):
+            memory, add_ops, get_ops = bench(cls, keys)
+            print(
+                f"{n:>10} {cls.__name__:>12} {memory:>10.1f} "
+                f"{add_ops:>12.0f} {get_ops:>12.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Benchmark of the database indexes added by the schema migrations.
+
+Fill a temporary database with the schema created before the indexes,
+then compare the query plan (EXPLAIN QUERY PLAN) and the time of the hot
+lookups before and after running the migrations on it.
+
+Usage:
+    python benchmarks/bench_query_plan.py [max_posts]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+# Add the parent directory of app to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import create_engine, text
+
+from app.migrations import migrate
+
+POSTS = 200_000
+USERS = 10_000
+REPEAT = 20
+
+# schema of the databases created before the indexes were added
+OLD_SCHEMA = [
+    "CREATE TABLE users (id INTEGER NOT NULL, username VARCHAR(50), "
+    "email VARCHAR(50), address VARCHAR(200), phone VARCHAR(50), PRIMARY KEY (id))",
+    "CREATE TABLE blogposts (id INTEGER NOT NULL, title VARCHAR(50), "
+    "body VARCHAR(500), date DATETIME, user_id INTEGER NOT NULL, PRIMARY KEY (id), "
+    "FOREIGN KEY(user_id) REFERENCES users (id))",
+]
+
+QUERIES = {
+    "duplicate user": (
+        "SELECT id FROM users WHERE username = :username OR email = :email",
+        {"username": "user4242", "email": "user4242@example.com"},
+    ),
+    "posts of a user": (
+        "SELECT id, title FROM blogposts WHERE user_id = :user_id ORDER BY id",
+        {"user_id": 4242},
+    ),
+    "latest posts": (
+        "SELECT id, title FROM blogposts ORDER BY date DESC LIMIT 10",
+        {},
+    ),
+}
+
+
+def fill(engine, posts: int) -> None:
+    """
+    Create the old schema and insert the users and the blogposts.
+    """
+    start = datetime(2020, 1, 1)
+    with engine.begin() as connection:
+        for statement in OLD_SCHEMA:
+            connection.execute(text(statement))
+        connection.execute(
+            text("INSERT INTO users (id, username, email) VALUES (:id, :u, :e)"),
+            [
+                {"id": i, "u": f"user{i}", "e": f"user{i}@example.com"}
+                for i in range(1, USERS + 1)
+            ],
+        )
+        connection.execute(
+            text(
+                "INSERT INTO blogposts (id, title, body, date, user_id) "
+                "VALUES (:id, :title, 'body', :date, :user_id)"
+            ),
+            [
+                {
+                    "id": i,
+                    "title": f"post{i}",
+                    # dates in no particular order of ID
+                    "date": start + timedelta(minutes=(i * 7919) % posts),
+                    "user_id": i % USERS + 1,
+                }
+                for i in range(1, posts + 1)
+            ],
+        )
+
+
+def measure(engine) -> dict:
+    """
+    Get the query plan and the mean time of each query.
+    """
+    results = {}
+    with engine.connect() as connection:
+        for label, (query, params) in QUERIES.items():
+            plan = connection.execute(text(f"EXPLAIN QUERY PLAN {query}"), params)
+            plan = "; ".join(row[-1] for row in plan)
+
+            start = time.perf_counter()
+            for _ in range(REPEAT):
+                connection.execute(text(query), params).fetchall()
+            results[label] = (plan, (time.perf_counter() - start) / REPEAT)
+    return results
+
+
+def main() -> None:
+    posts = min(int(sys.argv[1]), POSTS) if len(sys.argv) > 1 else POSTS
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{os.path.join(directory, 'bench.db')}")
+        fill(engine, posts)
+
+        before = measure(engine)
+        migrate(engine)
+        after = measure(engine)
+        engine.dispose()
+
+    print(f"{posts} blogposts, {USERS} users")
+    for label in QUERIES:
+        plan_before, time_before = before[label]
+        plan_after, time_after = after[label]
+        print(f"\n{label}")
+        print(f"  before: {time_before * 1000:>9.3f} ms  {plan_before}")
+        print(f"  after:  {time_after * 1000:>9.3f} ms  {plan_after}")
+        print(f"  speedup: {time_before / time_after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,105 +10,564 @@ class Node:
     Modelisation of a Node.
     """
 
+    __slots__ = ("data", "left", "right", "size")
+
     def __init__(self, data=None) -> None:
         """
         Initialisation.
+        `size` is the number of nodes of the subtree rooted at this node.
         """
         self.data = data
         self.left = None
         self.right = None
+        self.size = 1
 
 
 class BST:
     """
     Modelisation of the wrapper class for the Binary Search Tree.
+
+    By default, the data are ordered by ID. A `key` callable orders them
+    by any other value, e.g. `key=lambda post: post["date"]` indexes
+    blogposts by date. Several data may then share the same key value,
+    the ties being broken by their ID, so that each one keeps its place.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, key=None) -> None:
         """
         Initialisation.
         """
         self.root = None
+        self.key = key
 
     def _get_value(self, data):
         """
         Helper method to extract the comparison value from data.
+        If the tree has a `key` callable, use the value it returns.
         If data is a dictionary with an 'id' key, use that value.
         Otherwise, use the data value directly.
         """
+        if self.key is not None:
+            return self.key(data)
         if isinstance(data, dict) and "id" in data:
             return data["id"]
         return data
 
-    def _insert_recursive(self, data, node):
+    def _get_order(self, data, data_id=None):
         """
-        Private method used only by the insert() method.
-        Recursively check each node to insert the value in the right place.
+        Helper method returning the position of data in the tree.
+        Without `key` callable, it is the ID of the data. With a `key`,
+        it is the (key value, ID) pair, `data_id` replacing the ID of
+        the data if given, and data without ID raise ValueError, as they
+        could not be ordered among the data of the same key value.
         """
-        data_value = self._get_value(data)
-        node_value = self._get_value(node.data)
+        value = self._get_value(data)
+        if self.key is None:
+            return value
+        if data_id is None and isinstance(data, dict):
+            data_id = data.get("id")
+        if data_id is None:
+            raise ValueError(f"data of key {value!r} without ID to break the ties")
+        return value, data_id
 
-        if data_value < node_value:
-            if node.left is None:
-                node.left = Node(data)
-            else:
-                self._insert_recursive(data, node.left)
-        elif data_value > node_value:
-            if node.right is None:
-                node.right = Node(data)
-            else:
-                self._insert_recursive(data, node.right)
-        else:
-            # a BST should not contain duplicates
-            # this stage means the BST already contains the given data
-            return
+    def _parse_value(self, value):
+        """
+        Helper method to convert a searched value.
+        Without `key` callable, the value is an ID that may come
+        from the URL as a string.
+        """
+        if self.key is None:
+            return int(value)
+        return value
+
+    @classmethod
+    def from_sorted(cls, iterable, key=None) -> "BST":
+        """
+        Build a perfectly balanced tree from data sorted by ID (or by
+        `key` then ID), e.g. the result of an `ORDER BY id` query.
+        Duplicated data (same ID, or same key and ID) are skipped,
+        unsorted data raises ValueError.
+        Runtime: O(n), no comparison between nodes is needed
+        """
+        tree = cls(key=key)
+        items: list = []
+        previous_order = None
+        for data in iterable:
+            data_order = tree._get_order(data)
+            if items:
+                if data_order == previous_order:
+                    # a BST should not contain duplicates
+                    continue
+                if data_order < previous_order:
+                    raise ValueError("from_sorted() expects sorted data")
+            items.append(data)
+            previous_order = data_order
+
+        tree.root = tree._build_balanced(items, 0, len(items) - 1)
+        return tree
+
+    def _build_balanced(self, items: list, lo: int, hi: int):
+        """
+        Private method used only by the from_sorted() method.
+        The middle item becomes the root of the subtree, the items on its
+        left and right build its subtrees. The recursion depth is O(log n).
+        """
+        if lo > hi:
+            return None
+
+        mid: int = (lo + hi) // 2
+        node = Node(items[mid])
+        node.left = self._build_balanced(items, lo, mid - 1)
+        node.right = self._build_balanced(items, mid + 1, hi)
+        node.size = hi - lo + 1
+        return node
 
     def insert(self, data) -> None:
         """
         Insert a node with the data `data` in the BST.
+        Walk down the tree iteratively, so a skewed tree
+        does not hit the recursion limit.
+        Data already in the tree (same ID, or same key and ID) are skipped.
+        Runtime: O(h)  # h is the height of the tree
         """
+        data_order = self._get_order(data)
         if self.root is None:
             self.root = Node(data)
-        else:
-            # _insert_recursive is a private method (starts with _)
-            self._insert_recursive(data, self.root)
+            return
 
-    def _search_recursive(self, blogpost_id, node):
+        # nodes whose subtree grows if the data is inserted
+        path: list[Node] = []
+        temp = self.root
+        while True:
+            path.append(temp)
+            node_order = self._get_order(temp.data)
+            if data_order < node_order:
+                if temp.left is None:
+                    temp.left = Node(data)
+                    break
+                temp = temp.left
+            elif data_order > node_order:
+                if temp.right is None:
+                    temp.right = Node(data)
+                    break
+                temp = temp.right
+            else:
+                # a BST should not contain duplicates
+                # this stage means the BST already contains the given data
+                return
+
+        for node in path:
+            node.size += 1
+
+    def search(self, blogpost_id: str) -> BlogPost | bool:
         """
-        Private method used only by the search() method.
-        Recursively check each node to find a specific blogpost_id.
+        Search for blogpost by its ID (or by its `key` value, one of the
+        data sharing it being returned).
+        Runtime: O(h)  # h is the height of the tree
         """
-        # if node.left is None and node.right is None:
-        #     return False
+        # the blogpost_id from the URL is a string
+        blogpost_id = self._parse_value(blogpost_id)
 
-        node_value = self._get_value(node.data)
+        temp = self.root
+        while temp is not None:
+            node_value = self._get_value(temp.data)
+            if blogpost_id == node_value:
+                return temp.data
+            temp = temp.left if blogpost_id < node_value else temp.right
 
-        if blogpost_id == node_value:
-            return node.data
+        return False
 
-        if blogpost_id < node_value and node.left is not None:
-            left_value = self._get_value(node.left.data)
-            if blogpost_id == left_value:
-                return node.left.data
-            return self._search_recursive(blogpost_id, node.left)
+    def _size(self, node) -> int:
+        """
+        Helper method returning the size of a subtree, 0 for None.
+        """
+        return node.size if node is not None else 0
 
-        if blogpost_id > node_value and node.right is not None:
-            right_value = self._get_value(node.right.data)
-            if blogpost_id == right_value:
-                return node.right.data
-            return self._search_recursive(blogpost_id, node.right)
+    def __len__(self) -> int:
+        """
+        Number of nodes of the tree.
+        Runtime: O(1)
+        """
+        return self._size(self.root)
 
-        return False
+    def in_order(self, lo=None, hi=None, reverse: bool = False):
+        """
+        Lazily generate the data in ascending order (descending order if
+        `reverse`), optionally only the data whose value is between `lo`
+        and `hi` (both included).
+        Subtrees out of the bounds are never visited, and the explicit
+        stack avoids the recursion limit on a skewed tree.
+        Runtime: O(h + k)  # k is the number of data generated
+        """
+        if reverse:
+            yield from self._reverse_in_order(lo, hi)
+            return
 
-    def search(self, blogpost_id: str) -> BlogPost | bool:
+        stack: list[Node] = []
+        temp = self.root
+        while stack or temp is not None:
+            if temp is not None:
+                if lo is not None and self._get_value(temp.data) < lo:
+                    # the node and its left subtree are below the bounds
+                    temp = temp.right
+                    continue
+                stack.append(temp)
+                temp = temp.left
+                continue
+
+            temp = stack.pop()
+            if hi is not None and self._get_value(temp.data) > hi:
+                # every remaining node is above the bounds
+                return
+            yield temp.data
+            temp = temp.right
+
+    def _reverse_in_order(self, lo, hi):
         """
-        Search for blogpost by its ID.
+        Private method used only by the in_order() method.
+        Mirror of the ascending traversal, right subtrees first.
         """
-        # the blogpost_id from the URL is a string
-        blogpost_id = int(blogpost_id)
+        stack: list[Node] = []
+        temp = self.root
+        while stack or temp is not None:
+            if temp is not None:
+                if hi is not None and self._get_value(temp.data) > hi:
+                    # the node and its right subtree are above the bounds
+                    temp = temp.left
+                    continue
+                stack.append(temp)
+                temp = temp.right
+                continue
 
-        if self.root is None:
-            return False
+            temp = stack.pop()
+            if lo is not None and self._get_value(temp.data) < lo:
+                # every remaining node is below the bounds
+                return
+            yield temp.data
+            temp = temp.left
+
+    def __iter__(self):
+        """
+        Generate the data in ascending order.
+        Runtime: O(n)
+        """
+        return self.in_order()
+
+    def range(self, lo, hi) -> list:
+        """
+        Get the data whose value is between `lo` and `hi` (both included),
+        in ascending order.
+        Runtime: O(h + k)  # k is the number of data returned
+        """
+        return list(self.in_order(lo, hi))
+
+    def min(self):
+        """
+        Get the data with the smallest value, None for an empty tree.
+        Runtime: O(h)
+        """
+        temp = self.root
+        if temp is None:
+            return None
+        while temp.left is not None:
+            temp = temp.left
+        return temp.data
 
-        # _search_recursive is a private method (starts with _)
-        return self._search_recursive(blogpost_id, self.root)
+    def max(self):
+        """
+        Get the data with the greatest value, None for an empty tree.
+        Runtime: O(h)
+        """
+        temp = self.root
+        if temp is None:
+            return None
+        while temp.right is not None:
+            temp = temp.right
+        return temp.data
+
+    def floor(self, value):
+        """
+        Get the data with the greatest value lower than or equal to `value`,
+        None if there is none.
+        Runtime: O(h)
+        """
+        result = None
+        temp = self.root
+        while temp is not None:
+            node_value = self._get_value(temp.data)
+            if node_value == value:
+                return temp.data
+            if node_value < value:
+                result = temp.data
+                temp = temp.right
+            else:
+                temp = temp.left
+        return result
+
+    def ceiling(self, value):
+        """
+        Get the data with the smallest value greater than or equal to `value`,
+        None if there is none.
+        Runtime: O(h)
+        """
+        result = None
+        temp = self.root
+        while temp is not None:
+            node_value = self._get_value(temp.data)
+            if node_value == value:
+                return temp.data
+            if node_value > value:
+                result = temp.data
+                temp = temp.left
+            else:
+                temp = temp.right
+        return result
+
+    def rank(self, value) -> int:
+        """
+        Number of data whose value is strictly lower than `value`.
+        Runtime: O(h)
+        """
+        rank: int = 0
+        temp = self.root
+        while temp is not None:
+            node_value = self._get_value(temp.data)
+            if value <= node_value:
+                temp = temp.left
+            else:
+                rank += self._size(temp.left) + 1
+                temp = temp.right
+        return rank
+
+    def select(self, index: int):
+        """
+        Get the data at position `index` (0-based) in ascending order,
+        None if the index is out of range.
+        Runtime: O(h)
+        """
+        if not 0 <= index < len(self):
+            return None
+
+        temp = self.root
+        while True:
+            left_size: int = self._size(temp.left)
+            if index < left_size:
+                temp = temp.left
+            elif index == left_size:
+                return temp.data
+            else:
+                index -= left_size + 1
+                temp = temp.right
+
+    def height(self) -> int:
+        """
+        Height of the tree, 0 for an empty tree.
+        Computed level by level, so a degenerate tree does not
+        hit the recursion limit.
+        Runtime: O(n)
+        """
+        height: int = 0
+        level = [self.root] if self.root is not None else []
+        while level:
+            height += 1
+            level = [
+                child
+                for node in level
+                for child in (node.left, node.right)
+                if child is not None
+            ]
+        return height
+
+
+class AVLNode(Node):
+    """
+    Modelisation of a Node of an AVL Tree.
+    """
+
+    __slots__ = ("height",)
+
+    def __init__(self, data=None) -> None:
+        """
+        Initialisation.
+        A new node is always a leaf, so its height is 1.
+        """
+        super().__init__(data)
+        self.height = 1
+
+
+class AVLTree(BST):
+    """
+    Modelisation of a self-balancing Binary Search Tree (AVL Tree).
+    The heights of the two subtrees of any node differ by at most one,
+    so insert, search and delete are O(log n) whatever the insertion order.
+    """
+
+    def _height(self, node) -> int:
+        """
+        Helper method returning the height of a node, 0 for None.
+        """
+        return node.height if node is not None else 0
+
+    def _update_node(self, node) -> None:
+        """
+        Helper method recomputing the height and size of a node
+        from its children.
+        """
+        node.height = 1 + max(self._height(node.left), self._height(node.right))
+        node.size = 1 + self._size(node.left) + self._size(node.right)
+
+    def _balance_factor(self, node) -> int:
+        """
+        Helper method returning the height difference of the subtrees.
+        """
+        return self._height(node.left) - self._height(node.right)
+
+    def _rotate_left(self, node):
+        """
+        Rotate the subtree rooted at `node` to the left,
+        and return the new root of the subtree.
+
+              node                 right
+             /    \\               /     \\
+            a    right    ->    node     c
+                /     \\        /    \\
+               b       c      a      b
+        """
+        right = node.right
+        node.right = right.left
+        right.left = node
+        self._update_node(node)
+        self._update_node(right)
+        return right
+
+    def _rotate_right(self, node):
+        """
+        Rotate the subtree rooted at `node` to the right,
+        and return the new root of the subtree.
+        """
+        left = node.left
+        node.left = left.right
+        left.right = node
+        self._update_node(node)
+        self._update_node(left)
+        return left
+
+    def _rebalance(self, node):
+        """
+        Restore the AVL property of `node` after an insertion or deletion
+        in one of its subtrees, and return the new root of the subtree.
+        """
+        self._update_node(node)
+        balance: int = self._balance_factor(node)
+
+        if balance > 1:
+            # left-right case
+            if self._balance_factor(node.left) < 0:
+                node.left = self._rotate_left(node.left)
+            return self._rotate_right(node)
+
+        if balance < -1:
+            # right-left case
+            if self._balance_factor(node.right) > 0:
+                node.right = self._rotate_right(node.right)
+            return self._rotate_left(node)
+
+        return node
+
+    def _build_balanced(self, items: list, lo: int, hi: int):
+        """
+        Private method used only by the from_sorted() method.
+        Same as BST._build_balanced, also setting the height and size
+        of each node.
+        """
+        if lo > hi:
+            return None
+
+        mid: int = (lo + hi) // 2
+        node = AVLNode(items[mid])
+        node.left = self._build_balanced(items, lo, mid - 1)
+        node.right = self._build_balanced(items, mid + 1, hi)
+        self._update_node(node)
+        return node
+
+    def _insert_recursive(self, data, data_order, node):
+        """
+        Private method used only by the insert() method.
+        Recursively insert the data at the position `data_order`
+        (see `_get_order`), then rebalance each node on the way up.
+        The recursion depth is bounded by the height, O(log n).
+        """
+        if node is None:
+            return AVLNode(data)
+
+        node_order = self._get_order(node.data)
+
+        if data_order < node_order:
+            node.left = self._insert_recursive(data, data_order, node.left)
+        elif data_order > node_order:
+            node.right = self._insert_recursive(data, data_order, node.right)
+        else:
+            # a BST should not contain duplicates
+            return node
+
+        return self._rebalance(node)
+
+    def insert(self, data) -> None:
+        """
+        Insert a node with the data `data` in the AVL Tree.
+        Runtime: O(log n)
+        """
+        self.root = self._insert_recursive(data, self._get_order(data), self.root)
+
+    def _delete_recursive(self, order, node):
+        """
+        Private method used only by the delete() method.
+        Recursively remove the node at the position `order`
+        (see `_get_order`), then rebalance each node on the way up.
+        """
+        if node is None:
+            return None
+
+        node_order = self._get_order(node.data)
+
+        if order < node_order:
+            node.left = self._delete_recursive(order, node.left)
+        elif order > node_order:
+            node.right = self._delete_recursive(order, node.right)
+        else:
+            if node.left is None:
+                return node.right
+            if node.right is None:
+                return node.left
+            # two children: replace by the in-order successor
+            successor = node.right
+            while successor.left is not None:
+                successor = successor.left
+            node.data = successor.data
+            node.right = self._delete_recursive(
+                self._get_order(successor.data), node.right
+            )
+
+        return self._rebalance(node)
+
+    def delete(self, blogpost_id: str, data_id: int | None = None) -> None:
+        """
+        Delete the blogpost with the ID `blogpost_id` (or with this `key`
+        value and the ID `data_id`, required), if it exists.
+        Runtime: O(log n)
+        """
+        value = self._parse_value(blogpost_id)
+        if self.key is None:
+            order = value
+        elif data_id is None:
+            raise ValueError(f"data of key {value!r} without ID to break the ties")
+        else:
+            order = value, data_id
+        self.root = self._delete_recursive(order, self.root)
+
+    def height(self) -> int:
+        """
+        Height of the tree, 0 for an empty tree.
+        Runtime: O(1)
+        """
+        return self._height(self.root)
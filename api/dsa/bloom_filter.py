@@ -0,0 +1,117 @@
+"""
+Implementation of a Bloom filter.
+"""
+
+import hashlib
+import math
+from collections.abc import Iterable
+
+LN2 = math.log(2)
+
+
+class BloomFilter:
+    """
+    Modelisation of a Bloom filter: a set which only tells if a key is
+    possibly present, or definitely absent, in a fixed array of bits.
+
+    Visual representation of a Bloom filter of 16 bits with 3 hashes,
+    after adding "alice" (bits 1, 6, 11) and "bob" (bits 3, 6, 14):
+
+        bit   0123 4567 8901 2345
+        set   0101 0010 0001 0010
+
+    A key is possibly present when its 3 bits are all set.
+
+    The keys are not stored, and cannot be removed.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01) -> None:
+        """
+        Initialization.
+        The filter is sized so that the probability of false positive stays
+        below `error_rate` until `capacity` keys are added:
+        m = -capacity * ln(error_rate) / ln(2)^2 bits,
+        and k = m / capacity * ln(2) hashes per key.
+        Runtime: O(m)
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be a positive integer")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+
+        self.capacity = capacity
+        self.error_rate = error_rate
+        # number of bits
+        self.size: int = math.ceil(-capacity * math.log(error_rate) / LN2**2)
+        # number of hashes per key
+        self.hash_count: int = max(1, round(self.size / capacity * LN2))
+        # 8 bits per byte, the bit i is the bit i % 8 of the byte i // 8
+        self.bits = bytearray((self.size + 7) // 8)
+        # number of keys added, duplicates included
+        self.count = 0
+
+    def _positions(self, key) -> list[int]:
+        """
+        Private method used to compute the `hash_count` bits of a key.
+        Two independent 64 bits hashes h1 and h2 are taken from one
+        BLAKE2 digest, and the i-th hash is h1 + i * h2 (double hashing),
+        which is as good as k independent hashes for a Bloom filter.
+        Runtime: O(k + length of the key)
+        """
+        if isinstance(key, str):
+            key = key.encode()
+        elif not isinstance(key, bytes):
+            key = repr(key).encode()
+
+        digest = hashlib.blake2b(key, digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        # odd, so that the k positions are distinct when the size allows it
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        size = self.size
+        return [(h1 + i * h2) % size for i in range(self.hash_count)]
+
+    def add(self, key) -> None:
+        """
+        Add a key.
+        Runtime: O(k)
+        """
+        bits = self.bits
+        for position in self._positions(key):
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def update(self, keys: Iterable) -> None:
+        """
+        Add every key of `keys`.
+        Runtime: O(n * k)
+        """
+        for key in keys:
+            self.add(key)
+
+    def __contains__(self, key) -> bool:
+        """
+        Check if the key is possibly present. False means the key has
+        definitely not been added, True may be a false positive.
+        Runtime: O(k)
+        """
+        bits = self.bits
+        for position in self._positions(key):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def __len__(self) -> int:
+        """
+        Number of keys added, duplicates included.
+        Runtime: O(1)
+        """
+        return self.count
+
+    def estimated_error_rate(self) -> float:
+        """
+        Probability of false positive after the keys added so far,
+        (1 - e^(-k * n / m))^k.
+        Runtime: O(1)
+        """
+        k = self.hash_count
+        return (1 - math.exp(-k * self.count / self.size)) ** k
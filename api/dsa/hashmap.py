@@ -2,12 +2,42 @@
 Implementation of a HashMap.
 """
 
+import math
+from collections.abc import Callable, Hashable, Iterable
+
+FNV_OFFSET_BASIS: int = 0xCBF29CE484222325
+FNV_PRIME: int = 0x100000001B3
+MASK_64: int = 0xFFFFFFFFFFFFFFFF
+
+
+def fnv1a_hash(key: Hashable) -> int:
+    """
+    64-bit FNV-1a hash of a key.
+    Strings are hashed over their UTF-8 bytes, bytes are hashed as is,
+    any other hashable key is hashed over the 8 bytes of hash(key),
+    so keys that compare equal (1, 1.0, True) get the same hash.
+    Runtime: O(n)  # n is the length of the key in bytes
+    """
+    if isinstance(key, str):
+        data = key.encode("utf-8")
+    elif isinstance(key, (bytes, bytearray)):
+        data = key
+    else:
+        data = (hash(key) & MASK_64).to_bytes(8, "little")
+
+    h: int = FNV_OFFSET_BASIS
+    for byte in data:
+        h = ((h ^ byte) * FNV_PRIME) & MASK_64
+    return h
+
 
 class Node:
     """
     Modelisation of a Node.
     """
 
+    __slots__ = ("data", "next")
+
     def __init__(self, data: "Data" = None, next=None) -> None:
         """
         Initialization.
@@ -22,13 +52,18 @@ class Data:
     Modelisation of a Data.
     """
 
-    def __init__(self, key: str, value) -> None:
+    __slots__ = ("key", "value", "hash_value")
+
+    def __init__(self, key: Hashable, value, hash_value: int = None) -> None:
         """
         Initialization.
+        `hash_value` is the full hash of the key, kept to rehash
+        without calling the hash function again.
         Runtime: O(1)
         """
         self.key = key
         self.value = value
+        self.hash_value = hash_value
 
 
 class HashMap:
@@ -36,76 +71,357 @@ class HashMap:
     Modelisation of a HashMap.
     """
 
-    def __init__(self, size: int) -> None:
+    def __init__(
+        self,
+        size: int = 8,
+        load_factor: float = 0.75,
+        hash_fn: Callable[[Hashable], int] = fnv1a_hash,
+        min_load_factor: float = 0.0,
+    ) -> None:
         """
         Initialization.
+        `size` is the initial number of buckets, `load_factor` is the
+        maximum ratio of entries per bucket before the table is grown,
+        `hash_fn` maps a key to a non-negative integer (FNV-1a by default),
+        `min_load_factor` is the ratio under which a removal halves the
+        table, never below its initial size (0 disables shrinking).
         Runtime: O(size)
         """
+        if size < 1:
+            raise ValueError("size must be a positive integer")
+        if load_factor <= 0:
+            raise ValueError("load_factor must be strictly positive")
+        if not 0 <= min_load_factor < load_factor / 2:
+            raise ValueError("min_load_factor must be lower than load_factor / 2")
+
         self.size = size
+        self.initial_size = size
+        self.load_factor = load_factor
+        self.min_load_factor = min_load_factor
+        self.hash_fn = hash_fn
+        # number of entries currently stored in the hash_table
+        self.count = 0
         # self.hash_table = [None] * size
         self.hash_table = [None for i in range(size)]
 
-    def hash_key(self, key: str) -> int:
+    @classmethod
+    def from_items(
+        cls,
+        items: Iterable,
+        expected_size: int = None,
+        load_factor: float = 0.75,
+        hash_fn: Callable[[Hashable], int] = fnv1a_hash,
+    ) -> "HashMap":
         """
-        Convert the string key into a int hash_value so that,
-        0 <= hash_value < len(hash_table)
-        Runtime: O(n)  # n is the length of the string key
+        Build a hashmap from (key, value) pairs or a mapping.
+        The hash_table is sized once for `expected_size` entries
+        (the length of `items` when not given), so no rehash happens
+        while inserting.
+        Runtime: O(n)
         """
-        s: int = sum(ord(c) for c in key)
+        if expected_size is None:
+            expected_size = len(items) if hasattr(items, "__len__") else 0
 
-        return s % len(self.hash_table)
+        size: int = max(1, math.ceil(expected_size / load_factor))
+        hashmap = cls(size, load_factor=load_factor, hash_fn=hash_fn)
+        hashmap.update(items)
+        return hashmap
 
-    def add_key_value(self, key: str, value) -> None:
+    def hash_key(self, key: Hashable) -> int:
         """
-        Add a key value pair to the hash_table.
-        Runtime: O(1), when no collision (desired behavior)
+        Convert the key into a int hash_value so that,
+        0 <= hash_value < len(hash_table)
+        Runtime: O(n)  # n is the length of the key
+        """
+        return self.hash_fn(key) % len(self.hash_table)
+
+    def add_key_value(self, key: Hashable, value) -> None:
+        """
+        Add a key value pair to the hash_table, or replace the value
+        if the key already exists.
+        The hash_table doubles its size once the number of entries
+        exceeds `load_factor * len(hash_table)`.
+        Runtime: O(1) amortized, when no collision (desired behavior)
 
         Visual representation of a hash_table of size 4:
 
             [
         [0]     [ 'hello', 'world' ] -> None  # hashing key `hello` result to 0
-        [1]     [ 'hi', 'there' ] -> [ 'ih', 'aya' ] -> None  # collision because hashing `hi` and `ih` keys result to the same result 1 with size 4
+        [1]     [ 'hi', 'there' ] -> [ 'ih', 'aya' ] -> None  # collision because hashing `hi` and `ih` keys result to the same bucket 1 with size 4
         [2]     None,
         [3]     None,
             ]
         """
-        hashed_key: int = self.hash_key(key)
+        hash_value: int = self.hash_fn(key)
+        hashed_key: int = hash_value % len(self.hash_table)
         if self.hash_table[hashed_key] is None:
-            node = Node(Data(key, value), None)
+            node = Node(Data(key, value, hash_value), None)
             self.hash_table[hashed_key] = node
         else:
             # collision here
             temp = self.hash_table[hashed_key]  # temp is the head
-            while temp.next:
+            while True:
+                # the key already exists, replace its value (upsert)
+                if temp.data.hash_value == hash_value and temp.data.key == key:
+                    temp.data.value = value
+                    return
+                if temp.next is None:
+                    break
                 temp = temp.next
 
             # at this stage, next node is None
             # so, temp is at the tail node
             # create the new node pointing to None
-            node = Node(Data(key, value), None)
+            node = Node(Data(key, value, hash_value), None)
             temp.next = node
 
-    def get_value(self, key: str):
+        self.count += 1
+        if self.count > self.load_factor * len(self.hash_table):
+            self._resize(2 * len(self.hash_table))
+
+    def reserve(self, expected_size: int) -> None:
+        """
+        Grow the hash_table once so that it can hold `expected_size`
+        entries without crossing the load factor.
+        Runtime: O(n + size)
+        """
+        new_size: int = len(self.hash_table)
+        while expected_size > self.load_factor * new_size:
+            new_size *= 2
+        if new_size != len(self.hash_table):
+            self._resize(new_size)
+
+    def update(self, items: Iterable) -> None:
+        """
+        Add or replace every (key, value) pair of `items` (or of a mapping).
+        When the number of items is known, the hash_table is grown
+        once up front, then the pairs are inserted in a tight loop.
+        Runtime: O(n) amortized
+        """
+        if hasattr(items, "items"):
+            items = items.items()
+        if hasattr(items, "__len__"):
+            self.reserve(self.count + len(items))
+
+        # local variables avoid attribute lookups inside the loop
+        hash_fn = self.hash_fn
+        table = self.hash_table
+        size: int = len(table)
+        limit: float = self.load_factor * size
+        count: int = self.count
+
+        try:
+            for key, value in items:
+                hash_value: int = hash_fn(key)
+                hashed_key: int = hash_value % size
+                temp = table[hashed_key]
+                if temp is None:
+                    table[hashed_key] = Node(Data(key, value, hash_value), None)
+                else:
+                    while temp.next and not (
+                        temp.data.hash_value == hash_value and temp.data.key == key
+                    ):
+                        temp = temp.next
+                    if temp.data.hash_value == hash_value and temp.data.key == key:
+                        # the key already exists, replace its value (upsert)
+                        temp.data.value = value
+                        continue
+                    temp.next = Node(Data(key, value, hash_value), None)
+
+                count += 1
+                if count > limit:
+                    # the number of items was unknown, grow as add_key_value does
+                    self.count = count
+                    self._resize(2 * size)
+                    table = self.hash_table
+                    size = len(table)
+                    limit = self.load_factor * size
+        finally:
+            # keep the count right even if a key cannot be hashed
+            self.count = count
+
+    def _resize(self, new_size: int) -> None:
+        """
+        Private method used to grow or shrink the hash_table.
+        Rehash every node into a table of `new_size` buckets, keeping
+        the relative order of the nodes inside each chain.
+        Nodes are relinked, not reallocated.
+        Runtime: O(n), amortized O(1) per add_key_value since the
+        table size doubles each time
+        """
+        old_table = self.hash_table
+        self.hash_table = [None for i in range(new_size)]
+        self.size = new_size
+        # keep track of the tail of each new chain to append in O(1)
+        tails = [None for i in range(new_size)]
+
+        for head in old_table:
+            temp = head
+            while temp:
+                next_node = temp.next
+                temp.next = None
+                hashed_key: int = temp.data.hash_value % new_size
+                if tails[hashed_key] is None:
+                    self.hash_table[hashed_key] = temp
+                else:
+                    tails[hashed_key].next = temp
+                tails[hashed_key] = temp
+                temp = next_node
+
+    def _find_node(self, key: Hashable) -> Node | None:
+        """
+        Private method used to find the node holding `key`.
+        Runtime: O(1), when no collision (desired behavior)
+        """
+        hash_value: int = self.hash_fn(key)
+        temp: Node = self.hash_table[hash_value % len(self.hash_table)]
+        while temp:
+            if temp.data.hash_value == hash_value and temp.data.key == key:
+                return temp
+            temp = temp.next
+
+        return None
+
+    def get_value(self, key: Hashable):
+        """
+        Get a value by its key, None if the key does not exist.
+        Runtime: O(1), when no collision (desired behavior)
+        """
+        node = self._find_node(key)
+        if node is None:
+            return None
+        return node.data.value
+
+    def _remove_node(self, key: Hashable) -> Node | None:
         """
-        Get a value by its key.
+        Private method used to unlink and return the node holding `key`.
         Runtime: O(1), when no collision (desired behavior)
         """
-        hashed_key: int = self.hash_key(key)
-        if self.hash_table[hashed_key] is not None:
-            temp: Node = self.hash_table[hashed_key]
-            # if no collision
-            if temp.next is None:
-                return temp.data.value
-            # if collision
-            while temp.next:
-                if key == temp.data.key:
-                    return temp.data.value
+        hash_value: int = self.hash_fn(key)
+        hashed_key: int = hash_value % len(self.hash_table)
+        prev = None
+        temp: Node = self.hash_table[hashed_key]
+        while temp:
+            if temp.data.hash_value == hash_value and temp.data.key == key:
+                break
+            prev = temp
+            temp = temp.next
+        else:
+            return None
+
+        # unlink the node from its chain
+        if prev is None:
+            self.hash_table[hashed_key] = temp.next
+        else:
+            prev.next = temp.next
+        self.count -= 1
+
+        if (
+            self.count < self.min_load_factor * len(self.hash_table)
+            and len(self.hash_table) // 2 >= self.initial_size
+        ):
+            self._resize(len(self.hash_table) // 2)
+
+        return temp
+
+    def remove(self, key: Hashable):
+        """
+        Remove a key and return its value, None if the key does not exist.
+        The hash_table halves its size once the number of entries falls
+        under `min_load_factor * len(hash_table)`.
+        Runtime: O(1) amortized, when no collision (desired behavior)
+        """
+        node = self._remove_node(key)
+        if node is None:
+            return None
+        return node.data.value
+
+    def items(self):
+        """
+        Generate every (key, value) pair of the hash_table.
+        Runtime: O(n + size)
+        """
+        for head in self.hash_table:
+            temp = head
+            while temp:
+                yield temp.data.key, temp.data.value
                 temp = temp.next
 
-            if key == temp.data.key:
-                return temp.data.value
+    def __len__(self) -> int:
+        """
+        Number of entries.
+        Runtime: O(1)
+        """
+        return self.count
 
-        return None
+    def __contains__(self, key: Hashable) -> bool:
+        """
+        Check if the key exists, even when its value is None.
+        Runtime: O(1), when no collision (desired behavior)
+        """
+        return self._find_node(key) is not None
+
+    def __iter__(self):
+        """
+        Generate every key of the hash_table.
+        Runtime: O(n + size)
+        """
+        for key, _ in self.items():
+            yield key
+
+    def __getitem__(self, key: Hashable):
+        """
+        Get a value by its key, raise KeyError if the key does not exist.
+        Runtime: O(1), when no collision (desired behavior)
+        """
+        node = self._find_node(key)
+        if node is None:
+            raise KeyError(key)
+        return node.data.value
+
+    def __setitem__(self, key: Hashable, value) -> None:
+        """
+        Add or replace a key value pair.
+        Runtime: O(1) amortized
+        """
+        self.add_key_value(key, value)
+
+    def __delitem__(self, key: Hashable) -> None:
+        """
+        Remove a key, raise KeyError if the key does not exist.
+        Runtime: O(1), when no collision (desired behavior)
+        """
+        if self._remove_node(key) is None:
+            raise KeyError(key)
+
+    def stats(self) -> dict:
+        """
+        Report how the keys are distributed over the hash_table.
+        `collisions` is the number of entries sharing their bucket
+        with an entry inserted before them.
+        Runtime: O(n + size)
+        """
+        chain_lengths: list[int] = []
+        for head in self.hash_table:
+            length: int = 0
+            temp = head
+            while temp:
+                length += 1
+                temp = temp.next
+            if length:
+                chain_lengths.append(length)
+
+        occupied: int = len(chain_lengths)
+        return {
+            "buckets": len(self.hash_table),
+            "entries": self.count,
+            "occupied_buckets": occupied,
+            "occupancy": occupied / len(self.hash_table),
+            "load_factor": self.count / len(self.hash_table),
+            "max_chain_length": max(chain_lengths, default=0),
+            "mean_chain_length": self.count / occupied if occupied else 0.0,
+            "collisions": self.count - occupied,
+        }
 
     def print_hash_table(self):
         """
@@ -0,0 +1,231 @@
+"""
+Implementation of a Binary Heap (priority queue).
+"""
+
+from collections.abc import Callable, Iterable
+
+
+class Entry:
+    """
+    Modelisation of an entry of the heap.
+    `push` returns it, as the handle to change the priority of the item.
+    """
+
+    __slots__ = ("item", "priority", "order", "index")
+
+    def __init__(self, item, priority, order: int, index: int) -> None:
+        """
+        Initialization.
+        `order` is the insertion rank, items of equal priority are popped
+        first in, first out. `index` is the position of the entry in the heap.
+        """
+        self.item = item
+        self.priority = priority
+        self.order = order
+        self.index = index
+
+
+class BinaryHeap:
+    """
+    Modelisation of a Binary Heap, stored in a list.
+    The children of the entry at index i are at 2i + 1 and 2i + 2.
+
+    Visual representation of a min heap of the priorities 1, 3, 2, 7, 4:
+
+            1
+          /   \\
+         3     2
+        / \\
+       7   4
+
+        list  [1, 3, 2, 7, 4]
+
+    In a min heap the smallest priority is at the top, in a max heap
+    (`max_heap=True`) the greatest one.
+    """
+
+    def __init__(self, key: Callable | None = None, max_heap: bool = False) -> None:
+        """
+        Initialization.
+        `key` computes the priority of an item pushed without priority,
+        by default the priority is the item itself.
+        """
+        self.key = key
+        self.max_heap = max_heap
+        self.entries: list[Entry] = []
+        # insertion counter
+        self.counter = 0
+
+    def _before(self, a: Entry, b: Entry) -> bool:
+        """
+        Private method used to tell if the entry `a` is closer to the top
+        than the entry `b`.
+        Runtime: O(1)
+        """
+        if a.priority == b.priority:
+            return a.order < b.order
+        if self.max_heap:
+            return a.priority > b.priority
+        return a.priority < b.priority
+
+    def _swap(self, i: int, j: int) -> None:
+        """
+        Private method used to swap two entries, keeping their index.
+        Runtime: O(1)
+        """
+        entries = self.entries
+        entries[i], entries[j] = entries[j], entries[i]
+        entries[i].index = i
+        entries[j].index = j
+
+    def _sift_up(self, i: int) -> None:
+        """
+        Private method used to move an entry up, while it comes
+        before its parent.
+        Runtime: O(log n)
+        """
+        entries = self.entries
+        while i > 0:
+            parent = (i - 1) // 2
+            if not self._before(entries[i], entries[parent]):
+                break
+            self._swap(i, parent)
+            i = parent
+
+    def _sift_down(self, i: int) -> None:
+        """
+        Private method used to move an entry down, while one of its
+        children comes before it.
+        Runtime: O(log n)
+        """
+        entries = self.entries
+        n = len(entries)
+        while True:
+            first = i
+            for child in (2 * i + 1, 2 * i + 2):
+                if child < n and self._before(entries[child], entries[first]):
+                    first = child
+            if first == i:
+                return
+            self._swap(i, first)
+            i = first
+
+    def _priority(self, item, priority):
+        """
+        Private method used to get the priority of a pushed item.
+        """
+        if priority is not None:
+            return priority
+        return self.key(item) if self.key is not None else item
+
+    def push(self, item, priority=None) -> Entry:
+        """
+        Add an item, with its priority (computed by `key` if not given).
+        Return the entry of the item, to change its priority later.
+        Runtime: O(log n)
+        """
+        priority = self._priority(item, priority)
+        entry = Entry(item, priority, self.counter, len(self.entries))
+        self.counter += 1
+        self.entries.append(entry)
+        self._sift_up(entry.index)
+        return entry
+
+    def peek(self):
+        """
+        Return the item at the top without removing it,
+        None if the heap is empty.
+        Runtime: O(1)
+        """
+        if not self.entries:
+            return None
+        return self.entries[0].item
+
+    def pop(self):
+        """
+        Remove and return the item at the top, None if the heap is empty.
+        Runtime: O(log n)
+        """
+        entries = self.entries
+        if not entries:
+            return None
+
+        self._swap(0, len(entries) - 1)
+        top = entries.pop()
+        if entries:
+            self._sift_down(0)
+        top.index = -1
+        return top.item
+
+    def pushpop(self, item, priority=None):
+        """
+        Add an item, then remove and return the item at the top, in a
+        single sift. The item itself is returned, leaving the heap
+        untouched, when it would be at the top.
+        Runtime: O(log n)
+        """
+        entry = Entry(item, self._priority(item, priority), self.counter, 0)
+        self.counter += 1
+        entries = self.entries
+        if not entries or self._before(entry, entries[0]):
+            return item
+
+        top = entries[0]
+        entries[0] = entry
+        self._sift_down(0)
+        top.index = -1
+        return top.item
+
+    def decrease_key(self, entry: Entry, priority) -> None:
+        """
+        Move the item of the entry closer to the top, with a new priority:
+        smaller in a min heap, greater in a max heap.
+        Raise ValueError if the entry is not in the heap, or if the new
+        priority would move it away from the top.
+        Runtime: O(log n)
+        """
+        entries = self.entries
+        index = entry.index
+        if not 0 <= index < len(entries) or entries[index] is not entry:
+            raise ValueError("entry is not in the heap")
+        if priority != entry.priority and (priority > entry.priority) != self.max_heap:
+            raise ValueError("the new priority would move the item away from the top")
+
+        entry.priority = priority
+        self._sift_up(entry.index)
+
+    def __len__(self) -> int:
+        """
+        Number of items.
+        Runtime: O(1)
+        """
+        return len(self.entries)
+
+
+def nlargest(k: int, iterable: Iterable, key: Callable | None = None) -> list:
+    """
+    Return the `k` largest items of `iterable` (by `key` if given), largest
+    first, items of equal key in their order in `iterable`.
+    The items are consumed one at a time while a min heap keeps the k
+    largest seen so far, so the memory used is O(k) whatever the length
+    of `iterable`.
+    Runtime: O(n log k)
+    """
+    if k <= 0:
+        return []
+
+    # the smallest of the k largest is at the top, ready to be replaced,
+    # and of two equal keys the later item is the smaller one
+    heap = BinaryHeap()
+    for order, item in enumerate(iterable):
+        priority = (key(item) if key is not None else item, -order)
+        if len(heap) < k:
+            heap.push(item, priority)
+        elif priority > heap.entries[0].priority:
+            heap.pushpop(item, priority)
+
+    largest = []
+    while heap:
+        largest.append(heap.pop())
+    largest.reverse()
+    return largest
@@ -0,0 +1,192 @@
+"""
+Implementation of an Inverted Index, for full-text search.
+"""
+
+import re
+import sys
+from array import array
+from bisect import bisect_left, insort
+from collections.abc import Callable, Sequence
+
+# a term is a run of letters, digits or underscores
+TOKEN_PATTERN = re.compile(r"\w+")
+
+# galloping pays off when a sequence is this many times longer than the other,
+# below that a hash intersection (in C) is faster than a Python loop
+GALLOP_RATIO = 32
+
+
+def tokenize(text: str | None) -> list[str]:
+    """
+    Split a text into its lowercase terms, in order of appearance.
+    Runtime: O(len(text))
+    """
+    if not text:
+        return []
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def gallop(postings: Sequence[int], target: int, lo: int = 0) -> int:
+    """
+    Index of the first item greater than or equal to `target` in the sorted
+    `postings`, searching from `lo` with steps of 1, 2, 4, ... then by
+    binary search within the last step.
+    Runtime: O(log d), d being the distance between `lo` and the result
+    """
+    n = len(postings)
+    if lo >= n or postings[lo] >= target:
+        return lo
+
+    # postings[previous] < target, the result is in (previous, current]
+    previous, step = lo, 1
+    current = lo + 1
+    while current < n and postings[current] < target:
+        previous = current
+        step *= 2
+        current = previous + step
+    return bisect_left(postings, target, previous + 1, min(current, n))
+
+
+def intersect(small: Sequence[int], large: Sequence[int]) -> list[int]:
+    """
+    Items present in both sorted sequences, in ascending order.
+    Each item of `small` is looked up in `large` by galloping from the
+    previous match, so the cost depends on the shortest sequence.
+    Sequences of similar lengths are intersected with a set instead.
+    Runtime: O(m log(n / m)), m <= n being the lengths of the sequences
+    """
+    if len(small) > len(large):
+        small, large = large, small
+    if len(small) * GALLOP_RATIO > len(large):
+        return sorted(set(small).intersection(large))
+
+    result = []
+    j = 0
+    n = len(large)
+    for item in small:
+        j = gallop(large, item, j)
+        if j == n:
+            break
+        if large[j] == item:
+            result.append(item)
+            j += 1
+    return result
+
+
+def intersect_all(postings: list[Sequence[int]]) -> list[int]:
+    """
+    Items present in every sorted sequence, in ascending order.
+    The sequences are intersected from the shortest one, so that the
+    intermediate results stay as small as possible.
+    """
+    if not postings:
+        return []
+    postings = sorted(postings, key=len)
+    result = list(postings[0])
+    for other in postings[1:]:
+        if not result:
+            break
+        result = intersect(result, other)
+    return result
+
+
+class InvertedIndex:
+    """
+    Modelisation of an Inverted Index.
+
+    Visual representation of the index of the documents
+    1: "hello world", 2: "hello there", 3: "the world":
+
+        hello  -> [1, 2]
+        there  -> [2]
+        the    -> [3]
+        world  -> [1, 3]
+
+    The posting list of each term is the sorted array of the IDs of the
+    documents containing it, 8 bytes per ID.
+    """
+
+    def __init__(self, tokenizer: Callable[[str], list[str]] = tokenize) -> None:
+        """
+        Initialization.
+        """
+        self.tokenizer = tokenizer
+        # term -> sorted array of document IDs
+        self.postings: dict[str, array] = {}
+        # document ID -> its distinct terms, to remove the document
+        self.terms: dict[int, tuple[str, ...]] = {}
+
+    def add(self, doc_id: int, text: str) -> None:
+        """
+        Index the terms of a document, replacing its previous text if any.
+        The documents are usually added by ascending ID, then each posting
+        list grows by its end in O(1).
+        Runtime: O(t) amortized, t being the number of terms of the text
+        """
+        if doc_id in self.terms:
+            self.remove(doc_id)
+
+        # the same term string is shared by every document containing it
+        terms = tuple(sys.intern(term) for term in set(self.tokenizer(text)))
+        self.terms[doc_id] = terms
+        postings = self.postings
+        for term in terms:
+            ids = postings.get(term)
+            if ids is None:
+                postings[term] = array("q", (doc_id,))
+            elif ids[-1] < doc_id:
+                ids.append(doc_id)
+            else:
+                insort(ids, doc_id)
+
+    def remove(self, doc_id: int) -> bool:
+        """
+        Remove a document from the index.
+        Return False if the document is not indexed.
+        Runtime: O(t * p), p being the length of the posting lists
+        """
+        terms = self.terms.pop(doc_id, None)
+        if terms is None:
+            return False
+
+        for term in terms:
+            ids = self.postings[term]
+            i = bisect_left(ids, doc_id)
+            if i < len(ids) and ids[i] == doc_id:
+                del ids[i]
+            if not ids:
+                del self.postings[term]
+        return True
+
+    def search(self, query: str) -> list[int]:
+        """
+        Get the IDs of the documents containing every term of the query
+        (AND), in ascending order.
+        Runtime: O(m log(n / m)) per term, m being the length of the
+        shortest posting list
+        """
+        terms = set(self.tokenizer(query))
+        if not terms:
+            return []
+
+        postings = []
+        for term in terms:
+            ids = self.postings.get(term)
+            if ids is None:
+                return []
+            postings.append(ids)
+        return intersect_all(postings)
+
+    def __len__(self) -> int:
+        """
+        Number of documents.
+        Runtime: O(1)
+        """
+        return len(self.terms)
+
+    def __contains__(self, doc_id: int) -> bool:
+        """
+        Check if the document is indexed.
+        Runtime: O(1)
+        """
+        return doc_id in self.terms
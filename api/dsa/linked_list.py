@@ -8,6 +8,8 @@ class Node:
     Modelisation of a Node.
     """
 
+    __slots__ = ("data", "next")
+
     def __init__(self, data=None, next=None) -> None:
         """
         Initialization.
@@ -101,8 +103,168 @@ class LinkedList:
         """
         temp = self.head
         while temp:
-            if temp.data["id"] is int(user_id):
+            # compare values, identity only holds for small cached ints
+            if temp.data["id"] == int(user_id):
                 return temp.data
             temp = temp.next
 
         return None
+
+
+class DoublyNode(Node):
+    """
+    Modelisation of a Node also linked to its previous node.
+    """
+
+    __slots__ = ("prev",)
+
+    def __init__(self, data=None, next=None, prev=None) -> None:
+        """
+        Initialization.
+        """
+        super().__init__(data, next)
+        self.prev = prev
+
+
+class LinkedHashMap(LinkedList):
+    """
+    Modelisation of a Linked List indexed by key (linked hash map).
+    A dictionary maps each key to its node, so the data keep their
+    order in the list while get, remove and move_to_front are O(1).
+    """
+
+    def __init__(self, key=None) -> None:
+        """
+        Initialization.
+        `key` extracts the key of a data, its "id" by default.
+        Runtime: O(1)
+        """
+        super().__init__()
+        self.key = key if key is not None else (lambda data: data["id"])
+        self.nodes: dict = {}
+
+    def _unlink(self, node: DoublyNode) -> None:
+        """
+        Private method used to detach a node from the list.
+        Runtime: O(1)
+        """
+        if node.prev is None:
+            self.head = node.next
+        else:
+            node.prev.next = node.next
+        if node.next is None:
+            self.tail = node.prev
+        else:
+            node.next.prev = node.prev
+        node.prev = node.next = None
+
+    def _link_to_head(self, node: DoublyNode) -> None:
+        """
+        Private method used to attach a detached node at the head.
+        Runtime: O(1)
+        """
+        node.next = self.head
+        if self.head is None:
+            self.tail = node
+        else:
+            self.head.prev = node
+        self.head = node
+
+    def _link_to_tail(self, node: DoublyNode) -> None:
+        """
+        Private method used to attach a detached node at the tail.
+        Runtime: O(1)
+        """
+        node.prev = self.tail
+        if self.tail is None:
+            self.head = node
+        else:
+            self.tail.next = node
+        self.tail = node
+
+    def add_to_head(self, data) -> None:
+        """
+        Add a node containing 'data' at the beginning of the list.
+        If the key already exists, its data is replaced in place.
+        Runtime: O(1)
+        """
+        key = self.key(data)
+        if key in self.nodes:
+            self.nodes[key].data = data
+            return
+
+        node = DoublyNode(data)
+        self.nodes[key] = node
+        self._link_to_head(node)
+
+    def add_to_tail(self, data) -> None:
+        """
+        Add a node containing 'data' at the end of the list.
+        If the key already exists, its data is replaced in place.
+        Runtime: O(1)
+        """
+        key = self.key(data)
+        if key in self.nodes:
+            self.nodes[key].data = data
+            return
+
+        node = DoublyNode(data)
+        self.nodes[key] = node
+        self._link_to_tail(node)
+
+    def get(self, key):
+        """
+        Get the data of the key `key`, None if it does not exist.
+        Runtime: O(1)
+        """
+        node = self.nodes.get(key)
+        if node is None:
+            return None
+        return node.data
+
+    def get_user_by_id(self, user_id):
+        """
+        Get the node containing the id `user_id`.
+        Runtime: O(1)
+        """
+        return self.get(int(user_id))
+
+    def remove(self, key):
+        """
+        Remove the node of the key `key` and return its data,
+        None if it does not exist.
+        Runtime: O(1)
+        """
+        node = self.nodes.pop(key, None)
+        if node is None:
+            return None
+        self._unlink(node)
+        return node.data
+
+    def move_to_front(self, key) -> bool:
+        """
+        Move the node of the key `key` to the head of the list.
+        Return False if the key does not exist.
+        Runtime: O(1)
+        """
+        node = self.nodes.get(key)
+        if node is None:
+            return False
+        if node is not self.head:
+            self._unlink(node)
+            self._link_to_head(node)
+        return True
+
+    def __len__(self) -> int:
+        """
+        Number of nodes.
+        Runtime: O(1)
+        """
+        return len(self.nodes)
+
+    def __contains__(self, key) -> bool:
+        """
+        Check if the key exists.
+        Runtime: O(1)
+        """
+        return key in self.nodes
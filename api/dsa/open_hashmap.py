@@ -0,0 +1,237 @@
+"""
+Implementation of an open addressing HashMap.
+Entries live in parallel arrays (keys, values, hashes) instead of
+chained Node/Data objects, and collisions are resolved by linear probing.
+"""
+
+from array import array
+from collections.abc import Callable, Hashable
+
+from dsa.hashmap import MASK_64, fnv1a_hash
+
+# markers of the slot states in the keys array
+_EMPTY = object()
+_DELETED = object()  # tombstone, the slot can be reused but probing goes on
+
+
+class OpenHashMap:
+    """
+    Modelisation of an open addressing HashMap.
+
+    Visual representation of a hash_table of size 4:
+
+        keys    [ 'hello', 'hi', <deleted>, <empty> ]
+        values  [ 'world', 'there', None, None ]
+        hashes  [ 0x...04, 0x...c1, 0x...5a, 0 ]
+    """
+
+    def __init__(
+        self,
+        size: int = 8,
+        load_factor: float = 0.6,
+        hash_fn: Callable[[Hashable], int] = fnv1a_hash,
+    ) -> None:
+        """
+        Initialization.
+        `size` is rounded up to a power of two, so that the bucket of a
+        hash is `hash & (size - 1)`. `load_factor` is the maximum ratio of
+        used slots (entries and tombstones) before the table is rebuilt.
+        Runtime: O(size)
+        """
+        if size < 1:
+            raise ValueError("size must be a positive integer")
+        if not 0 < load_factor < 1:
+            raise ValueError("load_factor must be between 0 and 1")
+
+        self.load_factor = load_factor
+        self.hash_fn = hash_fn
+        # number of entries currently stored
+        self.count = 0
+        # number of entries plus tombstones
+        self.used = 0
+        self._allocate(1 << (size - 1).bit_length())
+
+    def _allocate(self, size: int) -> None:
+        """
+        Private method used to (re)create empty parallel arrays.
+        Runtime: O(size)
+        """
+        self.size = size
+        self.mask = size - 1
+        self.keys = [_EMPTY] * size
+        self.values = [None] * size
+        # unsigned 64 bits integers, 8 bytes per slot
+        self.hashes = array("Q", bytes(8 * size))
+
+    def _find_slot(self, key: Hashable, hash_value: int) -> tuple[bool, int]:
+        """
+        Private method used to probe the table for `key`.
+        Return (True, index) when the key is found, otherwise
+        (False, index) where index is the slot to insert the key into.
+        Runtime: O(1) on average, when the load factor is bounded
+        """
+        keys = self.keys
+        hashes = self.hashes
+        mask = self.mask
+        i: int = hash_value & mask
+        tombstone: int = -1
+
+        while True:
+            k = keys[i]
+            if k is _EMPTY:
+                return False, tombstone if tombstone >= 0 else i
+            if k is _DELETED:
+                if tombstone < 0:
+                    tombstone = i
+            elif hashes[i] == hash_value and (k is key or k == key):
+                return True, i
+            i = (i + 1) & mask
+
+    def _resize(self, new_size: int) -> None:
+        """
+        Private method used to rebuild the table without its tombstones.
+        Runtime: O(n)
+        """
+        old_keys, old_values, old_hashes = self.keys, self.values, self.hashes
+        self._allocate(new_size)
+        keys, values, hashes, mask = self.keys, self.values, self.hashes, self.mask
+
+        for k, v, h in zip(old_keys, old_values, old_hashes):
+            if k is _EMPTY or k is _DELETED:
+                continue
+            i = h & mask
+            while keys[i] is not _EMPTY:
+                i = (i + 1) & mask
+            keys[i] = k
+            values[i] = v
+            hashes[i] = h
+
+        self.used = self.count
+
+    def hash_key(self, key: Hashable) -> int:
+        """
+        Convert the key into a int hash_value so that,
+        0 <= hash_value < size
+        Runtime: O(n)  # n is the length of the key
+        """
+        return (self.hash_fn(key) & MASK_64) & self.mask
+
+    def add_key_value(self, key: Hashable, value) -> None:
+        """
+        Add a key value pair, or replace the value of an existing key.
+        The table doubles its size when the entries alone exceed half of
+        the load factor, otherwise it is only cleaned from its tombstones.
+        Runtime: O(1) amortized
+        """
+        hash_value: int = self.hash_fn(key) & MASK_64
+        found, i = self._find_slot(key, hash_value)
+        if found:
+            self.values[i] = value
+            return
+
+        if self.keys[i] is _EMPTY:
+            self.used += 1
+        self.keys[i] = key
+        self.values[i] = value
+        self.hashes[i] = hash_value
+        self.count += 1
+
+        if self.used > self.load_factor * self.size:
+            if self.count > self.load_factor * self.size / 2:
+                self._resize(2 * self.size)
+            else:
+                self._resize(self.size)
+
+    def get_value(self, key: Hashable):
+        """
+        Get a value by its key, None if the key does not exist.
+        Runtime: O(1) on average
+        """
+        # probing is inlined here, lookups do not need the tombstone slot
+        hash_value: int = self.hash_fn(key) & MASK_64
+        keys = self.keys
+        hashes = self.hashes
+        mask = self.mask
+        i: int = hash_value & mask
+
+        while True:
+            k = keys[i]
+            if k is _EMPTY:
+                return None
+            if k is not _DELETED and hashes[i] == hash_value and (k is key or k == key):
+                return self.values[i]
+            i = (i + 1) & mask
+
+    def remove(self, key: Hashable):
+        """
+        Remove a key and return its value, None if the key does not exist.
+        The slot becomes a tombstone so that probing goes past it.
+        Runtime: O(1) on average
+        """
+        found, i = self._find_slot(key, self.hash_fn(key) & MASK_64)
+        if not found:
+            return None
+
+        value = self.values[i]
+        self.keys[i] = _DELETED
+        self.values[i] = None
+        self.count -= 1
+        return value
+
+    def items(self):
+        """
+        Generate every (key, value) pair of the table.
+        Runtime: O(size)
+        """
+        for k, v in zip(self.keys, self.values):
+            if k is not _EMPTY and k is not _DELETED:
+                yield k, v
+
+    def __len__(self) -> int:
+        """
+        Number of entries.
+        Runtime: O(1)
+        """
+        return self.count
+
+    def __contains__(self, key: Hashable) -> bool:
+        """
+        Check if the key exists, even when its value is None.
+        Runtime: O(1) on average
+        """
+        found, _ = self._find_slot(key, self.hash_fn(key) & MASK_64)
+        return found
+
+    def __iter__(self):
+        """
+        Generate every key of the table.
+        Runtime: O(size)
+        """
+        for key, _ in self.items():
+            yield key
+
+    def __getitem__(self, key: Hashable):
+        """
+        Get a value by its key, raise KeyError if the key does not exist.
+        Runtime: O(1) on average
+        """
+        found, i = self._find_slot(key, self.hash_fn(key) & MASK_64)
+        if not found:
+            raise KeyError(key)
+        return self.values[i]
+
+    def __setitem__(self, key: Hashable, value) -> None:
+        """
+        Add or replace a key value pair.
+        Runtime: O(1) amortized
+        """
+        self.add_key_value(key, value)
+
+    def __delitem__(self, key: Hashable) -> None:
+        """
+        Remove a key, raise KeyError if the key does not exist.
+        Runtime: O(1) on average
+        """
+        if key not in self:
+            raise KeyError(key)
+        self.remove(key)
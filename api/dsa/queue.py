@@ -3,8 +3,12 @@ Implementation of a Queue.
 Insertion and Deletion follows FIFO (First In First Out) principle.
 """
 
+import threading
+
 
 class Node:
+    __slots__ = ("data", "next")
+
     def __init__(self, data, next) -> None:
         """
         Modelisation of a Node.
@@ -49,3 +53,212 @@ class Queue:
         if self.head is None:
             self.tail = None
         return removed_node
+
+
+class RingBufferQueue:
+    """
+    Modelisation of a Queue backed by a preallocated list (ring buffer).
+    `head` is the index of the first element, the elements wrap around
+    the end of the buffer, so enqueue and dequeue never shift nor
+    allocate a node. The buffer doubles its size when it is full.
+
+    Visual representation of a buffer of size 4 holding 3 elements:
+
+        [ 'c', None, 'a', 'b' ]  # head = 2, count = 3
+    """
+
+    # what to do when enqueuing in a queue holding `maxsize` elements
+    OVERFLOW_POLICIES = ("error", "drop_oldest", "drop_newest", "block")
+
+    def __init__(
+        self, capacity: int = 16, maxsize: int = None, overflow: str = "error"
+    ) -> None:
+        """
+        Initialization.
+        `capacity` is the initial size of the buffer, `maxsize` the optional
+        maximum number of elements. When the queue is full, `overflow` is:
+        - "error": raise OverflowError
+        - "drop_oldest": dequeue the oldest elements to make room
+        - "drop_newest": ignore the new elements
+        - "block": wait until a consumer makes room
+        Runtime: O(capacity)
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be a positive integer")
+        if maxsize is not None and maxsize < 1:
+            raise ValueError("maxsize must be a positive integer")
+        if overflow not in self.OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {self.OVERFLOW_POLICIES}")
+
+        if maxsize is not None:
+            capacity = min(capacity, maxsize)
+        self.buffer = [None] * capacity
+        self.head = 0
+        self.count = 0
+        self.maxsize = maxsize
+        self.overflow = overflow
+        # wakes up producers blocked on a full queue
+        self.not_full = threading.Condition()
+
+    def __len__(self) -> int:
+        """
+        Number of elements.
+        Runtime: O(1)
+        """
+        return self.count
+
+    def _reserve(self, size: int) -> None:
+        """
+        Private method used to grow the buffer, doubling its size, until it
+        can hold `size` elements. The elements are moved to the beginning.
+        Runtime: O(n), amortized O(1) per element
+        """
+        capacity: int = len(self.buffer)
+        if size <= capacity:
+            return
+        while capacity < size:
+            capacity *= 2
+        if self.maxsize is not None:
+            capacity = min(capacity, self.maxsize)
+
+        self.buffer = self._to_list() + [None] * (capacity - self.count)
+        self.head = 0
+
+    def _to_list(self) -> list:
+        """
+        Private method returning the elements, from the oldest to the newest.
+        Runtime: O(n)
+        """
+        end: int = self.head + self.count
+        if end <= len(self.buffer):
+            return self.buffer[self.head : end]
+        return self.buffer[self.head :] + self.buffer[: end - len(self.buffer)]
+
+    def _write(self, items: list) -> None:
+        """
+        Private method used to copy `items` after the last element,
+        in at most two slices. The buffer must have room for them.
+        Runtime: O(k)
+        """
+        capacity: int = len(self.buffer)
+        tail: int = (self.head + self.count) % capacity
+        first: int = min(len(items), capacity - tail)
+        self.buffer[tail : tail + first] = items[:first]
+        self.buffer[: len(items) - first] = items[first:]
+        self.count += len(items)
+
+    def _make_room(self, size: int, timeout: float = None) -> int:
+        """
+        Private method applying the overflow policy before enqueuing `size`
+        elements, and returning how many of them can be enqueued.
+        Must be called holding the `not_full` lock.
+        """
+        if self.maxsize is None:
+            return size
+
+        free: int = self.maxsize - self.count
+        if size <= free:
+            return size
+
+        if self.overflow == "error":
+            raise OverflowError("the queue is full")
+        if self.overflow == "drop_newest":
+            return free
+        if self.overflow == "drop_oldest":
+            size = min(size, self.maxsize)
+            self._read(size - free)
+            return size
+
+        # block until a consumer dequeues at least one element
+        if not self.not_full.wait_for(lambda: self.count < self.maxsize, timeout):
+            raise OverflowError("the queue is still full after the timeout")
+        return min(size, self.maxsize - self.count)
+
+    def enqueue(self, data, timeout: float = None) -> None:
+        """
+        Add an element to the end of the Queue.
+        `timeout` is the maximum time to wait with the "block" policy.
+        Runtime: O(1) amortized
+        """
+        with self.not_full:
+            if self._make_room(1, timeout):
+                self._reserve(self.count + 1)
+                self._write([data])
+
+    def enqueue_many(self, items, timeout: float = None) -> None:
+        """
+        Add the elements of `items` to the end of the Queue, in order.
+        With the "drop_oldest" policy and more items than `maxsize`,
+        only the last `maxsize` items are kept. With the "drop_newest"
+        policy, the items that do not fit are ignored.
+        Runtime: O(k) amortized
+        """
+        items = list(items)
+        with self.not_full:
+            if self.maxsize is not None and self.overflow == "drop_oldest":
+                items = items[-self.maxsize :]
+            while items:
+                size: int = self._make_room(len(items), timeout)
+                self._reserve(self.count + size)
+                self._write(items[:size])
+                if self.overflow != "block":
+                    return
+                items = items[size:]
+
+    def _read(self, n: int) -> list:
+        """
+        Private method removing and returning the `n` oldest elements,
+        in at most two slices. The slots are cleared so that the buffer
+        does not keep the elements alive.
+        Runtime: O(k)
+        """
+        capacity: int = len(self.buffer)
+        end: int = self.head + n
+        if end <= capacity:
+            items = self.buffer[self.head : end]
+            self.buffer[self.head : end] = [None] * n
+        else:
+            items = self.buffer[self.head :] + self.buffer[: end - capacity]
+            self.buffer[self.head :] = [None] * (capacity - self.head)
+            self.buffer[: end - capacity] = [None] * (end - capacity)
+
+        self.head = end % capacity
+        self.count -= n
+        return items
+
+    def dequeue(self):
+        """
+        Remove and return the element at the head of the Queue,
+        None if the Queue is empty.
+        Runtime: O(1)
+        """
+        with self.not_full:
+            if self.count == 0:
+                return None
+            data = self._read(1)[0]
+            self.not_full.notify()
+            return data
+
+    def dequeue_many(self, n: int) -> list:
+        """
+        Remove and return the `n` elements at the head of the Queue,
+        oldest first, or every element if the Queue holds fewer than `n`.
+        Runtime: O(k)
+        """
+        if n <= 0:
+            return []
+        with self.not_full:
+            items = self._read(min(n, self.count))
+            if items:
+                self.not_full.notify_all()
+            return items
+
+    def peek(self):
+        """
+        Return the element at the head of the Queue without removing it,
+        None if the Queue is empty.
+        Runtime: O(1)
+        """
+        if self.count == 0:
+            return None
+        return self.buffer[self.head]
@@ -0,0 +1,293 @@
+"""
+Implementation of an indexable Skip List.
+"""
+
+import random
+
+
+class Node:
+    """
+    Modelisation of a Node.
+    """
+
+    __slots__ = ("data", "key", "next", "width", "prev")
+
+    def __init__(self, data=None, key=None, level: int = 1) -> None:
+        """
+        Initialization.
+        `next[i]` is the following node on level i, and `width[i]` the number
+        of nodes of the bottom level it skips over (itself included).
+        `prev` links the bottom level backwards, for reverse iteration.
+        """
+        self.data = data
+        self.key = key
+        self.next = [None] * level
+        self.width = [1] * level
+        self.prev = None
+
+
+class SkipList:
+    """
+    Modelisation of an indexable Skip List.
+
+    Visual representation of the levels of a Skip List of 5 users:
+
+        level 2  head ------------------> 3 -----------------> None
+        level 1  head ------> 2 --------> 3 ------> 4 -------> None
+        level 0  head -> 1 -> 2 -> 3 ------> 4 -> 5 -> None
+
+    By default, the data are ordered by ID. A `key` callable orders them
+    by any other value.
+    """
+
+    def __init__(
+        self,
+        key=None,
+        max_level: int = 32,
+        p: float = 0.5,
+        seed: int | None = None,
+    ) -> None:
+        """
+        Initialization.
+        Each node is promoted to the next level with probability `p`,
+        up to `max_level` levels. `seed` makes the levels reproducible.
+        """
+        if max_level < 1:
+            raise ValueError("max_level must be a positive integer")
+        if not 0 < p < 1:
+            raise ValueError("p must be between 0 and 1")
+
+        self.key = key
+        self.max_level = max_level
+        self.p = p
+        self.random = random.Random(seed)
+        self.head = Node(level=max_level)
+        self.tail = None
+        # number of levels currently in use
+        self.level = 1
+        self.count = 0
+
+    def _get_key(self, data):
+        """
+        Private method used to extract the comparison value from data.
+        If the list has a `key` callable, use the value it returns.
+        If data is a dictionary with an 'id' key, use that value.
+        Otherwise, use the data value directly.
+        """
+        if self.key is not None:
+            return self.key(data)
+        if isinstance(data, dict) and "id" in data:
+            return data["id"]
+        return data
+
+    def _random_level(self) -> int:
+        """
+        Private method used to draw the number of levels of a new node.
+        Runtime: O(1) expected
+        """
+        level = 1
+        while level < self.max_level and self.random.random() < self.p:
+            level += 1
+        return level
+
+    def _find_predecessors(self, key) -> tuple[list, list]:
+        """
+        Private method used to find, on each level, the last node whose
+        key is lower than `key`, and its position (the head being 0).
+        Runtime: O(log n) expected
+        """
+        update = [self.head] * self.max_level
+        positions = [0] * self.max_level
+        node = self.head
+        position = 0
+
+        for i in reversed(range(self.level)):
+            while node.next[i] is not None and node.next[i].key < key:
+                position += node.width[i]
+                node = node.next[i]
+            update[i] = node
+            positions[i] = position
+
+        return update, positions
+
+    def insert(self, data) -> None:
+        """
+        Add data, or replace the data of an existing key.
+        Runtime: O(log n) expected
+        """
+        key = self._get_key(data)
+        update, positions = self._find_predecessors(key)
+
+        candidate = update[0].next[0]
+        if candidate is not None and candidate.key == key:
+            candidate.data = data
+            return
+
+        level = self._random_level()
+        if level > self.level:
+            for i in range(self.level, level):
+                # the head skips over every node to reach the end
+                self.head.width[i] = self.count + 1
+            self.level = level
+
+        node = Node(data, key, level)
+        # distance between the predecessor of each level and the new node
+        position = positions[0] + 1
+        for i in range(level):
+            predecessor = update[i]
+            distance = position - positions[i]
+            node.next[i] = predecessor.next[i]
+            node.width[i] = predecessor.width[i] - distance + 1
+            predecessor.next[i] = node
+            predecessor.width[i] = distance
+        for i in range(level, self.level):
+            update[i].width[i] += 1
+
+        if update[0] is not self.head:
+            node.prev = update[0]
+        if node.next[0] is not None:
+            node.next[0].prev = node
+        else:
+            self.tail = node
+        self.count += 1
+
+    def delete(self, key):
+        """
+        Remove a key and return its data, None if the key does not exist.
+        Runtime: O(log n) expected
+        """
+        update, _ = self._find_predecessors(key)
+        node = update[0].next[0]
+        if node is None or node.key != key:
+            return None
+
+        for i in range(self.level):
+            if update[i].next[i] is node:
+                update[i].width[i] += node.width[i] - 1
+                update[i].next[i] = node.next[i]
+            else:
+                update[i].width[i] -= 1
+
+        if node.next[0] is not None:
+            node.next[0].prev = node.prev
+        else:
+            self.tail = node.prev
+        while self.level > 1 and self.head.next[self.level - 1] is None:
+            self.level -= 1
+        self.count -= 1
+        return node.data
+
+    def search(self, key):
+        """
+        Get data by its key, None if the key does not exist.
+        Runtime: O(log n) expected
+        """
+        node = self.head
+        for i in reversed(range(self.level)):
+            while node.next[i] is not None and node.next[i].key < key:
+                node = node.next[i]
+
+        node = node.next[0]
+        if node is not None and node.key == key:
+            return node.data
+        return None
+
+    def rank(self, key) -> int:
+        """
+        Number of keys lower than `key`, i.e. the position
+        `key` has or would have in the list.
+        Runtime: O(log n) expected
+        """
+        _, positions = self._find_predecessors(key)
+        return positions[0]
+
+    def _node_at(self, index: int) -> Node:
+        """
+        Private method used to reach the node at a position, following
+        the widths from the highest level down.
+        Runtime: O(log n) expected
+        """
+        remaining = index + 1
+        node = self.head
+        for i in reversed(range(self.level)):
+            while node.next[i] is not None and node.width[i] <= remaining:
+                remaining -= node.width[i]
+                node = node.next[i]
+        return node
+
+    def iter_from(self, start=None, reverse: bool = False):
+        """
+        Generate the data in order of key, from the first key greater than
+        or equal to `start`, or in reverse order, from the last key lower
+        than or equal to `start`. Without `start`, from one end of the list.
+        Runtime: O(log n) expected to reach `start`, then O(1) per data
+        """
+        if start is None:
+            node = self.tail if reverse else self.head.next[0]
+        else:
+            update, _ = self._find_predecessors(start)
+            node = update[0].next[0]
+            if reverse and (node is None or node.key != start):
+                node = update[0] if update[0] is not self.head else None
+
+        while node is not None:
+            yield node.data
+            node = node.prev if reverse else node.next[0]
+
+    def iter_from_position(self, index: int, reverse: bool = False):
+        """
+        Generate the data in order of key from the position `index`,
+        or in reverse order from the `index`-th position from the end.
+        Runtime: O(log n) expected to reach `index`, then O(1) per data
+        """
+        if not 0 <= index < self.count:
+            return
+        if reverse:
+            index = self.count - 1 - index
+
+        node = self._node_at(index)
+        while node is not None:
+            yield node.data
+            node = node.prev if reverse else node.next[0]
+
+    def __iter__(self):
+        """
+        Generate the data in order of key.
+        Runtime: O(n)
+        """
+        return self.iter_from()
+
+    def __reversed__(self):
+        """
+        Generate the data in reverse order of key.
+        Runtime: O(n)
+        """
+        return self.iter_from(reverse=True)
+
+    def __getitem__(self, index: int):
+        """
+        Get the data at a position, negative positions counting from
+        the end. Raise IndexError if the position is out of range.
+        Runtime: O(log n) expected
+        """
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("skip list index out of range")
+        return self._node_at(index).data
+
+    def __len__(self) -> int:
+        """
+        Number of data.
+        Runtime: O(1)
+        """
+        return self.count
+
+    def __contains__(self, key) -> bool:
+        """
+        Check if the key exists.
+        Runtime: O(log n) expected
+        """
+        update, _ = self._find_predecessors(key)
+        node = update[0].next[0]
+        return node is not None and node.key == key
@@ -5,6 +5,8 @@ Insertion and Deletion follows LIFO (Last In First Out) principle.
 
 
 class Node:
+    __slots__ = ("data", "next")
+
     def __init__(self, data, next) -> None:
         """
         Modelisation of a Node.
@@ -47,3 +49,72 @@ class Stack:
         removed_node = self.top
         self.top = self.top.next
         return removed_node
+
+
+class ArrayStack:
+    """
+    Modelisation of a Stack backed by a Python list.
+    The top of the Stack is the end of the list, so push and pop
+    are O(1) amortized without allocating a node per element.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialization.
+        """
+        self.items: list = []
+
+    def __len__(self) -> int:
+        """
+        Number of elements.
+        Runtime: O(1)
+        """
+        return len(self.items)
+
+    def peek(self):
+        """
+        Return the element at the top without removing it,
+        None if the Stack is empty.
+        Runtime: O(1)
+        """
+        if not self.items:
+            return None
+        return self.items[-1]
+
+    def push(self, data) -> None:
+        """
+        Add an element to the top of the Stack.
+        Runtime: O(1) amortized
+        """
+        self.items.append(data)
+
+    def push_many(self, items) -> None:
+        """
+        Push the elements of `items` in order,
+        the last one ends up at the top.
+        Runtime: O(k) amortized
+        """
+        self.items.extend(items)
+
+    def pop(self):
+        """
+        Remove and return the element at the top of the Stack,
+        None if the Stack is empty.
+        Runtime: O(1)
+        """
+        if not self.items:
+            return None
+        return self.items.pop()
+
+    def pop_many(self, n: int) -> list:
+        """
+        Remove and return the `n` elements at the top of the Stack,
+        top first, or every element if the Stack holds fewer than `n`.
+        Runtime: O(k)
+        """
+        if n <= 0:
+            return []
+        popped = self.items[-n:]
+        del self.items[-n:]
+        popped.reverse()
+        return popped
@@ -0,0 +1,170 @@
+"""
+Implementation of a Trie (prefix tree).
+"""
+
+
+class Node:
+    """
+    Modelisation of a Node.
+    """
+
+    __slots__ = ("children", "value", "is_word")
+
+    def __init__(self) -> None:
+        """
+        Initialization.
+        `children` maps a character to the child node, it is only allocated
+        with the first child, so the leaves (most of the nodes) stay small.
+        """
+        self.children: dict | None = None
+        self.value = None
+        self.is_word = False
+
+
+class Trie:
+    """
+    Modelisation of a Trie mapping words to values.
+
+    Visual representation of a Trie of the words "tea", "ten" and "to":
+
+        root
+         └── t
+             ├── e
+             │   ├── a  (tea)
+             │   └── n  (ten)
+             └── o  (to)
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialization.
+        """
+        self.root = Node()
+        self.count = 0
+
+    def _find_node(self, prefix: str) -> Node | None:
+        """
+        Private method used to walk down the path of a prefix,
+        None if no word starts with it.
+        Runtime: O(len(prefix))
+        """
+        node = self.root
+        for char in prefix:
+            if node.children is None:
+                return None
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return node
+
+    def insert(self, word: str, value=None) -> None:
+        """
+        Add a word with its value, or replace the value of an existing word.
+        Runtime: O(len(word))
+        """
+        node = self.root
+        for char in word:
+            if node.children is None:
+                node.children = {}
+            child = node.children.get(char)
+            if child is None:
+                child = node.children[char] = Node()
+            node = child
+
+        if not node.is_word:
+            node.is_word = True
+            self.count += 1
+        node.value = value
+
+    def search(self, word: str):
+        """
+        Get the value of a word, None if the word does not exist.
+        Runtime: O(len(word))
+        """
+        node = self._find_node(word)
+        if node is None or not node.is_word:
+            return None
+        return node.value
+
+    def remove(self, word: str):
+        """
+        Remove a word and return its value, None if the word does not exist.
+        The nodes left without word below them are pruned.
+        Runtime: O(len(word))
+        """
+        path = [self.root]
+        for char in word:
+            children = path[-1].children
+            if children is None or char not in children:
+                return None
+            path.append(children[char])
+
+        node = path[-1]
+        if not node.is_word:
+            return None
+        value = node.value
+        node.is_word = False
+        node.value = None
+        self.count -= 1
+
+        # prune from the end of the word, while the nodes are useless
+        for i in range(len(word), 0, -1):
+            node = path[i]
+            if node.is_word or node.children:
+                break
+            parent = path[i - 1]
+            del parent.children[word[i - 1]]
+            if not parent.children:
+                parent.children = None
+        return value
+
+    def starts_with(self, prefix: str, limit: int | None = None):
+        """
+        Generate the (word, value) pairs of the words starting with `prefix`,
+        in lexicographic order, stopping after `limit` of them.
+        The words are found lazily, depth first, so the first k pairs cost
+        O(len(prefix) + k * L), L being the length of the longest word.
+        """
+        if limit is not None and limit <= 0:
+            return
+        node = self._find_node(prefix)
+        if node is None:
+            return
+
+        found = 0
+        # stack of (node, word), the children pushed in reverse order
+        # so that the smallest character is popped first
+        stack = [(node, prefix)]
+        while stack:
+            node, word = stack.pop()
+            if node.is_word:
+                yield word, node.value
+                found += 1
+                if found == limit:
+                    return
+            if node.children:
+                for char in sorted(node.children, reverse=True):
+                    stack.append((node.children[char], word + char))
+
+    def __len__(self) -> int:
+        """
+        Number of words.
+        Runtime: O(1)
+        """
+        return self.count
+
+    def __contains__(self, word: str) -> bool:
+        """
+        Check if the word exists.
+        Runtime: O(len(word))
+        """
+        node = self._find_node(word)
+        return node is not None and node.is_word
+
+    def __iter__(self):
+        """
+        Generate every word, in lexicographic order.
+        Runtime: O(n * L)
+        """
+        for word, _ in self.starts_with(""):
+            yield word
@@ -5,10 +5,12 @@ Test file.
 import os
 import sys
 
+import pytest
+
 # Add the parent directory of dsa to the Python path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from dsa.binary_search_tree import BST, Node
+from dsa.binary_search_tree import BST, AVLTree, Node
 
 
 def test_insert_root():
@@ -138,3 +140,293 @@ def test_do_not_insert_duplicate_dict_node():
     # Only one node should exist with id=10
     assert bst.root.data["title"] == "First"
     assert bst.root.right is None  # No duplicate on right
+
+
+# -- AVL Tree tests --
+
+
+def _assert_avl(node):
+    """
+    Check the ordering, heights and balance of every node of a subtree,
+    and return its height.
+    """
+    if node is None:
+        return 0
+    left = _assert_avl(node.left)
+    right = _assert_avl(node.right)
+    if node.left is not None:
+        assert node.left.data < node.data
+    if node.right is not None:
+        assert node.right.data > node.data
+    assert abs(left - right) <= 1
+    assert node.height == 1 + max(left, right)
+    return node.height
+
+
+def test_avl_sorted_inserts_stay_balanced():
+    avl = AVLTree()
+    for val in range(1, 1024):
+        avl.insert(val)
+
+    assert avl.height() == 10
+    assert _assert_avl(avl.root) == 10
+    assert avl.search("1") == 1
+    assert avl.search("1023") == 1023
+    assert avl.search("1024") is False
+
+
+def test_avl_reverse_sorted_inserts_stay_balanced():
+    avl = AVLTree()
+    for val in range(1000, 0, -1):
+        avl.insert(val)
+
+    assert _assert_avl(avl.root) <= 11
+
+
+def test_avl_rotations():
+    # left-right case
+    avl = AVLTree()
+    for val in (30, 10, 20):
+        avl.insert(val)
+    assert avl.root.data == 20
+    assert avl.root.left.data == 10
+    assert avl.root.right.data == 30
+
+    # right-left case
+    avl = AVLTree()
+    for val in (10, 30, 20):
+        avl.insert(val)
+    assert avl.root.data == 20
+
+
+def test_avl_no_duplicates_inserted():
+    avl = AVLTree()
+    avl.insert({"id": 10, "title": "First"})
+    avl.insert({"id": 10, "title": "Duplicate"})
+    assert avl.search("10")["title"] == "First"
+    assert avl.root.left is None and avl.root.right is None
+
+
+def test_avl_delete():
+    avl = AVLTree()
+    for val in range(1, 101):
+        avl.insert(val)
+
+    for val in range(1, 101, 2):
+        avl.delete(str(val))
+    avl.delete("1000")  # non existing
+
+    _assert_avl(avl.root)
+    for val in range(1, 101):
+        expected = val if val % 2 == 0 else False
+        assert avl.search(str(val)) == expected
+
+    for val in range(2, 101, 2):
+        avl.delete(val)
+    assert avl.root is None
+    assert avl.height() == 0
+
+
+def test_bst_height_of_degenerate_tree():
+    bst = BST()
+    for val in range(500):
+        bst.insert(val)
+    assert bst.height() == 500
+
+
+# -- Iterative and bulk build tests --
+
+
+def test_skewed_tree_does_not_hit_recursion_limit():
+    bst = BST()
+    for val in range(5000):
+        bst.insert(val)
+
+    assert bst.height() == 5000
+    assert bst.search("4999") == 4999
+    assert bst.search("5000") is False
+
+
+def test_from_sorted_builds_a_balanced_tree():
+    bst = BST.from_sorted(range(1, 8))
+
+    assert bst.root.data == 4
+    assert bst.root.left.data == 2
+    assert bst.root.right.data == 6
+    assert bst.root.left.left.data == 1
+    assert bst.root.right.right.data == 7
+    assert bst.height() == 3
+
+
+def test_from_sorted_with_dicts_and_duplicates():
+    posts = [{"id": 1, "title": "A"}, {"id": 1, "title": "B"}, {"id": 2, "title": "C"}]
+    bst = BST.from_sorted(posts)
+
+    assert bst.search("1")["title"] == "A"
+    assert bst.search("2")["title"] == "C"
+    assert BST.from_sorted([]).root is None
+
+
+def test_from_sorted_rejects_unsorted_data():
+    with pytest.raises(ValueError):
+        BST.from_sorted([2, 1])
+
+
+def test_avl_from_sorted_keeps_heights():
+    avl = AVLTree.from_sorted(range(1, 1001))
+
+    assert _assert_avl(avl.root) == avl.height() == 10
+    avl.insert(1001)
+    avl.delete(500)
+    _assert_avl(avl.root)
+
+
+# -- Ordered queries tests --
+
+
+def _bst_and_avl(values):
+    bst = BST()
+    avl = AVLTree()
+    for val in values:
+        bst.insert(val)
+        avl.insert(val)
+    return bst, avl
+
+
+def test_in_order_and_range():
+    for tree in _bst_and_avl([10, 5, 15, 2, 7, 12, 20]):
+        assert list(tree) == [2, 5, 7, 10, 12, 15, 20]
+        assert tree.range(6, 15) == [7, 10, 12, 15]
+        assert tree.range(21, 30) == []
+        assert list(tree.in_order(hi=7)) == [2, 5, 7]
+        assert list(tree.in_order(lo=12)) == [12, 15, 20]
+
+
+def test_in_order_is_lazy():
+    bst = BST.from_sorted(range(100))
+    generator = bst.in_order(10)
+    assert next(generator) == 10
+    assert next(generator) == 11
+
+
+def test_min_max_floor_ceiling():
+    for tree in _bst_and_avl([10, 5, 15, 2, 7, 12, 20]):
+        assert tree.min() == 2
+        assert tree.max() == 20
+        assert tree.floor(11) == 10
+        assert tree.floor(12) == 12
+        assert tree.floor(1) is None
+        assert tree.ceiling(11) == 12
+        assert tree.ceiling(7) == 7
+        assert tree.ceiling(21) is None
+
+    assert BST().min() is None
+    assert BST().max() is None
+
+
+def test_rank_and_select():
+    for tree in _bst_and_avl([10, 5, 15, 2, 7, 12, 20, 10]):
+        assert len(tree) == 7
+        assert tree.rank(2) == 0
+        assert tree.rank(11) == 4
+        assert tree.rank(100) == 7
+        assert [tree.select(i) for i in range(7)] == [2, 5, 7, 10, 12, 15, 20]
+        assert tree.select(7) is None
+        assert tree.select(-1) is None
+
+
+def test_sizes_after_avl_rotations_and_deletes():
+    avl = AVLTree()
+    for val in range(1, 101):
+        avl.insert(val)
+    for val in range(1, 101, 3):
+        avl.delete(val)
+
+    remaining = [val for val in range(1, 101) if (val - 1) % 3]
+    assert len(avl) == len(remaining)
+    assert [avl.select(i) for i in range(len(remaining))] == remaining
+    assert BST.from_sorted(remaining).select(10) == remaining[10]
+
+
+# -- Key function tests --
+
+
+def test_key_function_orders_by_date_then_id():
+    posts = [
+        {"id": 1, "date": "2024-01-02"},
+        {"id": 2, "date": "2024-01-01"},
+        {"id": 3, "date": "2024-01-02"},
+        {"id": 4, "date": "2023-12-31"},
+    ]
+    for cls in (BST, AVLTree):
+        tree = cls(key=lambda post: (post["date"], post["id"]))
+        for post in posts:
+            tree.insert(post)
+
+        assert [post["id"] for post in tree] == [4, 2, 1, 3]
+        # (date,) sorts before any (date, id), (date, inf) after all of them
+        same_day = tree.range(("2024-01-02",), ("2024-01-02", float("inf")))
+        assert [post["id"] for post in same_day] == [1, 3]
+        assert tree.search(("2024-01-01", 2))["id"] == 2
+        assert tree.search(("2024-01-01", 3)) is False
+
+
+def test_key_function_keeps_duplicate_keys_ordered_by_id():
+    posts = [
+        {"id": 3, "date": "2024-01-02"},
+        {"id": 1, "date": "2024-01-02"},
+        {"id": 2, "date": "2024-01-01"},
+        {"id": 4, "date": "2024-01-02"},
+    ]
+    for cls in (BST, AVLTree):
+        tree = cls(key=lambda post: post["date"])
+        for post in posts:
+            tree.insert(post)
+        # the same blogpost again is skipped
+        tree.insert({"id": 1, "date": "2024-01-02"})
+
+        assert len(tree) == 4
+        assert [post["id"] for post in tree] == [2, 1, 3, 4]
+        same_day = tree.range("2024-01-02", "2024-01-02")
+        assert [post["id"] for post in same_day] == [1, 3, 4]
+        assert tree.search("2024-01-02")["date"] == "2024-01-02"
+
+    sorted_posts = sorted(posts, key=lambda post: (post["date"], post["id"]))
+    avl = AVLTree.from_sorted(sorted_posts, key=lambda post: post["date"])
+    assert [post["id"] for post in avl] == [2, 1, 3, 4]
+    avl.delete("2024-01-02", 3)
+    assert [post["id"] for post in avl] == [2, 1, 4]
+
+
+def test_key_function_without_id():
+    """
+    Test that data without ID are refused by a tree with a key,
+    even when a data with an ID already has their key value.
+    """
+    for cls in (BST, AVLTree):
+        tree = cls(key=lambda entry: entry["name"])
+        with pytest.raises(ValueError):
+            tree.insert({"name": "a"})
+        tree.insert({"id": 1, "name": "a"})
+        with pytest.raises(ValueError):
+            tree.insert({"name": "a"})
+        assert list(tree) == [{"id": 1, "name": "a"}]
+    with pytest.raises(ValueError):
+        AVLTree.from_sorted(
+            [{"id": 1, "name": "a"}, {"name": "a"}], key=lambda entry: entry["name"]
+        )
+    with pytest.raises(ValueError):
+        tree.delete("a")
+
+
+def test_reverse_in_order():
+    for tree in _bst_and_avl([10, 5, 15, 2, 7, 12, 20]):
+        assert list(tree.in_order(reverse=True)) == [20, 15, 12, 10, 7, 5, 2]
+        assert list(tree.in_order(6, 15, reverse=True)) == [15, 12, 10, 7]
+
+
+def test_avl_delete_with_key_function():
+    entries = [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}, {"id": 3, "name": "c"}]
+    avl = AVLTree.from_sorted(entries, key=lambda entry: entry["name"])
+    avl.delete("b", 2)
+    assert list(avl) == [entries[0], entries[2]]
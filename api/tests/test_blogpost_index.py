@@ -0,0 +1,259 @@
+"""
+Tests for the per-worker blogposts index.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import text
+
+from app import create_app, db
+from app.config import Config
+from app.models.blogpost import BlogPost
+
+
+def test_index_is_built_on_first_use():
+    """
+    Test that the index is built lazily, then serves the lookups.
+    """
+    app = create_app()
+    index = app.extensions["blogpost_index"]
+    assert index.tree is None
+
+    response = app.test_client().get("/api/blogposts/2")
+
+    assert response.status_code == 200
+    assert index.tree is not None
+    assert index.search("2") == response.get_json()
+
+
+def test_index_follows_committed_writes():
+    """
+    Test that created, updated and deleted blogposts reach the index.
+    """
+    app = create_app()
+    index = app.extensions["blogpost_index"]
+
+    with app.app_context():
+        index.rebuild()
+
+        post = BlogPost(title="Indexed", body="An indexed post.", user_id=12)
+        db.session.add(post)
+        db.session.commit()
+        post_id = post.id
+        assert index.search(post_id)["title"] == "Indexed"
+
+        post.title = "Updated"
+        db.session.commit()
+        assert index.search(post_id)["title"] == "Updated"
+        assert index.check_consistency()["consistent"]
+
+        db.session.delete(post)
+        db.session.commit()
+        assert index.search(post_id) is False
+        assert index.check_consistency()["consistent"]
+
+
+def test_index_ignores_rolled_back_writes():
+    """
+    Test that flushed but rolled back blogposts never reach the index.
+    """
+    app = create_app()
+    index = app.extensions["blogpost_index"]
+
+    with app.app_context():
+        index.rebuild()
+
+        post = BlogPost(title="Rolled back", body="Never committed.", user_id=12)
+        db.session.add(post)
+        db.session.flush()
+        post_id = post.id
+        db.session.rollback()
+
+        assert index.search(post_id) is False
+        assert index.check_consistency()["consistent"]
+
+
+def test_check_consistency_reports_differences():
+    """
+    Test that the consistency check spots an out of sync index.
+    """
+    app = create_app()
+    index = app.extensions["blogpost_index"]
+
+    with app.app_context():
+        index.rebuild()
+        first = index.in_order()[0]
+        index.tree.delete(first["id"])
+        index.tree.insert({"id": 100000, "title": "", "body": "", "user_id": 12})
+
+        report = index.check_consistency()
+        assert report["consistent"] is False
+        assert report["missing"] == [first["id"]]
+        assert report["unexpected"] == [100000]
+
+        index.rebuild()
+        assert index.check_consistency()["consistent"]
+
+
+def test_index_can_be_disabled(monkeypatch):
+    """
+    Test that the endpoints query the database when the index is disabled.
+    """
+    monkeypatch.setattr(Config, "BLOGPOST_INDEX", False)
+    app = create_app()
+
+    assert "blogpost_index" not in app.extensions
+    response = app.test_client().get("/api/blogposts/2")
+    assert response.status_code == 200
+    assert response.get_json()["id"] == 2
+
+
+def test_check_blogpost_index_command():
+    """
+    Test the `flask check-blogpost-index` command.
+    """
+    app = create_app()
+    runner = app.test_cli_runner()
+
+    result = runner.invoke(args=["check-blogpost-index"])
+
+    assert result.exit_code == 0
+    assert "consistent with the database" in result.output
+
+
+def test_date_index_follows_committed_writes():
+    """
+    Test that the date index moves a blogpost when its date changes.
+    """
+    app = create_app()
+    index = app.extensions["blogpost_index"]
+
+    with app.app_context():
+        index.rebuild()
+
+        post = BlogPost(
+            title="Dated",
+            body="A dated post.",
+            user_id=12,
+            date=datetime(1970, 1, 1),
+        )
+        db.session.add(post)
+        db.session.commit()
+        post_id = post.id
+        oldest = index.by_date()[0]
+        assert oldest["id"] == post_id
+        assert oldest["date"] == datetime(1970, 1, 1)
+
+        post.date = datetime(2100, 1, 1)
+        db.session.commit()
+        latest = index.by_date(latest=1)[0]
+        assert latest["id"] == post_id
+        assert latest["date"] == datetime(2100, 1, 1)
+        assert index.check_consistency()["consistent"]
+
+        db.session.delete(post)
+        db.session.commit()
+        assert post_id not in {post["id"] for post in index.by_date()}
+        assert index.check_consistency()["consistent"]
+
+
+def test_date_index_keeps_blogposts_of_the_same_date():
+    """
+    Test that blogposts published at the same date are all indexed,
+    ordered by ID.
+    """
+    app = create_app()
+    index = app.extensions["blogpost_index"]
+    date = datetime(1971, 1, 1)
+
+    with app.app_context():
+        index.rebuild()
+        posts = [
+            BlogPost(title=title, body="", user_id=12, date=date)
+            for title in ("Twin 1", "Twin 2")
+        ]
+        db.session.add_all(posts)
+        db.session.commit()
+        ids = [post.id for post in posts]
+
+        assert [post["id"] for post in index.by_date(date, date)] == ids
+        posts[0].title = "Twin"
+        db.session.commit()
+        titles = [post["title"] for post in index.by_date(date, date)]
+        assert titles == ["Twin", "Twin 2"]
+
+        index.rebuild()
+        assert [post["id"] for post in index.by_date(date, date)] == ids
+        assert index.check_consistency()["consistent"]
+
+        for post in posts:
+            db.session.delete(post)
+        db.session.commit()
+        assert index.by_date(date, date) == []
+
+
+def test_index_follows_writes_of_other_processes(monkeypatch):
+    """
+    Test that the index of a worker sees the blogposts created, updated
+    and deleted by another worker, through the version of the table.
+    """
+    # read the versions on each request
+    monkeypatch.setattr(Config, "INDEX_VERSION_TTL", 0)
+    writer = create_app()
+    reader = create_app()
+    client = reader.test_client()
+    # the index of the reader is built before the writes
+    assert client.get("/api/blogposts/2").status_code == 200
+    assert client.get("/api/blogposts/search?q=Wombat").get_json() == []
+
+    with writer.app_context():
+        post = BlogPost(title="Wombat", body="Written elsewhere.", user_id=12)
+        db.session.add(post)
+        db.session.commit()
+        post_id = post.id
+
+    response = client.get(f"/api/blogposts/{post_id}")
+    assert response.status_code == 200
+    assert response.get_json()["title"] == "Wombat"
+    found = client.get("/api/blogposts/search?q=wombat").get_json()
+    assert [post["id"] for post in found] == [post_id]
+
+    with writer.app_context():
+        db.session.get(BlogPost, post_id).title = "Koala"
+        db.session.commit()
+
+    assert client.get(f"/api/blogposts/{post_id}").get_json()["title"] == "Koala"
+    assert client.get("/api/blogposts/search?q=wombat").get_json() == []
+
+    with writer.app_context():
+        db.session.delete(db.session.get(BlogPost, post_id))
+        db.session.commit()
+
+    assert client.get(f"/api/blogposts/{post_id}").status_code == 404
+
+
+def test_index_loads_missing_blogposts():
+    """
+    Test that a blogpost missing from the index, e.g. inserted without
+    the ORM, is read from the database and added to the index.
+    """
+    app = create_app()
+    index = app.extensions["blogpost_index"]
+
+    with app.app_context():
+        index.rebuild()
+        post_id = db.session.execute(
+            text(
+                "INSERT INTO blogposts (title, body, user_id) "
+                "VALUES ('Raw', 'Inserted in SQL.', 12) RETURNING id"
+            )
+        ).scalar()
+        db.session.commit()
+
+        assert index.search(post_id)["title"] == "Raw"
+        assert index.tree.search(post_id)["title"] == "Raw"
+
+        db.session.execute(
+            text("DELETE FROM blogposts WHERE id = :id"), {"id": post_id}
+        )
+        db.session.commit()
@@ -0,0 +1,61 @@
+"""
+Test file.
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add the parent directory of dsa to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+# Now we can import directly from the dsa directory
+from dsa.bloom_filter import BloomFilter
+
+
+def test_bloom_filter_initial_state():
+    """
+    Test for initial state of a Bloom filter.
+    """
+    bf = BloomFilter(1000, 0.01)
+    assert len(bf) == 0
+    assert "alice" not in bf
+    assert len(bf.bits) == (bf.size + 7) // 8
+    # about 9.6 bits and 7 hashes per key for a 1% false positive rate
+    assert 9000 < bf.size < 10000
+    assert bf.hash_count == 7
+
+
+def test_bloom_filter_invalid_parameters():
+    """
+    Test that invalid parameters are rejected.
+    """
+    with pytest.raises(ValueError):
+        BloomFilter(0)
+    with pytest.raises(ValueError):
+        BloomFilter(100, error_rate=1)
+
+
+def test_bloom_filter_has_no_false_negative():
+    """
+    Test that every key added is found, whatever its type.
+    """
+    bf = BloomFilter(500, 0.01)
+    keys = [f"user{i}" for i in range(500)] + [b"bytes", 42, ("a", 1)]
+    bf.update(keys)
+
+    assert len(bf) == len(keys)
+    assert all(key in bf for key in keys)
+
+
+def test_bloom_filter_false_positive_rate():
+    """
+    Test that the false positive rate stays close to the configured one.
+    """
+    bf = BloomFilter(2000, 0.01)
+    bf.update(f"user{i}" for i in range(2000))
+
+    false_positives = sum(f"other{i}" in bf for i in range(20000))
+    assert false_positives / 20000 < 0.02
+    assert bf.estimated_error_rate() == pytest.approx(0.01, rel=0.2)
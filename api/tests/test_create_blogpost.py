@@ -12,6 +12,8 @@ def test_create_blogpost():
     """
     app = create_app()
     client = app.test_client()
+    # the index is built before the blogpost is created
+    client.get("/api/blogposts/2")
 
     # ensure the id do exist in the database
     response = client.post(
@@ -20,6 +22,13 @@ def test_create_blogpost():
     assert response.status_code == 201
     assert response.get_json() == {"message": "Blogpost created"}
 
+    # the new blogpost is indexed as stored in the database
+    post = client.get("/api/blogposts").get_json()[-1]
+    assert post["title"] == "Ma go"
+    assert client.get(f"/api/blogposts/{post['id']}").get_json()["user_id"] == 12
+    with app.app_context():
+        assert app.extensions["blogpost_index"].check_consistency()["consistent"]
+
 
 def test_create_blogpost_with_missing_parameter():
     """
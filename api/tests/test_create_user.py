@@ -2,7 +2,10 @@
 Tests for create user route/endpoint.
 """
 
-from app import create_app
+from sqlalchemy import event
+
+from app import create_app, db
+from app.models.user import User
 
 # Uncomment this test the first time you run pytest
 # then comment it, since the user created will already be in the db
@@ -69,3 +72,88 @@ def test_missing_parameter():
     )
     assert response.status_code == 400
     assert response.get_json() == {"message": "Missing required fields"}
+
+
+def test_existing_email_with_new_username():
+    """
+    Test `/api/users` route
+    returns 409 when only the email is already taken.
+    """
+    app = create_app()
+    client = app.test_client()
+
+    # ensure the email do exist in the database
+    email = client.get("/api/users/1").get_json()["email"]
+    response = client.post(
+        "/api/users",
+        json={
+            "username": "A brand new username",
+            "email": email,
+            "address": "Makepe Missoke, Douala - Cameroun",
+            "phone": "+237699995153",
+        },
+    )
+    assert response.status_code == 409
+
+
+def test_new_user_skips_the_duplicate_query():
+    """
+    Test `/api/users` route
+    does not query the users table for a user the Bloom filter rules out.
+    """
+    app = create_app()
+    client = app.test_client()
+    with app.app_context():
+        engine = db.engine
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        response = client.post(
+            "/api/users",
+            json={
+                "username": "Bloom",
+                "email": "bloom@example.com",
+                "address": "Douala - Cameroun",
+                "phone": "+237600000000",
+            },
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert response.status_code == 201
+    assert not any(
+        statement.startswith("SELECT") and "FROM users" in statement
+        for statement in statements
+    )
+
+    newest = client.get("/api/users/descending_id?limit=1").get_json()["users"][0]
+    assert newest["username"] == "Bloom"
+    assert client.delete(f"/api/users/{newest['id']}").status_code == 204
+
+
+def test_created_user_reaches_the_filter():
+    """
+    Test that a committed user is added to the Bloom filter.
+    """
+    app = create_app()
+    user_filter = app.extensions["user_bloom_filter"]
+
+    with app.app_context():
+        user = User(
+            username="Filtered",
+            email="filtered@example.com",
+            address="Douala - Cameroun",
+            phone="+237600000000",
+        )
+        assert not user_filter.might_exist("Filtered", "filtered@example.com")
+        db.session.add(user)
+        db.session.commit()
+        assert user_filter.might_exist("Filtered", "other@example.com")
+
+        db.session.delete(user)
+        db.session.commit()
@@ -0,0 +1,49 @@
+"""
+Tests for delete last blogposts route/endpoint.
+"""
+
+from app import create_app
+
+
+def _blogpost_ids(client) -> list:
+    """
+    Ids of every blogpost, in ascending order.
+    """
+    return [post["id"] for post in client.get("/api/blogposts").get_json()]
+
+
+def test_delete_last_blogposts():
+    """
+    Test `/api/blogposts/delete_last/{n}` route
+    deletes only the `n` most recent blogposts.
+    """
+    app = create_app()
+    client = app.test_client()
+
+    for title in ("First", "Second"):
+        response = client.post(
+            "/api/blogposts/12", json={"title": title, "body": "A new post."}
+        )
+        assert response.status_code == 201
+
+    ids = _blogpost_ids(client)
+    response = client.delete("/api/blogposts/delete_last/2")
+
+    assert response.status_code == 204
+    assert _blogpost_ids(client) == ids[:-2]
+    assert client.get(f"/api/blogposts/{ids[-1]}").status_code == 404
+
+
+def test_delete_last_zero_blogposts():
+    """
+    Test `/api/blogposts/delete_last/0` route
+    deletes nothing.
+    """
+    app = create_app()
+    client = app.test_client()
+
+    ids = _blogpost_ids(client)
+    response = client.delete("/api/blogposts/delete_last/0")
+
+    assert response.status_code == 204
+    assert _blogpost_ids(client) == ids
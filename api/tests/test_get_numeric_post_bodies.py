@@ -0,0 +1,94 @@
+"""
+Tests for numeric post bodies route/endpoint.
+"""
+
+import json
+
+from app import create_app, db
+from app.models.blogpost import BlogPost
+
+
+def test_get_numeric_post_bodies():
+    """
+    Test `/api/blogposts/numerics` route
+    returns 200 OK and the sum of the ASCII values of each body.
+    """
+    app = create_app()
+    client = app.test_client()
+
+    response = client.get("/api/blogposts/numerics")
+
+    assert response.status_code == 200
+    posts = {post["id"]: post for post in response.get_json()}
+    # ensure the id do exist in the database
+    original = client.get("/api/blogposts/2").get_json()
+    assert posts[2]["body"] == sum(ord(char) for char in original["body"])
+    assert posts[2]["title"] == original["title"]
+
+
+def test_stream_numeric_post_bodies():
+    """
+    Test `/api/blogposts/numerics?stream=json` route
+    streams the same blogposts as the regular response.
+    """
+    app = create_app()
+    client = app.test_client()
+
+    expected = client.get("/api/blogposts/numerics").get_json()
+    response = client.get("/api/blogposts/numerics?stream=json")
+
+    assert response.status_code == 200
+    assert response.is_streamed
+    assert sorted(json.loads(response.data), key=lambda p: p["id"]) == sorted(
+        expected, key=lambda p: p["id"]
+    )
+
+
+def test_stream_numeric_post_bodies_as_ndjson():
+    """
+    Test `/api/blogposts/numerics` route
+    streams one blogpost per line for an `Accept: application/x-ndjson` header.
+    """
+    app = create_app()
+    client = app.test_client()
+
+    expected = client.get("/api/blogposts/numerics").get_json()
+    response = client.get(
+        "/api/blogposts/numerics", headers={"Accept": "application/x-ndjson"}
+    )
+
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+    lines = response.data.decode().splitlines()
+    assert len(lines) == len(expected)
+    assert {json.loads(line)["id"] for line in lines} == {p["id"] for p in expected}
+
+
+def test_numeric_body_maintained_on_write():
+    """
+    Test that the numeric value of a body is stored when the blogpost
+    is created, and updated with its body.
+    """
+    app = create_app()
+    client = app.test_client()
+
+    with app.app_context():
+        post = BlogPost(title="Numeric", body="ab", user_id=2)
+        db.session.add(post)
+        db.session.commit()
+        assert post.numeric_body == ord("a") + ord("b")
+
+        posts = {p["id"]: p for p in client.get("/api/blogposts/numerics").get_json()}
+        assert posts[post.id]["body"] == ord("a") + ord("b")
+
+        post.body = "é"
+        db.session.commit()
+        posts = {p["id"]: p for p in client.get("/api/blogposts/numerics").get_json()}
+        assert posts[post.id]["body"] == ord("é")
+
+        post.body = None
+        db.session.commit()
+        assert post.numeric_body == 0
+
+        db.session.delete(post)
+        db.session.commit()
@@ -2,7 +2,10 @@
 Tests for READ users in ascending order route/endpoint.
 """
 
+import json
+
 from app import create_app
+from app.config import Config
 from app.models.user import User
 
 
@@ -26,3 +29,126 @@ def test_descending_id():
     # Verify IDs are in ascending order
     for i in range(1, len(users)):
         assert users[i].get("id") > users[i-1].get("id"), "IDs should be in ascending order"
+
+
+def test_ascending_id_pagination():
+    """
+    Test `/api/users/ascending_id` route
+    with the `offset` and `limit` query parameters.
+    """
+    app = create_app()
+    client = app.test_client()
+
+    users = client.get("/api/users/ascending_id").get_json()
+    response = client.get("/api/users/ascending_id?offset=1&limit=2")
+
+    assert response.status_code == 200
+    assert response.get_json()["users"] == users[1:3]
+
+
+def test_ascending_id_pagination_with_skip_list_backend(monkeypatch):
+    """
+    Test `/api/users/ascending_id` route
+    served by the Skip List users index.
+    """
+    monkeypatch.setattr(Config, "USER_INDEX_BACKEND", "skip_list")
+    app = create_app()
+    client = app.test_client()
+
+    users = client.get("/api/users/ascending_id").get_json()
+    response = client.get("/api/users/ascending_id?offset=2&limit=3")
+
+    assert response.status_code == 200
+    assert response.get_json()["users"] == users[2:5]
+    assert users[0].get("id") == 1
+
+
+def test_ascending_id_pagination_without_index(monkeypatch):
+    """
+    Test `/api/users/ascending_id` route
+    paginated by the database when the index is disabled.
+    """
+    users = create_app().test_client().get("/api/users/ascending_id").get_json()
+
+    monkeypatch.setattr(Config, "USER_INDEX", False)
+    client = create_app().test_client()
+    response = client.get("/api/users/ascending_id?offset=1&limit=2")
+
+    assert response.status_code == 200
+    assert response.get_json()["users"] == users[1:3]
+
+
+def test_ascending_id_invalid_pagination():
+    """
+    Test `/api/users/ascending_id` route
+    returns 400 for an invalid limit.
+    """
+    app = create_app()
+    response = app.test_client().get("/api/users/ascending_id?limit=abc")
+
+    assert response.status_code == 400
+    assert "message" in response.get_json()
+
+
+def test_ascending_id_keyset_pagination():
+    """
+    Test `/api/users/ascending_id` route
+    walks every user page by page, following `next_cursor`.
+    """
+    app = create_app()
+    client = app.test_client()
+
+    users = client.get("/api/users/ascending_id").get_json()
+    pages = []
+    response = client.get("/api/users/ascending_id?limit=3").get_json()
+    pages.extend(response["users"])
+    while response["next_cursor"] is not None:
+        assert len(response["users"]) == 3
+        cursor = response["next_cursor"]
+        response = client.get(
+            f"/api/users/ascending_id?limit=3&after_id={cursor}"
+        ).get_json()
+        pages.extend(response["users"])
+
+    assert pages == users
+
+
+def test_ascending_id_keyset_pagination_without_index(monkeypatch):
+    """
+    Test `/api/users/ascending_id` route
+    with the cursor pushed down to the database.
+    """
+    users = create_app().test_client().get("/api/users/ascending_id").get_json()
+
+    monkeypatch.setattr(Config, "USER_INDEX", False)
+    client = create_app().test_client()
+    response = client.get(f"/api/users/ascending_id?limit=2&after_id={users[0]['id']}")
+
+    assert response.status_code == 200
+    assert response.get_json() == {
+        "users": users[1:3],
+        "next_cursor": users[2]["id"],
+    }
+    response = client.get(f"/api/users/ascending_id?after_id={users[-1]['id']}")
+    assert response.get_json() == {"users": [], "next_cursor": None}
+
+
+def test_stream_ascending_id(monkeypatch):
+    """
+    Test `/api/users/ascending_id?stream=json` route
+    streams every user in ascending order, a few chunks at a time.
+    """
+    monkeypatch.setattr("app.streaming.ITEMS_PER_CHUNK", 2)
+    app = create_app()
+    client = app.test_client()
+
+    users = client.get("/api/users/ascending_id").get_json()
+    response = client.get("/api/users/ascending_id?stream=json")
+
+    assert response.status_code == 200
+    assert response.is_streamed
+    assert json.loads(response.data) == users
+
+    last_id = users[-1]["id"]
+    response = client.get(f"/api/users/ascending_id?stream=json&after_id={last_id}")
+    assert json.loads(response.data) == []
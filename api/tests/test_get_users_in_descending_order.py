@@ -3,6 +3,7 @@ Tests for READ users in descending order route/endpoint.
 """
 
 from app import create_app
+from app.config import Config
 from app.models.user import User
 
 
@@ -26,3 +27,60 @@ def test_descending_id():
     # Verify IDs are in descending order
     for i in range(1, len(users)):
         assert users[i].get("id") < users[i-1].get("id"), "IDs should be in descending order"
+
+
+def test_descending_id_pagination():
+    """
+    Test `/api/users/descending_id` route
+    with the `offset` and `limit` query parameters.
+    """
+    app = create_app()
+    client = app.test_client()
+
+    users = client.get("/api/users/descending_id").get_json()
+    response = client.get("/api/users/descending_id?offset=1&limit=2")
+
+    assert response.status_code == 200
+    assert response.get_json()["users"] == users[1:3]
+
+
+def test_descending_id_pagination_with_skip_list_backend(monkeypatch):
+    """
+    Test `/api/users/descending_id` route
+    served by the Skip List users index.
+    """
+    monkeypatch.setattr(Config, "USER_INDEX_BACKEND", "skip_list")
+    app = create_app()
+    client = app.test_client()
+
+    users = client.get("/api/users/descending_id").get_json()
+    response = client.get("/api/users/descending_id?offset=2&limit=3")
+
+    assert response.status_code == 200
+    assert response.get_json()["users"] == users[2:5]
+    assert users[-1].get("id") == 1
+
+
+def test_descending_id_keyset_pagination(monkeypatch):
+    """
+    Test `/api/users/descending_id` route
+    with the `before_id` cursor, for every users index backend.
+    """
+    users = create_app().test_client().get("/api/users/descending_id").get_json()
+    cursor = users[0]["id"]
+
+    for backend in ("linked_hash_map", "skip_list"):
+        monkeypatch.setattr(Config, "USER_INDEX_BACKEND", backend)
+        client = create_app().test_client()
+        response = client.get(f"/api/users/descending_id?limit=2&before_id={cursor}")
+
+        assert response.status_code == 200
+        assert response.get_json() == {
+            "users": users[1:3],
+            "next_cursor": users[2]["id"],
+        }
+
+    monkeypatch.setattr(Config, "USER_INDEX", False)
+    client = create_app().test_client()
+    response = client.get(f"/api/users/descending_id?limit=2&before_id={cursor}")
+    assert response.get_json()["users"] == users[1:3]
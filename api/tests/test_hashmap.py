@@ -5,7 +5,9 @@ Test file.
 import os
 import sys
 
-from dsa.hashmap import HashMap
+import pytest
+
+from dsa.hashmap import HashMap, fnv1a_hash
 
 # Add the parent directory of dsa to the Python path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -56,7 +58,8 @@ def test_overwrite_same_key():
     hashmap = HashMap(10)
     hashmap.add_key_value("same", "first")
     hashmap.add_key_value("same", "second")
-    assert hashmap.get_value("same") == "first"
+    assert hashmap.get_value("same") == "second"
+    assert hashmap.count == 1
 
 
 def test_empty_hashmap():
@@ -67,3 +70,284 @@ def test_empty_hashmap():
     for i in range(5):
         assert hashmap.hash_table[i] is None
         assert hashmap.get_value(f"key{i}") is None
+
+
+def test_count_tracks_entries():
+    """
+    Test that the hashmap keeps track of its number of entries.
+    """
+    hashmap = HashMap(10)
+    assert hashmap.count == 0
+    hashmap.add_key_value("hello", "world")
+    hashmap.add_key_value("hi", "there")
+    assert hashmap.count == 2
+
+
+def test_resize_when_load_factor_exceeded():
+    """
+    Test that the hash_table grows once the load factor is crossed.
+    """
+    hashmap = HashMap(4, load_factor=0.75)
+    for i in range(3):
+        hashmap.add_key_value(f"key{i}", i)
+    assert len(hashmap.hash_table) == 4
+
+    hashmap.add_key_value("key3", 3)
+    assert len(hashmap.hash_table) == 8
+    assert hashmap.size == 8
+
+
+def test_get_after_many_resizes():
+    """
+    Test that every key is still reachable after several resizes.
+    """
+    hashmap = HashMap(2)
+    for i in range(1000):
+        hashmap.add_key_value(f"key{i}", i)
+
+    assert hashmap.count == 1000
+    assert hashmap.count <= hashmap.load_factor * len(hashmap.hash_table)
+    for i in range(1000):
+        assert hashmap.get_value(f"key{i}") == i
+
+
+def test_resize_keeps_chain_order():
+    """
+    Test that rehashing preserves the order of nodes inside a chain.
+    """
+    hashmap = HashMap(2, hash_fn=lambda key: key % 4)
+    hashmap.add_key_value(1, "a")
+    hashmap.add_key_value(5, "b")
+    hashmap.add_key_value(9, "c")
+    assert len(hashmap.hash_table) == 4
+
+    chain = []
+    temp = hashmap.hash_table[1]
+    while temp:
+        chain.append(temp.data.key)
+        temp = temp.next
+    assert chain == [1, 5, 9]
+
+
+def test_invalid_parameters():
+    """
+    Test that invalid size or load factor are rejected.
+    """
+    with pytest.raises(ValueError):
+        HashMap(0)
+    with pytest.raises(ValueError):
+        HashMap(10, load_factor=0)
+    with pytest.raises(ValueError):
+        HashMap(10, load_factor=0.75, min_load_factor=0.5)
+
+
+def test_fnv1a_hash_known_values():
+    """
+    Test the FNV-1a hash against reference values.
+    """
+    assert fnv1a_hash("") == 0xCBF29CE484222325
+    assert fnv1a_hash("a") == 0xAF63DC4C8601EC8C
+    assert fnv1a_hash(b"a") == fnv1a_hash("a")
+
+
+def test_anagrams_do_not_share_a_hash():
+    """
+    Test that anagrams, which collided with the sum of ord hash, differ.
+    """
+    assert fnv1a_hash("hi") != fnv1a_hash("ih")
+    assert fnv1a_hash("title") != fnv1a_hash("tilte")
+
+
+def test_non_string_keys():
+    """
+    Test that any hashable key can be stored.
+    """
+    hashmap = HashMap(10)
+    hashmap.add_key_value(42, "int")
+    hashmap.add_key_value((1, 2), "tuple")
+    assert hashmap.get_value(42) == "int"
+    assert hashmap.get_value((1, 2)) == "tuple"
+    assert fnv1a_hash(1) == fnv1a_hash(1.0)
+
+
+def test_custom_hash_fn():
+    """
+    Test that the hash function can be plugged in.
+    """
+    hashmap = HashMap(4, hash_fn=lambda key: 0)
+    hashmap.add_key_value("hello", "world")
+    hashmap.add_key_value("hi", "there")
+    assert hashmap.hash_key("anything") == 0
+    assert hashmap.get_value("hi") == "there"
+    assert hashmap.stats()["collisions"] == 1
+
+
+def test_stats():
+    """
+    Test the distribution report of the hash_table.
+    """
+    hashmap = HashMap(8, hash_fn=lambda key: len(key))
+    assert hashmap.stats() == {
+        "buckets": 8,
+        "entries": 0,
+        "occupied_buckets": 0,
+        "occupancy": 0.0,
+        "load_factor": 0.0,
+        "max_chain_length": 0,
+        "mean_chain_length": 0.0,
+        "collisions": 0,
+    }
+
+    hashmap.add_key_value("a", 1)
+    hashmap.add_key_value("b", 2)
+    hashmap.add_key_value("cc", 3)
+    stats = hashmap.stats()
+    assert stats["entries"] == 3
+    assert stats["occupied_buckets"] == 2
+    assert stats["max_chain_length"] == 2
+    assert stats["mean_chain_length"] == 1.5
+    assert stats["collisions"] == 1
+
+
+def test_get_missing_key_in_single_node_bucket():
+    """
+    Test that a lookup compares keys even when the bucket has one node.
+    """
+    hashmap = HashMap(4, hash_fn=lambda key: 0)
+    hashmap.add_key_value("hello", "world")
+    assert hashmap.get_value("unknown") is None
+
+
+def test_update_heavy_traffic_does_not_grow_chains():
+    """
+    Test that updating the same keys keeps one node per key.
+    """
+    hashmap = HashMap(8)
+    for _ in range(100):
+        for i in range(4):
+            hashmap.add_key_value(f"key{i}", i)
+    assert hashmap.count == 4
+    assert hashmap.stats()["max_chain_length"] <= 4
+
+
+def test_remove():
+    """
+    Test for remove with existing and non existing keys.
+    """
+    hashmap = HashMap(4, hash_fn=lambda key: 0)
+    hashmap.add_key_value("a", 1)
+    hashmap.add_key_value("b", 2)
+    hashmap.add_key_value("c", 3)
+
+    assert hashmap.remove("b") == 2
+    assert hashmap.remove("b") is None
+    assert hashmap.get_value("a") == 1
+    assert hashmap.get_value("c") == 3
+
+    assert hashmap.remove("a") == 1
+    assert hashmap.hash_table[0].data.key == "c"
+    assert len(hashmap) == 1
+
+
+def test_remove_shrinks_the_table():
+    """
+    Test that the table halves under the minimum load factor,
+    but never below its initial size.
+    """
+    hashmap = HashMap(4, min_load_factor=0.25)
+    for i in range(100):
+        hashmap.add_key_value(i, i)
+    assert len(hashmap.hash_table) == 256
+
+    for i in range(90):
+        hashmap.remove(i)
+    assert len(hashmap.hash_table) < 256
+    for i in range(90, 100):
+        assert hashmap.get_value(i) == i
+
+    for i in range(90, 100):
+        hashmap.remove(i)
+    assert len(hashmap.hash_table) == 4
+
+
+def test_mapping_protocol():
+    """
+    Test len, in, iteration and item access.
+    """
+    hashmap = HashMap()
+    hashmap["title"] = "Ma go"
+    hashmap["body"] = None
+    hashmap["title"] = "New title"
+
+    assert len(hashmap) == 2
+    assert "body" in hashmap
+    assert "date" not in hashmap
+    assert hashmap["title"] == "New title"
+    assert sorted(hashmap) == ["body", "title"]
+    assert dict(hashmap.items()) == {"title": "New title", "body": None}
+
+    with pytest.raises(KeyError):
+        hashmap["date"]
+
+    del hashmap["body"]
+    assert "body" not in hashmap
+    with pytest.raises(KeyError):
+        del hashmap["body"]
+
+
+def test_from_items_presizes_the_table():
+    """
+    Test that from_items sizes the table once for the expected entries.
+    """
+    pairs = [(f"key{i}", i) for i in range(100)]
+    hashmap = HashMap.from_items(pairs)
+    assert len(hashmap) == 100
+    assert len(hashmap.hash_table) == 134
+    for i in range(100):
+        assert hashmap.get_value(f"key{i}") == i
+
+    hashmap = HashMap.from_items({"title": "Ma go", "body": "A post."})
+    assert hashmap["title"] == "Ma go"
+    assert hashmap["body"] == "A post."
+
+
+def test_from_items_with_generator_and_expected_size():
+    """
+    Test that from_items uses expected_size when items has no length.
+    """
+    hashmap = HashMap.from_items(((i, i) for i in range(10)), expected_size=10)
+    assert len(hashmap.hash_table) == 14
+    assert len(hashmap) == 10
+
+    # an underestimated size still grows the table
+    hashmap = HashMap.from_items(((i, i) for i in range(100)), expected_size=1)
+    assert len(hashmap) == 100
+    assert hashmap.count <= hashmap.load_factor * len(hashmap.hash_table)
+    for i in range(100):
+        assert hashmap[i] == i
+
+
+def test_update():
+    """
+    Test that update adds new keys and replaces existing ones.
+    """
+    hashmap = HashMap(2)
+    hashmap.add_key_value("same", "first")
+    hashmap.update([("same", "second"), ("other", 1), ("other", 2)])
+    assert len(hashmap) == 2
+    assert hashmap["same"] == "second"
+    assert hashmap["other"] == 2
+    assert hashmap.count <= hashmap.load_factor * len(hashmap.hash_table)
+
+
+def test_reserve():
+    """
+    Test that reserve grows the table once, and never shrinks it.
+    """
+    hashmap = HashMap(4)
+    hashmap.add_key_value("hello", "world")
+    hashmap.reserve(100)
+    assert len(hashmap.hash_table) == 256
+    hashmap.reserve(1)
+    assert len(hashmap.hash_table) == 256
+    assert hashmap["hello"] == "world"
@@ -0,0 +1,161 @@
+"""
+Test file.
+"""
+
+import heapq
+import os
+import random
+import sys
+
+import pytest
+
+# Add the parent directory of dsa to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+# Now we can import directly from the dsa directory
+from dsa.heap import BinaryHeap, nlargest
+
+
+def test_heap_initial_state():
+    """
+    Test for initial state of a BinaryHeap.
+    """
+    heap = BinaryHeap()
+    assert len(heap) == 0
+    assert heap.peek() is None
+    assert heap.pop() is None
+
+
+def test_heap_push_and_pop():
+    """
+    Test pushing items then popping them in order.
+    """
+    heap = BinaryHeap()
+    for item in [5, 3, 8, 1, 4]:
+        heap.push(item)
+    assert len(heap) == 5
+    assert heap.peek() == 1
+    assert [heap.pop() for _ in range(5)] == [1, 3, 4, 5, 8]
+    assert heap.pop() is None
+
+
+def test_max_heap():
+    """
+    Test a max heap pops the greatest item first.
+    """
+    heap = BinaryHeap(max_heap=True)
+    for item in [5, 3, 8, 1, 4]:
+        heap.push(item)
+    assert [heap.pop() for _ in range(5)] == [8, 5, 4, 3, 1]
+
+
+def test_heap_key_and_priority():
+    """
+    Test the priority computed by `key` or given on push.
+    """
+    heap = BinaryHeap(key=len)
+    heap.push("ccc")
+    heap.push("a")
+    heap.push("bb")
+    heap.push("zzzz", priority=0)
+    assert [heap.pop() for _ in range(4)] == ["zzzz", "a", "bb", "ccc"]
+
+
+def test_heap_equal_priorities():
+    """
+    Test items of equal priority are popped first in, first out.
+    """
+    heap = BinaryHeap(key=lambda item: item[0])
+    for item in [(1, "a"), (0, "b"), (1, "c"), (0, "d")]:
+        heap.push(item)
+    assert [heap.pop()[1] for _ in range(4)] == ["b", "d", "a", "c"]
+
+
+def test_heap_pushpop():
+    """
+    Test pushing an item then popping the top.
+    """
+    heap = BinaryHeap()
+    assert heap.pushpop(3) == 3
+    assert len(heap) == 0
+
+    heap.push(2)
+    heap.push(5)
+    assert heap.pushpop(1) == 1
+    assert heap.pushpop(4) == 2
+    assert [heap.pop() for _ in range(2)] == [4, 5]
+
+
+def test_heap_decrease_key():
+    """
+    Test moving an item closer to the top.
+    """
+    heap = BinaryHeap()
+    heap.push("a", 5)
+    entry = heap.push("b", 9)
+    heap.push("c", 7)
+
+    heap.decrease_key(entry, 1)
+    assert heap.peek() == "b"
+    assert [heap.pop() for _ in range(3)] == ["b", "a", "c"]
+
+    # the entry is no more in the heap
+    with pytest.raises(ValueError):
+        heap.decrease_key(entry, 0)
+
+
+def test_heap_decrease_key_away_from_top():
+    """
+    Test a priority moving the item away from the top is refused.
+    """
+    heap = BinaryHeap()
+    entry = heap.push("a", 5)
+    with pytest.raises(ValueError):
+        heap.decrease_key(entry, 6)
+
+    heap = BinaryHeap(max_heap=True)
+    entry = heap.push("a", 5)
+    with pytest.raises(ValueError):
+        heap.decrease_key(entry, 4)
+    heap.decrease_key(entry, 6)
+    assert heap.peek() == "a"
+
+
+def test_heap_random_operations():
+    """
+    Test random pushes and pops against heapq.
+    """
+    rng = random.Random(0)
+    heap = BinaryHeap()
+    expected = []
+    for _ in range(2000):
+        if expected and rng.random() < 0.4:
+            assert heap.pop() == heapq.heappop(expected)
+        else:
+            item = rng.randint(0, 100)
+            heap.push(item)
+            heapq.heappush(expected, item)
+        assert len(heap) == len(expected)
+    assert [heap.pop() for _ in range(len(heap))] == sorted(expected)
+
+
+def test_nlargest():
+    """
+    Test the k largest items, largest first.
+    """
+    rng = random.Random(1)
+    items = [rng.randint(0, 50) for _ in range(500)]
+    assert nlargest(10, items) == sorted(items, reverse=True)[:10]
+    assert nlargest(1000, items) == sorted(items, reverse=True)
+    assert nlargest(0, items) == []
+    assert nlargest(3, []) == []
+
+
+def test_nlargest_key_is_stable():
+    """
+    Test items of equal key keep their order in the iterable.
+    """
+    words = ["bb", "a", "cc", "ddd", "e", "ff"]
+    assert nlargest(4, words, key=len) == ["ddd", "bb", "cc", "ff"]
+    # consumed lazily, from a generator
+    assert nlargest(2, (word for word in words), key=len) == ["ddd", "bb"]
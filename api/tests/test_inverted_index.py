@@ -0,0 +1,91 @@
+"""
+Test file.
+"""
+
+import os
+import sys
+
+# Add the parent directory of dsa to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+# Now we can import directly from the dsa directory
+from dsa.inverted_index import (
+    InvertedIndex,
+    gallop,
+    intersect,
+    intersect_all,
+    tokenize,
+)
+
+
+def test_tokenize():
+    """
+    Test that a text is split into lowercase terms.
+    """
+    assert tokenize("Hello, World! It's 2024.") == ["hello", "world", "it", "s", "2024"]
+    assert tokenize("") == []
+    assert tokenize(None) == []
+
+
+def test_gallop():
+    """
+    Test the exponential search of the first item >= target.
+    """
+    postings = [1, 3, 5, 7, 9, 11, 13, 15, 17]
+
+    assert gallop(postings, 0) == 0
+    assert gallop(postings, 7) == 3
+    assert gallop(postings, 8) == 4
+    assert gallop(postings, 17, 5) == 8
+    assert gallop(postings, 18) == 9
+    assert gallop(postings, 1, 4) == 4
+
+
+def test_intersect():
+    """
+    Test the galloping intersection of sorted sequences.
+    """
+    assert intersect([2, 40, 70], list(range(0, 100, 2))) == [2, 40, 70]
+    assert intersect(list(range(100)), [5, 50, 500]) == [5, 50]
+    assert intersect([], [1, 2]) == []
+    assert intersect_all([[1, 2, 3, 4], [2, 4, 6], [4, 2, 0][::-1]]) == [2, 4]
+    assert intersect_all([]) == []
+
+
+def test_inverted_index_search():
+    """
+    Test AND queries over the indexed documents.
+    """
+    index = InvertedIndex()
+    index.add(1, "hello world")
+    index.add(2, "Hello there")
+    index.add(3, "the world")
+
+    assert index.search("hello") == [1, 2]
+    assert index.search("WORLD hello") == [1]
+    assert index.search("world missing") == []
+    assert index.search("!!!") == []
+    assert list(index.postings["world"]) == [1, 3]
+    assert len(index) == 3
+
+
+def test_inverted_index_update_and_remove():
+    """
+    Test replacing and removing documents, including out of order IDs.
+    """
+    index = InvertedIndex()
+    index.add(5, "apple banana")
+    index.add(2, "banana cherry")
+    index.add(9, "banana")
+
+    assert index.search("banana") == [2, 5, 9]
+
+    index.add(5, "cherry")
+    assert index.search("banana") == [2, 9]
+    assert index.search("cherry") == [2, 5]
+    assert "apple" not in index.postings
+
+    assert index.remove(2)
+    assert not index.remove(2)
+    assert index.search("cherry") == [5]
+    assert 2 not in index
@@ -9,7 +9,7 @@ import sys
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 # Now we can import directly from the dsa directory
-from dsa.linked_list import LinkedList, Node
+from dsa.linked_list import LinkedHashMap, LinkedList, Node
 
 
 def test_linked_list_initial_state():
@@ -192,3 +192,99 @@ def test_get_user_by_id():
         "phone": "+237697790053",
     }
     assert ll.get_user_by_id(7) == None
+
+
+def test_get_user_by_id_with_large_id():
+    """
+    Test for READ a user whose id is not a small cached int.
+    """
+    ll = LinkedList()
+    ll.add_to_tail({"id": 1000, "username": "large"})
+
+    assert ll.get_user_by_id("1000") == {"id": 1000, "username": "large"}
+
+
+def test_linked_hash_map_keeps_insertion_order():
+    """
+    Test that a Linked Hash Map keeps the order of the list.
+    """
+    lhm = LinkedHashMap()
+    lhm.add_to_tail({"id": 2})
+    lhm.add_to_tail({"id": 3})
+    lhm.add_to_head({"id": 1})
+
+    assert lhm.ll_to_list() == [{"id": 1}, {"id": 2}, {"id": 3}]
+    assert lhm.head.data == {"id": 1}
+    assert lhm.tail.data == {"id": 3}
+    assert len(lhm) == 3
+    assert 2 in lhm
+    assert 4 not in lhm
+
+
+def test_linked_hash_map_get():
+    """
+    Test for get and get_user_by_id on a Linked Hash Map.
+    """
+    lhm = LinkedHashMap()
+    for user_id in (1, 500, 1000):
+        lhm.add_to_tail({"id": user_id, "username": f"user{user_id}"})
+
+    assert lhm.get(500) == {"id": 500, "username": "user500"}
+    assert lhm.get_user_by_id("1000") == {"id": 1000, "username": "user1000"}
+    assert lhm.get(7) is None
+    assert lhm.get_user_by_id(7) is None
+
+
+def test_linked_hash_map_replaces_existing_key_in_place():
+    """
+    Test that adding an existing key replaces its data without moving it.
+    """
+    lhm = LinkedHashMap()
+    lhm.add_to_tail({"id": 1, "username": "a"})
+    lhm.add_to_tail({"id": 2, "username": "b"})
+    lhm.add_to_head({"id": 2, "username": "c"})
+
+    assert lhm.ll_to_list() == [{"id": 1, "username": "a"}, {"id": 2, "username": "c"}]
+    assert len(lhm) == 2
+
+
+def test_linked_hash_map_remove():
+    """
+    Test for remove on the head, the tail and a middle node.
+    """
+    lhm = LinkedHashMap(key=lambda data: data)
+    for data in "abcde":
+        lhm.add_to_tail(data)
+
+    assert lhm.remove("c") == "c"
+    assert lhm.remove("a") == "a"
+    assert lhm.remove("e") == "e"
+    assert lhm.remove("z") is None
+
+    assert lhm.ll_to_list() == ["b", "d"]
+    assert lhm.head.data == "b"
+    assert lhm.head.prev is None
+    assert lhm.tail.data == "d"
+    assert lhm.tail.prev.data == "b"
+
+    lhm.remove("b")
+    lhm.remove("d")
+    assert lhm.head is None
+    assert lhm.tail is None
+
+
+def test_linked_hash_map_move_to_front():
+    """
+    Test for move_to_front.
+    """
+    lhm = LinkedHashMap(key=lambda data: data)
+    for data in "abc":
+        lhm.add_to_tail(data)
+
+    assert lhm.move_to_front("c") is True
+    assert lhm.ll_to_list() == ["c", "a", "b"]
+    assert lhm.tail.data == "b"
+
+    assert lhm.move_to_front("c") is True
+    assert lhm.move_to_front("z") is False
+    assert lhm.ll_to_list() == ["c", "a", "b"]
@@ -0,0 +1,199 @@
+"""
+Tests for the schema migrations.
+"""
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.exc import IntegrityError
+
+from app import create_app
+from app.config import Config
+from app.migrations import MIGRATIONS, current_version, migrate
+from app.numerics import numeric_body
+
+# schema of the databases created before the indexes were added
+OLD_SCHEMA = [
+    "CREATE TABLE users (id INTEGER NOT NULL, username VARCHAR(50), "
+    "email VARCHAR(50), address VARCHAR(200), phone VARCHAR(50), PRIMARY KEY (id))",
+    "CREATE TABLE blogposts (id INTEGER NOT NULL, title VARCHAR(50), "
+    "body VARCHAR(500), date DATETIME, user_id INTEGER NOT NULL, PRIMARY KEY (id), "
+    "FOREIGN KEY(user_id) REFERENCES users (id))",
+]
+
+
+def _old_database(path, users):
+    """
+    Create a database file with the old schema and the given users.
+    """
+    engine = create_engine(f"sqlite:///{path}")
+    with engine.begin() as connection:
+        for statement in OLD_SCHEMA:
+            connection.execute(text(statement))
+        for user_id, username, email in users:
+            connection.execute(
+                text("INSERT INTO users (id, username, email) VALUES (:i, :u, :e)"),
+                {"i": user_id, "u": username, "e": email},
+            )
+        connection.execute(
+            text(
+                "INSERT INTO blogposts (id, title, body, date, user_id) "
+                "VALUES (1, 'Title', 'Body', '2024-01-01 00:00:00', 1)"
+            )
+        )
+    return engine
+
+
+def test_migrate_existing_database(tmp_path):
+    """
+    Test that the migrations add the indexes and keep the rows.
+    """
+    engine = _old_database(
+        tmp_path / "old.db", [(1, "ada", "ada@example.com"), (2, "bob", "bob@a.com")]
+    )
+    assert current_version(engine) == 0
+
+    applied = migrate(engine)
+
+    assert [version for version, _ in applied] == [m[0] for m in MIGRATIONS]
+    assert current_version(engine) == MIGRATIONS[-1][0]
+    indexes = {
+        index["name"]: index["unique"]
+        for table in ("users", "blogposts")
+        for index in inspect(engine).get_indexes(table)
+    }
+    assert indexes == {
+        "ix_users_username": 1,
+        "ix_users_email": 1,
+        "ix_blogposts_user_id": 0,
+        "ix_blogposts_date": 0,
+    }
+    columns = {column["name"] for column in inspect(engine).get_columns("blogposts")}
+    assert "numeric_body" in columns
+    assert "index_versions" in inspect(engine).get_table_names()
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT COUNT(*) FROM users")).scalar() == 2
+        assert connection.execute(text("SELECT COUNT(*) FROM blogposts")).scalar() == 1
+
+    # already up to date
+    assert migrate(engine) == []
+
+
+def test_migrate_with_duplicate_users(tmp_path):
+    """
+    Test that a unique index meeting duplicates is not recorded,
+    while the previous migrations stay applied.
+    """
+    engine = _old_database(
+        tmp_path / "old.db", [(1, "ada", "ada@example.com"), (2, "ada", "bob@a.com")]
+    )
+
+    with pytest.raises(IntegrityError):
+        migrate(engine)
+
+    assert current_version(engine) == 1
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT COUNT(*) FROM users")).scalar() == 2
+
+
+def test_migrate_db_command(tmp_path, monkeypatch):
+    """
+    Test the `flask migrate-db` command.
+    """
+    path = tmp_path / "old.db"
+    _old_database(path, [(1, "ada", "ada@example.com")]).dispose()
+    monkeypatch.setattr(Config, "SQLALCHEMY_DATABASE_URI", f"sqlite:///{path}")
+    runner = create_app().test_cli_runner()
+
+    result = runner.invoke(args=["migrate-db", "--dry-run"])
+    assert result.exit_code == 0
+    assert "pending: 1" in result.output
+
+    result = runner.invoke(args=["migrate-db"])
+    assert result.exit_code == 0
+    assert "applied: 2" in result.output
+
+    result = runner.invoke(args=["migrate-db"])
+    assert "The database is up to date." in result.output
+
+
+def test_indexes_on_a_database_not_migrated(tmp_path, monkeypatch):
+    """
+    Test that the indexes create the table of the versions they read
+    when the database was not migrated.
+    """
+    path = tmp_path / "old.db"
+    engine = _old_database(path, [(1, "ada", "ada@example.com")])
+    monkeypatch.setattr(Config, "SQLALCHEMY_DATABASE_URI", f"sqlite:///{path}")
+    client = create_app().test_client()
+
+    assert "index_versions" in inspect(engine).get_table_names()
+    assert client.get("/api/users/1").get_json()["username"] == "ada"
+    response = client.post(
+        "/api/users",
+        json={
+            "username": "grace",
+            "email": "grace@example.com",
+            "address": "Douala - Cameroun",
+            "phone": "+237600000000",
+        },
+    )
+    assert response.status_code == 201
+    found = client.get("/api/users/search?prefix=g").get_json()
+    assert [user["id"] for user in found] == [2]
+    engine.dispose()
+
+
+def test_migrate_database_with_numeric_body(tmp_path):
+    """
+    Test that adding the `numeric_body` column is skipped when the table
+    already has it, e.g. when it was created by `db.create_all()`.
+    """
+    engine = _old_database(tmp_path / "old.db", [(1, "ada", "ada@example.com")])
+    with engine.begin() as connection:
+        connection.execute(
+            text("ALTER TABLE blogposts ADD COLUMN numeric_body INTEGER")
+        )
+
+    migrate(engine)
+
+    assert current_version(engine) == MIGRATIONS[-1][0]
+
+
+def test_backfill_numeric_bodies_command(tmp_path, monkeypatch):
+    """
+    Test the `flask backfill-numeric-bodies` command.
+    """
+    path = tmp_path / "old.db"
+    engine = _old_database(path, [(1, "ada", "ada@example.com")])
+    migrate(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                "INSERT INTO blogposts (id, title, body, date, user_id) "
+                "VALUES (2, 'Title', 'Other body', '2024-01-01 00:00:00', 1)"
+            )
+        )
+    engine.dispose()
+    monkeypatch.setattr(Config, "SQLALCHEMY_DATABASE_URI", f"sqlite:///{path}")
+    monkeypatch.setattr(Config, "YIELD_PER", 1)
+    runner = create_app().test_cli_runner()
+
+    result = runner.invoke(args=["backfill-numeric-bodies"])
+    assert result.exit_code == 0
+    assert "2 blogposts updated." in result.output
+
+    engine = create_engine(f"sqlite:///{path}")
+    with engine.connect() as connection:
+        rows = connection.execute(
+            text("SELECT body, numeric_body FROM blogposts ORDER BY id")
+        ).all()
+    assert [value for _, value in rows] == [numeric_body(body) for body, _ in rows]
+
+    # nothing left to backfill, unless everything is recomputed
+    result = runner.invoke(args=["backfill-numeric-bodies"])
+    assert "0 blogposts updated." in result.output
+    result = runner.invoke(
+        args=["backfill-numeric-bodies", "--all", "--workers", "2", "--batch-size", "2"]
+    )
+    assert result.exit_code == 0
+    assert "2 blogposts updated." in result.output
@@ -0,0 +1,67 @@
+"""
+Tests for the numeric value of the blogposts bodies.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from app import numerics
+from app.numerics import compute_numeric_bodies, numeric_bodies, numeric_body
+
+BODIES = ["Hello world.", None, "", "Crème brûlée", "日本語 text", "a" * 1000, "é"]
+
+
+def _expected(bodies: list) -> list:
+    """
+    Numeric values of the bodies, summed character by character.
+    """
+    return [sum(ord(char) for char in body or "") for body in bodies]
+
+
+def test_numeric_body():
+    """
+    Test the sum of the code points of a body.
+    """
+    assert [numeric_body(body) for body in BODIES] == _expected(BODIES)
+
+
+def test_numeric_bodies_without_numpy(monkeypatch):
+    """
+    Test the pure Python sums of a chunk of bodies.
+    """
+    monkeypatch.setattr(numerics, "np", None)
+    assert numeric_bodies(BODIES) == _expected(BODIES)
+    assert numeric_bodies([]) == []
+
+
+def test_numeric_bodies_with_numpy():
+    """
+    Test the vectorized sums of a chunk of bodies,
+    ASCII only or not.
+    """
+    pytest.importorskip("numpy")
+    assert numeric_bodies(BODIES) == _expected(BODIES)
+    ascii_bodies = ["abc", "", None, "Hello world."]
+    assert numeric_bodies(ascii_bodies) == _expected(ascii_bodies)
+    assert numeric_bodies([None, ""]) == [0, 0]
+
+
+def test_compute_numeric_bodies_by_chunks():
+    """
+    Test that the chunks are summed in order.
+    """
+    bodies = BODIES * 10
+    assert compute_numeric_bodies(bodies, chunk_size=3) == _expected(bodies)
+    assert compute_numeric_bodies([]) == []
+
+
+def test_compute_numeric_bodies_in_parallel():
+    """
+    Test that the chunks summed by worker processes keep their order.
+    """
+    bodies = BODIES * 10
+    with ProcessPoolExecutor(2) as executor:
+        assert compute_numeric_bodies(bodies, executor, chunk_size=4) == _expected(
+            bodies
+        )
@@ -0,0 +1,148 @@
+"""
+Test file.
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add the parent directory of dsa to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from dsa.open_hashmap import OpenHashMap
+
+
+def test_size_rounded_to_power_of_two():
+    """
+    Test that the table size is a power of two.
+    """
+    hashmap = OpenHashMap(10)
+    assert hashmap.size == 16
+    assert len(hashmap.keys) == len(hashmap.values) == len(hashmap.hashes) == 16
+    assert 0 <= hashmap.hash_key("hello") < 16
+
+
+def test_add_and_get():
+    """
+    Test for add_key_value and get_value.
+    """
+    hashmap = OpenHashMap()
+    hashmap.add_key_value("hello", "world")
+    hashmap.add_key_value(42, "answer")
+    assert hashmap.get_value("hello") == "world"
+    assert hashmap.get_value(42) == "answer"
+    assert hashmap.get_value("unknown") is None
+
+
+def test_add_and_get_with_collision():
+    """
+    Test that colliding keys are probed linearly.
+    """
+    hashmap = OpenHashMap(4, hash_fn=lambda key: 0)
+    hashmap.add_key_value("hi", "there")
+    hashmap.add_key_value("ih", "aya")
+    assert hashmap.keys[0] == "hi"
+    assert hashmap.keys[1] == "ih"
+    assert hashmap.get_value("hi") == "there"
+    assert hashmap.get_value("ih") == "aya"
+
+
+def test_add_existing_key_replaces_value():
+    """
+    Test that adding an existing key replaces its value.
+    """
+    hashmap = OpenHashMap()
+    hashmap.add_key_value("same", "first")
+    hashmap.add_key_value("same", "second")
+    assert hashmap.get_value("same") == "second"
+    assert hashmap.count == 1
+
+
+def test_remove_leaves_a_tombstone():
+    """
+    Test that removing a key does not break the probing of the next ones.
+    """
+    hashmap = OpenHashMap(8, hash_fn=lambda key: 0)
+    hashmap.add_key_value("a", 1)
+    hashmap.add_key_value("b", 2)
+    assert hashmap.remove("a") == 1
+    assert hashmap.remove("a") is None
+    assert hashmap.get_value("a") is None
+    assert hashmap.get_value("b") == 2
+    assert hashmap.count == 1
+
+    # the tombstone slot is reused
+    hashmap.add_key_value("c", 3)
+    assert hashmap.keys[0] == "c"
+    assert hashmap.get_value("c") == 3
+
+
+def test_grow_and_clean_tombstones():
+    """
+    Test that every key is reachable after resizes and many removals.
+    """
+    hashmap = OpenHashMap(2)
+    for i in range(1000):
+        hashmap.add_key_value(f"key{i}", i)
+    assert hashmap.count == 1000
+    assert hashmap.used <= hashmap.load_factor * hashmap.size
+
+    for i in range(0, 1000, 2):
+        hashmap.remove(f"key{i}")
+    for i in range(1000, 2000, 2):
+        hashmap.add_key_value(f"key{i}", i)
+
+    assert hashmap.count == 1000
+    assert hashmap.used <= hashmap.load_factor * hashmap.size
+    for i in range(1000):
+        expected = i if i % 2 else None
+        assert hashmap.get_value(f"key{i}") == expected
+    for i in range(1000, 2000, 2):
+        assert hashmap.get_value(f"key{i}") == i
+
+
+def test_tombstones_cleaned_without_growing():
+    """
+    Test that a table full of tombstones is rebuilt at the same size.
+    """
+    hashmap = OpenHashMap(16)
+    for i in range(100):
+        hashmap.add_key_value(i, i)
+        hashmap.remove(i)
+    assert hashmap.size == 16
+    assert hashmap.count == 0
+
+
+def test_invalid_parameters():
+    """
+    Test that invalid size or load factor are rejected.
+    """
+    with pytest.raises(ValueError):
+        OpenHashMap(0)
+    with pytest.raises(ValueError):
+        OpenHashMap(8, load_factor=1)
+
+
+def test_mapping_protocol():
+    """
+    Test len, in, iteration and item access.
+    """
+    hashmap = OpenHashMap()
+    hashmap["title"] = "Ma go"
+    hashmap["body"] = None
+
+    assert len(hashmap) == 2
+    assert "body" in hashmap
+    assert "date" not in hashmap
+    assert hashmap["title"] == "Ma go"
+    assert sorted(hashmap) == ["body", "title"]
+    assert dict(hashmap.items()) == {"title": "Ma go", "body": None}
+
+    with pytest.raises(KeyError):
+        hashmap["date"]
+
+    del hashmap["body"]
+    assert "body" not in hashmap
+    with pytest.raises(KeyError):
+        del hashmap["body"]
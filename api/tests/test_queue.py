@@ -8,7 +8,12 @@ import sys
 # Add the parent directory of dsa to the Python path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from dsa.queue import Node, Queue
+import threading
+import time
+
+import pytest
+
+from dsa.queue import Node, Queue, RingBufferQueue
 
 
 def test_enqueue_single_element():
@@ -114,3 +119,130 @@ def test_tail_and_head_consistency():
     q.dequeue()
     assert q.head is None
     assert q.tail is None
+
+
+def test_ring_buffer_fifo_order():
+    """
+    Test that the ring buffer queue dequeues in FIFO order.
+    """
+    q = RingBufferQueue(capacity=4)
+    for i in range(3):
+        q.enqueue(i)
+
+    assert len(q) == 3
+    assert q.peek() == 0
+    assert [q.dequeue() for _ in range(3)] == [0, 1, 2]
+    assert q.dequeue() is None
+    assert q.peek() is None
+
+
+def test_ring_buffer_wraps_around():
+    """
+    Test that the elements wrap around the end of the buffer.
+    """
+    q = RingBufferQueue(capacity=4)
+    q.enqueue_many([1, 2, 3])
+    assert q.dequeue_many(2) == [1, 2]
+    q.enqueue_many([4, 5, 6])
+
+    assert len(q.buffer) == 4
+    assert q.buffer == [5, 6, 3, 4]
+    assert q.dequeue_many(10) == [3, 4, 5, 6]
+    assert q.buffer == [None, None, None, None]
+
+
+def test_ring_buffer_dequeue_many_without_elements():
+    """
+    Test that asking for no element, or a negative number of them,
+    returns an empty list and leaves the queue unchanged.
+    """
+    q = RingBufferQueue(capacity=4)
+    q.enqueue_many([1, 2, 3])
+
+    assert q.dequeue_many(0) == []
+    assert q.dequeue_many(-2) == []
+    assert len(q) == 3
+    assert q.dequeue_many(5) == [1, 2, 3]
+
+
+def test_ring_buffer_grows_by_doubling():
+    """
+    Test that a full buffer doubles its size and keeps the order.
+    """
+    q = RingBufferQueue(capacity=2)
+    q.enqueue_many(range(3))
+    q.dequeue()
+    q.enqueue_many(range(3, 10))
+
+    assert len(q.buffer) == 16
+    assert q.dequeue_many(len(q)) == list(range(1, 10))
+
+
+def test_ring_buffer_overflow_error():
+    """
+    Test that a full queue raises OverflowError and stays unchanged.
+    """
+    q = RingBufferQueue(maxsize=3)
+    q.enqueue_many([1, 2])
+    with pytest.raises(OverflowError):
+        q.enqueue_many([3, 4])
+    q.enqueue(3)
+    with pytest.raises(OverflowError):
+        q.enqueue(4)
+    assert q.dequeue_many(3) == [1, 2, 3]
+
+
+def test_ring_buffer_overflow_drop_oldest():
+    """
+    Test that the oldest elements make room for the new ones.
+    """
+    q = RingBufferQueue(maxsize=3, overflow="drop_oldest")
+    q.enqueue_many([1, 2, 3])
+    q.enqueue(4)
+    assert q.dequeue_many(3) == [2, 3, 4]
+
+    q.enqueue_many(range(10))
+    assert q.dequeue_many(3) == [7, 8, 9]
+
+
+def test_ring_buffer_overflow_drop_newest():
+    """
+    Test that the new elements are ignored when the queue is full.
+    """
+    q = RingBufferQueue(maxsize=3, overflow="drop_newest")
+    q.enqueue_many([1, 2])
+    q.enqueue_many([3, 4, 5])
+    q.enqueue(6)
+    assert q.dequeue_many(5) == [1, 2, 3]
+
+
+def test_ring_buffer_overflow_block():
+    """
+    Test that a producer waits for a consumer to make room.
+    """
+    q = RingBufferQueue(maxsize=2, overflow="block")
+    q.enqueue_many([1, 2])
+    with pytest.raises(OverflowError):
+        q.enqueue(3, timeout=0.01)
+
+    producer = threading.Thread(target=q.enqueue_many, args=([3, 4, 5],))
+    producer.start()
+    consumed = []
+    while len(consumed) < 5:
+        consumed += q.dequeue_many(2)
+        time.sleep(0.001)
+    producer.join(timeout=1)
+
+    assert consumed == [1, 2, 3, 4, 5]
+
+
+def test_ring_buffer_invalid_parameters():
+    """
+    Test that invalid parameters are rejected.
+    """
+    with pytest.raises(ValueError):
+        RingBufferQueue(capacity=0)
+    with pytest.raises(ValueError):
+        RingBufferQueue(maxsize=0)
+    with pytest.raises(ValueError):
+        RingBufferQueue(overflow="ignore")
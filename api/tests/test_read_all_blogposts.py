@@ -0,0 +1,89 @@
+"""
+Tests for read all blogposts route/endpoint.
+"""
+
+import json
+
+from app import create_app
+
+
+def test_read_all_blogposts():
+    """
+    Test `/api/blogposts` route
+    returns 200 OK and the blogposts in ascending order of ID.
+    """
+    app = create_app()
+    client = app.test_client()
+
+    response = client.get("/api/blogposts")
+
+    assert response.status_code == 200
+    posts = response.get_json()
+    assert isinstance(posts, list)
+    ids = [post["id"] for post in posts]
+    assert ids == sorted(ids)
+
+
+def test_read_blogposts_id_range():
+    """
+    Test `/api/blogposts?from_id=&to_id=` route
+    returns only the blogposts in the range (both included).
+    """
+    app = create_app()
+    client = app.test_client()
+
+    all_ids = [post["id"] for post in client.get("/api/blogposts").get_json()]
+    response = client.get("/api/blogposts?from_id=3&to_id=10")
+
+    assert response.status_code == 200
+    ids = [post["id"] for post in response.get_json()]
+    assert ids == [i for i in all_ids if 3 <= i <= 10]
+
+    response = client.get("/api/blogposts?from_id=10")
+    assert [post["id"] for post in response.get_json()] == [
+        i for i in all_ids if i >= 10
+    ]
+
+
+def test_read_blogposts_invalid_range():
+    """
+    Test `/api/blogposts?from_id=` route
+    returns 400 for non integer bounds.
+    """
+    app = create_app()
+    client = app.test_client()
+
+    response = client.get("/api/blogposts?from_id=abc")
+
+    assert response.status_code == 400
+    assert response.get_json() == {"message": "from_id and to_id must be integers"}
+
+
+def test_stream_all_blogposts():
+    """
+    Test `/api/blogposts?stream=ndjson` route
+    streams the blogposts of the range, one per line.
+    """
+    app = create_app()
+    client = app.test_client()
+
+    expected = client.get("/api/blogposts?from_id=2&to_id=5").get_json()
+    response = client.get("/api/blogposts?from_id=2&to_id=5&stream=ndjson")
+
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+    assert [json.loads(line) for line in response.data.decode().splitlines()] == (
+        expected
+    )
+
+
+def test_stream_with_unknown_format():
+    """
+    Test `/api/blogposts?stream=xml` route
+    returns 400 for an unknown streaming format.
+    """
+    app = create_app()
+    response = app.test_client().get("/api/blogposts?stream=xml")
+
+    assert response.status_code == 400
+    assert response.get_json() == {"message": "stream must be json or ndjson"}
@@ -0,0 +1,37 @@
+"""
+Tests for read blogpost route/endpoint.
+"""
+
+from app import create_app
+
+
+def test_read_blogpost():
+    """
+    Test `/api/blogposts/{id}` route
+    returns 200 OK and the blogpost info.
+    """
+    app = create_app()
+    client = app.test_client()
+
+    # ensure the id do exist in the database
+    response = client.get("/api/blogposts/2")
+
+    assert response.status_code == 200
+    assert response.get_json()["id"] == 2
+    assert response.get_json()["user_id"] == 3
+    assert set(response.get_json()) == {"id", "title", "body", "user_id"}
+
+
+def test_read_non_existing_blogpost():
+    """
+    Test `/api/blogposts/{id}` route
+    returns 404 for non existing blogpost.
+    """
+    app = create_app()
+    client = app.test_client()
+
+    # ensure the id does not exist in the database
+    response = client.get("/api/blogposts/9999")
+
+    assert response.status_code == 404
+    assert response.get_json() == {"message": "post not found"}
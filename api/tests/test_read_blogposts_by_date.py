@@ -0,0 +1,87 @@
+"""
+Tests for read blogposts by date route/endpoint.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from app import create_app
+
+
+def test_read_blogposts_by_date():
+    """
+    Test `/api/blogposts/by_date?since=&until=` route
+    returns 200 OK and the blogposts of the range in chronological order.
+    """
+    app = create_app()
+    client = app.test_client()
+
+    response = client.get("/api/blogposts/by_date?since=1990-01-01&until=2010-12-31")
+
+    assert response.status_code == 200
+    posts = response.get_json()
+    dates = [post["date"] for post in posts]
+    assert dates == sorted(dates)
+    assert all("1990-01-01" <= date <= "2010-12-31T23:59:59" for date in dates)
+    # ensure these ids do exist in the database with a date in the range
+    assert {6, 7, 11, 14, 16, 18}.issubset({post["id"] for post in posts})
+    assert not {2, 4}.intersection(post["id"] for post in posts)
+
+
+def test_read_latest_blogposts():
+    """
+    Test `/api/blogposts/by_date?latest=` route
+    returns the newest blogposts first.
+    """
+    app = create_app()
+    client = app.test_client()
+
+    all_posts = client.get("/api/blogposts/by_date").get_json()
+    response = client.get("/api/blogposts/by_date?latest=3")
+
+    assert response.status_code == 200
+    assert response.get_json() == all_posts[::-1][:3]
+
+
+def test_read_blogposts_by_aware_date():
+    """
+    Test `/api/blogposts/by_date` route
+    compares dates with a UTC offset with the stored local dates.
+    """
+    app = create_app()
+    client = app.test_client()
+
+    since = datetime(1990, 1, 1, tzinfo=timezone.utc)
+    until = datetime(2010, 12, 31, tzinfo=timezone(timedelta(hours=1)))
+    response = client.get(
+        "/api/blogposts/by_date",
+        query_string={"since": since.isoformat(), "until": until.isoformat()},
+    )
+
+    assert response.status_code == 200
+    local = {
+        "since": since.astimezone().replace(tzinfo=None).isoformat(),
+        "until": until.astimezone().replace(tzinfo=None).isoformat(),
+    }
+    assert response.get_json() == (
+        client.get("/api/blogposts/by_date", query_string=local).get_json()
+    )
+
+
+def test_read_blogposts_by_invalid_date():
+    """
+    Test `/api/blogposts/by_date` route
+    returns 400 for invalid parameters.
+    """
+    app = create_app()
+    client = app.test_client()
+
+    response = client.get("/api/blogposts/by_date?since=yesterday")
+    assert response.status_code == 400
+    assert response.get_json() == {"message": "since and until must be ISO dates"}
+
+    response = client.get("/api/blogposts/by_date?latest=-2")
+    assert response.status_code == 400
+
+    response = client.get("/api/blogposts/by_date?latest=0")
+    assert response.status_code == 400
+    assert response.get_json() == {"message": "latest must be a positive integer"}
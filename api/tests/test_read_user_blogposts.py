@@ -0,0 +1,84 @@
+"""
+Tests for read all blogposts of a user route/endpoint.
+"""
+
+from app import create_app
+
+
+def test_read_user_blogposts():
+    """
+    Test `/api/users/{id}/blogposts` route
+    returns 200 OK and only the blogposts of the user, by ascending ID.
+    """
+    app = create_app()
+    client = app.test_client()
+
+    # ensure the user do exist in the database, with several blogposts
+    response = client.get("/api/users/2/blogposts")
+
+    assert response.status_code == 200
+    posts = response.get_json()
+    assert len(posts) > 1
+    assert all(post["user_id"] == 2 for post in posts)
+    ids = [post["id"] for post in posts]
+    assert ids == sorted(ids)
+    assert set(posts[0]) == {"id", "title", "body", "date", "user_id"}
+    assert posts[0]["body"] == client.get(f"/api/blogposts/{ids[0]}").get_json()["body"]
+
+
+def test_read_user_blogposts_with_fields():
+    """
+    Test `/api/users/{id}/blogposts` route
+    returns only the columns listed in `fields`.
+    """
+    app = create_app()
+    response = app.test_client().get("/api/users/2/blogposts?fields=title,date")
+
+    assert response.status_code == 200
+    assert all(set(post) == {"title", "date"} for post in response.get_json())
+
+
+def test_read_user_blogposts_with_unknown_fields():
+    """
+    Test `/api/users/{id}/blogposts` route
+    returns 400 for a column that does not exist.
+    """
+    app = create_app()
+    response = app.test_client().get("/api/users/2/blogposts?fields=title,password")
+
+    assert response.status_code == 400
+    assert response.get_json() == {"message": "Unknown fields: password"}
+
+
+def test_read_user_blogposts_pagination():
+    """
+    Test `/api/users/{id}/blogposts` route
+    walks the blogposts of the user page by page, following `next_cursor`.
+    """
+    app = create_app()
+    client = app.test_client()
+
+    posts = client.get("/api/users/2/blogposts").get_json()
+    pages = []
+    response = client.get("/api/users/2/blogposts?limit=1").get_json()
+    pages.extend(response["blogposts"])
+    while response["next_cursor"] is not None:
+        cursor = response["next_cursor"]
+        response = client.get(
+            f"/api/users/2/blogposts?limit=1&after_id={cursor}"
+        ).get_json()
+        pages.extend(response["blogposts"])
+
+    assert pages == posts
+
+
+def test_read_blogposts_of_non_existing_user():
+    """
+    Test `/api/users/{id}/blogposts` route
+    returns 404 for a user that does not exist.
+    """
+    app = create_app()
+    client = app.test_client()
+
+    assert client.get("/api/users/9999/blogposts").status_code == 404
+    assert client.get("/api/users/abc/blogposts").status_code == 404
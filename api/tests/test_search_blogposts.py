@@ -0,0 +1,116 @@
+"""
+Tests for search blogposts route/endpoint.
+"""
+
+from app import create_app, db
+from app.config import Config
+from app.models.blogpost import BlogPost
+from dsa.inverted_index import tokenize
+
+
+def _expected_ids(client, query: str) -> list:
+    """
+    IDs of the blogposts containing every term of the query,
+    found by scanning every blogpost.
+    """
+    terms = set(tokenize(query))
+    return [
+        post["id"]
+        for post in client.get("/api/blogposts").get_json()
+        if terms <= set(tokenize(f"{post['title']} {post['body']}"))
+    ]
+
+
+def test_search_blogposts():
+    """
+    Test `/api/blogposts/search` route
+    returns the blogposts containing every term of the query.
+    """
+    app = create_app()
+    client = app.test_client()
+
+    # take two terms of an existing blogpost
+    post = client.get("/api/blogposts/2").get_json()
+    terms = tokenize(post["body"])
+    query = f"{terms[0].upper()} {terms[-1]}"
+    response = client.get(f"/api/blogposts/search?q={query}")
+
+    assert response.status_code == 200
+    ids = [post["id"] for post in response.get_json()]
+    assert 2 in ids
+    assert ids == _expected_ids(client, query)
+
+
+def test_search_blogposts_without_index(monkeypatch):
+    """
+    Test `/api/blogposts/search` route
+    returns the same blogposts with the index disabled.
+    """
+    query = "the"
+    expected = _expected_ids(create_app().test_client(), query)
+
+    monkeypatch.setattr(Config, "BLOGPOST_SEARCH_INDEX", False)
+    monkeypatch.setattr(Config, "BLOGPOST_INDEX", False)
+    client = create_app().test_client()
+    response = client.get(f"/api/blogposts/search?q={query}")
+
+    assert [post["id"] for post in response.get_json()] == expected
+
+
+def test_search_blogposts_pagination():
+    """
+    Test `/api/blogposts/search` route
+    walks the matches page by page, following `next_cursor`.
+    """
+    app = create_app()
+    client = app.test_client()
+
+    expected = _expected_ids(client, "a")
+    ids = []
+    response = client.get("/api/blogposts/search?q=a&limit=2").get_json()
+    ids.extend(post["id"] for post in response["blogposts"])
+    while response["next_cursor"] is not None:
+        cursor = response["next_cursor"]
+        response = client.get(
+            f"/api/blogposts/search?q=a&limit=2&after_id={cursor}"
+        ).get_json()
+        ids.extend(post["id"] for post in response["blogposts"])
+
+    assert ids == expected
+
+
+def test_search_blogposts_without_terms():
+    """
+    Test `/api/blogposts/search` route
+    returns 400 when the query has no term.
+    """
+    app = create_app()
+    client = app.test_client()
+
+    assert client.get("/api/blogposts/search").status_code == 400
+    assert client.get("/api/blogposts/search?q=...").status_code == 400
+
+
+def test_search_index_follows_committed_writes():
+    """
+    Test that created, updated and deleted blogposts reach the search index.
+    """
+    app = create_app()
+    index = app.extensions["blogpost_search_index"]
+
+    with app.app_context():
+        index.rebuild()
+
+        post = BlogPost(title="Xylophone", body="Quokka", user_id=2)
+        db.session.add(post)
+        db.session.commit()
+        assert index.search("xylophone quokka") == [post.id]
+
+        post.body = "Narwhal"
+        db.session.commit()
+        assert index.search("quokka") == []
+        assert index.search("narwhal") == [post.id]
+
+        db.session.delete(post)
+        db.session.commit()
+        assert index.search("xylophone") == []
@@ -0,0 +1,140 @@
+"""
+Tests for search users route/endpoint.
+"""
+
+from app import create_app, db
+from app.config import Config
+from app.models.user import User
+
+
+def test_search_users_by_prefix():
+    """
+    Test `/api/users/search` route
+    returns the users whose username or email starts with the prefix.
+    """
+    app = create_app()
+    client = app.test_client()
+
+    # ensure the user do exist in the database
+    user = client.get("/api/users/1").get_json()
+    prefix = user["username"][:3].upper()
+    response = client.get(f"/api/users/search?prefix={prefix}")
+
+    assert response.status_code == 200
+    users = response.get_json()
+    assert user in users
+    assert all(
+        u["username"].lower().startswith(prefix.lower())
+        or u["email"].lower().startswith(prefix.lower())
+        for u in users
+    )
+    assert len({u["id"] for u in users}) == len(users)
+
+
+def test_search_users_with_limit_and_without_index(monkeypatch):
+    """
+    Test `/api/users/search` route
+    returns the same users with the index disabled, up to the limit.
+    """
+    app = create_app()
+    expected = app.test_client().get("/api/users/search?prefix=j").get_json()
+
+    monkeypatch.setattr(Config, "USER_SEARCH_INDEX", False)
+    client = create_app().test_client()
+    response = client.get("/api/users/search?prefix=j")
+    assert response.get_json() == expected
+
+    response = client.get("/api/users/search?prefix=j&limit=1")
+    assert response.get_json() == expected[:1]
+
+
+def test_search_users_without_prefix():
+    """
+    Test `/api/users/search` route
+    returns 400 without prefix.
+    """
+    app = create_app()
+    response = app.test_client().get("/api/users/search")
+
+    assert response.status_code == 400
+    assert response.get_json() == {"message": "prefix is required"}
+
+
+def test_search_index_follows_committed_writes():
+    """
+    Test that created, updated and deleted users reach the search index.
+    """
+    app = create_app()
+    index = app.extensions["user_search_index"]
+
+    with app.app_context():
+        index.rebuild()
+
+        user = User(
+            username="Zebulon",
+            email="zeb@example.com",
+            address="Douala - Cameroun",
+            phone="+237600000000",
+        )
+        db.session.add(user)
+        db.session.commit()
+        assert [u["id"] for u in index.search("zeb")] == [user.id]
+
+        user.username = "Quentin"
+        db.session.commit()
+        assert [u["username"] for u in index.search("zeb")] == ["Quentin"]
+        assert [u["id"] for u in index.search("quen")] == [user.id]
+
+        db.session.delete(user)
+        db.session.commit()
+        assert index.search("quen") == []
+        assert index.search("zeb") == []
+
+
+def test_search_users_order_with_and_without_index(monkeypatch):
+    """
+    Test `/api/users/search` route
+    orders the users by the word matched, then by ID, with the index
+    enabled or disabled.
+    """
+    app = create_app()
+    client = app.test_client()
+    # (username, email) in ascending order of ID
+    names = [
+        ("Quokka_Zed", "quokka-z@example.com"),
+        ("Quokka Abe", "quokka.abe@example.com"),
+        ("Other", "quokka@example.com"),
+    ]
+    with app.app_context():
+        users = [
+            User(
+                username=username,
+                email=email,
+                address="Douala - Cameroun",
+                phone="+237600000000",
+            )
+            for username, email in names
+        ]
+        db.session.add_all(users)
+        db.session.commit()
+        ids = [user.id for user in users]
+
+    try:
+        # "quokka abe" < "quokka-z@example.com" < "quokka@example.com"
+        expected = [ids[1], ids[0], ids[2]]
+        found = client.get("/api/users/search?prefix=Quokka").get_json()
+        assert [u["id"] for u in found] == expected
+        found = client.get("/api/users/search?prefix=quokka&limit=2").get_json()
+        assert [u["id"] for u in found] == expected[:2]
+
+        monkeypatch.setattr(Config, "USER_SEARCH_INDEX", False)
+        client = create_app().test_client()
+        found = client.get("/api/users/search?prefix=Quokka").get_json()
+        assert [u["id"] for u in found] == expected
+        found = client.get("/api/users/search?prefix=quokka&limit=2").get_json()
+        assert [u["id"] for u in found] == expected[:2]
+    finally:
+        with app.app_context():
+            for user_id in ids:
+                db.session.delete(db.session.get(User, user_id))
+            db.session.commit()
@@ -0,0 +1,135 @@
+"""
+Test file.
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add the parent directory of dsa to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+# Now we can import directly from the dsa directory
+from dsa.skip_list import SkipList
+
+
+def test_skip_list_initial_state():
+    """
+    Test for initial state of a Skip List.
+    """
+    sl = SkipList()
+    assert len(sl) == 0
+    assert list(sl) == []
+    assert sl.search(1) is None
+    assert sl.tail is None
+
+
+def test_skip_list_invalid_parameters():
+    """
+    Test that invalid parameters are rejected.
+    """
+    with pytest.raises(ValueError):
+        SkipList(max_level=0)
+    with pytest.raises(ValueError):
+        SkipList(p=1)
+
+
+def test_skip_list_insert_and_search():
+    """
+    Test that the data are kept ordered by ID, whatever the insertion order.
+    """
+    sl = SkipList(seed=1)
+    for user_id in [5, 1, 4, 2, 3]:
+        sl.insert({"id": user_id, "username": f"user{user_id}"})
+
+    assert [user["id"] for user in sl] == [1, 2, 3, 4, 5]
+    assert [user["id"] for user in reversed(sl)] == [5, 4, 3, 2, 1]
+    assert sl.search(4) == {"id": 4, "username": "user4"}
+    assert sl.search(6) is None
+    assert 3 in sl
+    assert 6 not in sl
+
+
+def test_skip_list_insert_existing_key():
+    """
+    Test that inserting an existing key replaces its data.
+    """
+    sl = SkipList(seed=1)
+    sl.insert({"id": 1, "username": "before"})
+    sl.insert({"id": 1, "username": "after"})
+
+    assert len(sl) == 1
+    assert sl.search(1)["username"] == "after"
+
+
+def test_skip_list_delete():
+    """
+    Test deleting keys, including the first and the last ones.
+    """
+    sl = SkipList(seed=1)
+    for value in range(10):
+        sl.insert(value)
+
+    assert sl.delete(0) == 0
+    assert sl.delete(9) == 9
+    assert sl.delete(5) == 5
+    assert sl.delete(42) is None
+    assert list(sl) == [1, 2, 3, 4, 6, 7, 8]
+    assert list(reversed(sl)) == [8, 7, 6, 4, 3, 2, 1]
+    assert len(sl) == 7
+
+
+def test_skip_list_positional_access():
+    """
+    Test indexing by position and rank of the keys.
+    """
+    sl = SkipList(seed=1)
+    for value in range(0, 200, 2):
+        sl.insert(value)
+
+    assert sl[0] == 0
+    assert sl[10] == 20
+    assert sl[-1] == 198
+    assert sl.rank(20) == 10
+    assert sl.rank(21) == 11
+    with pytest.raises(IndexError):
+        sl[100]
+
+
+def test_skip_list_iteration_from_a_key():
+    """
+    Test forward and reverse iteration from any key.
+    """
+    sl = SkipList(seed=1)
+    for value in [10, 20, 30, 40]:
+        sl.insert(value)
+
+    assert list(sl.iter_from(20)) == [20, 30, 40]
+    assert list(sl.iter_from(25)) == [30, 40]
+    assert list(sl.iter_from(25, reverse=True)) == [20, 10]
+    assert list(sl.iter_from(30, reverse=True)) == [30, 20, 10]
+    assert list(sl.iter_from(5, reverse=True)) == []
+    assert list(sl.iter_from_position(1)) == [20, 30, 40]
+    assert list(sl.iter_from_position(1, reverse=True)) == [30, 20, 10]
+    assert list(sl.iter_from_position(4)) == []
+
+
+def test_skip_list_matches_sorted_list():
+    """
+    Test random inserts and deletes against a sorted list.
+    """
+    sl = SkipList(seed=7)
+    expected = set()
+    for i in range(500):
+        value = (i * 37) % 101
+        if i % 3 == 2:
+            assert (sl.delete(value) is not None) == (value in expected)
+            expected.discard(value)
+        else:
+            sl.insert(value)
+            expected.add(value)
+
+    values = sorted(expected)
+    assert list(sl) == values
+    assert [sl[i] for i in range(len(sl))] == values
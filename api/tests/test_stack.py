@@ -8,7 +8,7 @@ import sys
 # Add the parent directory of dsa to the Python path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from dsa.stack import Node, Stack
+from dsa.stack import ArrayStack, Node, Stack
 
 
 def test_push_single_element():
@@ -99,3 +99,34 @@ def test_pop_on_empty_stack():
     """
     s = Stack()
     assert s.pop() is None
+
+
+def test_array_stack_push_and_pop():
+    """
+    Test pushing and popping elements of an array stack (LIFO).
+    """
+    s = ArrayStack()
+    s.push(10)
+    s.push(20)
+
+    assert len(s) == 2
+    assert s.peek() == 20
+    assert s.pop() == 20
+    assert s.pop() == 10
+    assert s.pop() is None
+    assert s.peek() is None
+
+
+def test_array_stack_push_many_and_pop_many():
+    """
+    Test the batch operations of an array stack.
+    """
+    s = ArrayStack()
+    s.push_many(range(1, 6))
+
+    assert s.peek() == 5
+    assert s.pop_many(2) == [5, 4]
+    assert s.pop_many(0) == []
+    assert s.pop_many(10) == [3, 2, 1]
+    assert len(s) == 0
+    assert s.pop_many(1) == []
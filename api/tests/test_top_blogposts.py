@@ -0,0 +1,59 @@
+"""
+Tests for top blogposts route/endpoint.
+"""
+
+from app import create_app, db
+from app.models.blogpost import BlogPost
+
+
+def test_top_blogposts_by_date():
+    """
+    Test `/api/blogposts/top` route
+    returns the latest blogposts, latest first.
+    """
+    app = create_app()
+    client = app.test_client()
+    with app.app_context():
+        dates = db.session.scalars(
+            db.select(BlogPost.date)
+            .where(BlogPost.date.isnot(None))
+            .order_by(BlogPost.date.desc())
+            .limit(5)
+        ).all()
+
+    response = client.get("/api/blogposts/top?k=5")
+
+    assert response.status_code == 200
+    top = response.get_json()
+    assert [post["date"] for post in top] == [date.isoformat() for date in dates]
+    assert set(top[0]) == {"id", "title", "body", "date", "user_id"}
+
+
+def test_top_blogposts_by_length():
+    """
+    Test `/api/blogposts/top` route
+    returns the longest blogposts, longest first.
+    """
+    client = create_app().test_client()
+    posts = client.get("/api/blogposts").get_json()
+    expected = sorted(posts, key=lambda post: len(post["body"] or ""), reverse=True)
+
+    response = client.get("/api/blogposts/top?k=3&by=length")
+
+    assert response.status_code == 200
+    # ties are ranked by ascending ID, as sorted() keeps the order of the list
+    assert [post["id"] for post in response.get_json()] == [
+        post["id"] for post in expected[:3]
+    ]
+
+
+def test_top_blogposts_invalid_parameters():
+    """
+    Test `/api/blogposts/top` route
+    refuses an invalid k or ranking.
+    """
+    client = create_app().test_client()
+    for query in ["k=0", "k=-1", "k=abc", "k=100000", "by=title"]:
+        response = client.get(f"/api/blogposts/top?{query}")
+        assert response.status_code == 400
+        assert "message" in response.get_json()
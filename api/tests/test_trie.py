@@ -0,0 +1,91 @@
+"""
+Test file.
+"""
+
+import os
+import sys
+
+# Add the parent directory of dsa to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+# Now we can import directly from the dsa directory
+from dsa.trie import Trie
+
+
+def test_trie_initial_state():
+    """
+    Test for initial state of a Trie.
+    """
+    trie = Trie()
+    assert len(trie) == 0
+    assert trie.root.children is None
+    assert list(trie.starts_with("")) == []
+
+
+def test_trie_insert_and_search():
+    """
+    Test inserting words and searching them.
+    """
+    trie = Trie()
+    trie.insert("tea", 1)
+    trie.insert("ten", 2)
+    trie.insert("to", 3)
+    trie.insert("ten", 4)
+
+    assert len(trie) == 3
+    assert trie.search("ten") == 4
+    assert trie.search("te") is None
+    assert "to" in trie
+    assert "t" not in trie
+    assert list(trie) == ["tea", "ten", "to"]
+
+
+def test_trie_starts_with():
+    """
+    Test that the words of a prefix come in lexicographic order, up to a limit.
+    """
+    trie = Trie()
+    for i, word in enumerate(["banana", "band", "ban", "bandana", "apple", "bank"]):
+        trie.insert(word, i)
+
+    assert [word for word, _ in trie.starts_with("ban")] == [
+        "ban",
+        "banana",
+        "band",
+        "bandana",
+        "bank",
+    ]
+    assert list(trie.starts_with("band", limit=1)) == [("band", 1)]
+    assert list(trie.starts_with("bana", limit=0)) == []
+    assert list(trie.starts_with("c")) == []
+
+
+def test_trie_starts_with_is_lazy():
+    """
+    Test that the matches are generated one by one.
+    """
+    trie = Trie()
+    for i in range(1000):
+        trie.insert(f"user{i:04d}", i)
+
+    matches = trie.starts_with("user")
+    assert next(matches) == ("user0000", 0)
+    assert next(matches) == ("user0001", 1)
+
+
+def test_trie_remove_prunes_nodes():
+    """
+    Test removing words, and that the useless nodes are pruned.
+    """
+    trie = Trie()
+    trie.insert("tea", 1)
+    trie.insert("team", 2)
+
+    assert trie.remove("te") is None
+    assert trie.remove("team") == 2
+    assert trie.search("tea") == 1
+    assert trie._find_node("tea").children is None
+    assert trie.remove("tea") == 1
+    assert trie.remove("tea") is None
+    assert len(trie) == 0
+    assert trie.root.children is None
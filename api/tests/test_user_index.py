@@ -0,0 +1,245 @@
+"""
+Tests for the per-worker users index.
+"""
+
+import pytest
+
+from app import create_app, db
+from app.config import Config
+from app.models.user import User
+
+
+def test_index_is_built_on_first_use():
+    """
+    Test that the index is built lazily, then serves the lookups.
+    """
+    app = create_app()
+    index = app.extensions["user_index"]
+    assert index.users is None
+
+    response = app.test_client().get("/api/users/1")
+
+    assert response.status_code == 200
+    assert index.users is not None
+    assert index.get_user_by_id("1") == response.get_json()
+
+
+def test_index_follows_committed_writes():
+    """
+    Test that created, updated and deleted users reach the index.
+    """
+    app = create_app()
+    index = app.extensions["user_index"]
+    client = app.test_client()
+
+    with app.app_context():
+        index.rebuild()
+
+        user = User(
+            username="Indexed",
+            email="indexed@example.com",
+            address="Douala - Cameroun",
+            phone="+237600000000",
+        )
+        db.session.add(user)
+        db.session.commit()
+        user_id = user.id
+        assert index.get_user_by_id(user_id)["username"] == "Indexed"
+        assert index.users.tail.data["id"] == user_id
+
+        response = client.put(f"/api/users/{user_id}", json={"username": "Updated"})
+        assert response.status_code == 200
+        assert index.get_user_by_id(user_id)["username"] == "Updated"
+        assert index.check_consistency()["consistent"]
+
+        response = client.delete(f"/api/users/{user_id}")
+        assert response.status_code == 204
+        assert index.get_user_by_id(user_id) is None
+        assert index.check_consistency()["consistent"]
+
+
+def test_read_user_with_invalid_id():
+    """
+    Test `/api/users/{id}` route
+    returns 404 for an id that is not a number.
+    """
+    app = create_app()
+    response = app.test_client().get("/api/users/abc")
+
+    assert response.status_code == 404
+    assert response.get_json() == {"message": "User not found"}
+
+
+def test_index_can_be_disabled(monkeypatch):
+    """
+    Test that read_user queries the database when the index is disabled.
+    """
+    monkeypatch.setattr(Config, "USER_INDEX", False)
+    app = create_app()
+
+    assert "user_index" not in app.extensions
+    response = app.test_client().get("/api/users/1")
+    assert response.status_code == 200
+    assert response.get_json()["id"] == 1
+    assert app.test_client().get("/api/users/9999").status_code == 404
+
+
+def test_check_user_index_command():
+    """
+    Test the `flask check-user-index` command.
+    """
+    app = create_app()
+    result = app.test_cli_runner().invoke(args=["check-user-index"])
+
+    assert result.exit_code == 0
+    assert "consistent with the database" in result.output
+
+
+def test_skip_list_index_follows_committed_writes(monkeypatch):
+    """
+    Test the Skip List backend of the index.
+    """
+    monkeypatch.setattr(Config, "USER_INDEX_BACKEND", "skip_list")
+    app = create_app()
+    index = app.extensions["user_index"]
+
+    with app.app_context():
+        index.rebuild()
+
+        user = User(
+            username="Skipped",
+            email="skipped@example.com",
+            address="Douala - Cameroun",
+            phone="+237600000000",
+        )
+        db.session.add(user)
+        db.session.commit()
+        user_id = user.id
+        assert index.get_user_by_id(str(user_id))["username"] == "Skipped"
+        assert index.page(0, 1, reverse=True)[0]["id"] == user_id
+
+        db.session.delete(user)
+        db.session.commit()
+        assert index.get_user_by_id(user_id) is None
+        assert index.check_consistency()["consistent"]
+
+
+def test_unknown_index_backend(monkeypatch):
+    """
+    Test that an unknown backend of the index is rejected.
+    """
+    monkeypatch.setattr(Config, "USER_INDEX_BACKEND", "btree")
+
+    with pytest.raises(ValueError):
+        create_app()
+
+
+def test_page_from_a_missing_cursor(monkeypatch):
+    """
+    Test that a page resumes after a cursor whose user does not exist.
+    """
+    for backend in ("linked_hash_map", "skip_list"):
+        monkeypatch.setattr(Config, "USER_INDEX_BACKEND", backend)
+        app = create_app()
+        index = app.extensions["user_index"]
+
+        with app.app_context():
+            users = index.page()
+            last_id = users[-1]["id"]
+
+            assert index.page(after_id=last_id + 5) == []
+            page = index.page(limit=2, reverse=True, before_id=last_id + 5)
+            assert page == users[::-1][:2]
+            page = index.page(after_id=users[0]["id"], before_id=users[3]["id"])
+            assert page == users[1:3]
+
+
+def test_page_with_a_cursor_and_an_offset(monkeypatch):
+    """
+    Test that both backends skip `offset` users after a cursor alike.
+    """
+    for backend in ("linked_hash_map", "skip_list"):
+        monkeypatch.setattr(Config, "USER_INDEX_BACKEND", backend)
+        app = create_app()
+        index = app.extensions["user_index"]
+
+        with app.app_context():
+            users = index.page()
+            ids = [user["id"] for user in users]
+
+            for position in range(len(users)):
+                cursor = ids[position]
+                assert index.page(2, after_id=cursor) == users[position + 3 :]
+                page = index.page(1, reverse=True, before_id=cursor)
+                assert page == users[: max(position - 1, 0)][::-1]
+
+
+def test_index_follows_writes_of_other_processes(monkeypatch):
+    """
+    Test that the indexes of a worker see the users created by another
+    worker, through the version of the table.
+    """
+    # read the versions on each request
+    monkeypatch.setattr(Config, "INDEX_VERSION_TTL", 0)
+    writer = create_app()
+    reader = create_app()
+    client = reader.test_client()
+    # the indexes of the reader are built before the write
+    assert client.get("/api/users/1").status_code == 200
+    assert client.get("/api/users/search?prefix=elsewhere").get_json() == []
+
+    response = writer.test_client().post(
+        "/api/users",
+        json={
+            "username": "Elsewhere",
+            "email": "elsewhere@example.com",
+            "address": "Douala - Cameroun",
+            "phone": "+237600000000",
+        },
+    )
+    assert response.status_code == 201
+    with writer.app_context():
+        user_id = User.query.filter_by(username="Elsewhere").one().id
+
+    response = client.get(f"/api/users/{user_id}")
+    assert response.status_code == 200
+    assert response.get_json()["username"] == "Elsewhere"
+    found = client.get("/api/users/search?prefix=elsewhere").get_json()
+    assert [user["id"] for user in found] == [user_id]
+
+    assert writer.test_client().delete(f"/api/users/{user_id}").status_code == 204
+    assert client.get(f"/api/users/{user_id}").status_code == 404
+
+
+def test_index_reads_the_versions_once_per_ttl(monkeypatch):
+    """
+    Test that the indexes of a worker read the versions of the tables at
+    most once every INDEX_VERSION_TTL seconds.
+    """
+    monkeypatch.setattr(Config, "INDEX_VERSION_TTL", 60)
+    writer = create_app()
+    reader = create_app()
+    index = reader.extensions["user_search_index"]
+    client = reader.test_client()
+    assert client.get("/api/users/search?prefix=later").get_json() == []
+
+    with writer.app_context():
+        user = User(
+            username="Later",
+            email="later@example.com",
+            address="Douala - Cameroun",
+            phone="+237600000000",
+        )
+        db.session.add(user)
+        db.session.commit()
+        user_id = user.id
+
+    # the version was read by the first search, the index is used as is
+    assert client.get("/api/users/search?prefix=later").get_json() == []
+
+    # once the TTL is over
+    index.checked_at -= 60
+    found = client.get("/api/users/search?prefix=later").get_json()
+    assert [user["id"] for user in found] == [user_id]
+
+    assert writer.test_client().delete(f"/api/users/{user_id}").status_code == 204